@@ -1,4 +1,5 @@
 import os
+import json
 import asyncio
 import aiohttp
 from typing import Optional, Dict, Any
@@ -33,7 +34,27 @@ class CrewCenterAPIManager:
             self._session = None 
             print("Crew Center API session closed.")
 
-    async def _request(self, method: str, endpoint: str, **kwargs) -> Any:
+    @staticmethod
+    def _http_error_response(status: int, body: str) -> Dict:
+        """Response dict for an HTTP error, keeping the API's own message when the body has one."""
+        message = f"Crew Center returned HTTP {status}"
+        try:
+            parsed = json.loads(body) if body else None
+        except ValueError:
+            parsed = None
+        if isinstance(parsed, dict) and (parsed.get('message') or parsed.get('result')):
+            message = str(parsed.get('message') or parsed.get('result'))
+        elif body and len(body) < 300:
+            message = f"{message}: {body.strip()}"
+        return {'status': status, 'http_status': status, 'result': None, 'message': message}
+
+    async def _request(self, method: str, endpoint: str, return_http_errors: bool = False, **kwargs) -> Any:
+        """
+        Returns the parsed JSON (or text) response, or None on any error. With
+        return_http_errors=True an HTTP 4xx/5xx comes back as
+        {'status': <code>, 'http_status': <code>, 'message': ...} instead, so
+        callers can tell a rejection from a connection failure (still None).
+        """
         session = await self._get_session()
         
         params = kwargs.pop('params', {})
@@ -41,6 +62,7 @@ class CrewCenterAPIManager:
         
         url = f"{self.base_url.rstrip('/')}/{endpoint.lstrip('/')}"
         data_payload = kwargs.get('data')
+        response_text = ''
         
         try:
             async with session.request(method, url, params=params, **kwargs) as response:
@@ -49,12 +71,13 @@ class CrewCenterAPIManager:
                 
                 if 'application/json' in response.headers.get('Content-Type', ''):
                     # We already read the text, so we parse it now
-                    import json
                     return json.loads(response_text)
                 return response_text
                 
         except aiohttp.ClientResponseError as e:
             print(f"[CC API] Request Error to {url}: {e.status}, message='{e.message}'")
+            if return_http_errors:
+                return self._http_error_response(e.status, response_text)
             return None
         except Exception as e:
             print(f"[CC API] Connection Error to {url}: {e}")
@@ -91,7 +114,9 @@ class CrewCenterAPIManager:
 
         Returns:
             Dict: The JSON response from the PHP API (e.g., {"status": 0, "result": null})
-            Where 0 means Successful.
+            Where 0 means Successful. An HTTP error is returned as
+            {"status": <code>, "http_status": <code>, "message": ...}; None means
+            the API could not be reached.
         """
         
         payload = {
@@ -108,7 +133,7 @@ class CrewCenterAPIManager:
         if multiplier:
             payload['multi'] = multiplier
         
-        return await self._request('POST', '/pireps', data=payload)
+        return await self._request('POST', '/pireps', return_http_errors=True, data=payload)
 
     async def fetch_all_aircraft(self) -> Dict[str, int]:
         """
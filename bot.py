@@ -15,6 +15,9 @@ from database.event_transaction_model import EventTransactionModel
 from database.flight_data import FlightData
 from database.shop_model import ShopModel
 from database.flight_board_model import FlightBoardModel
+from database.flight_log_model import FlightLogModel
+from database.pirep_feed_model import PirepFeedModel
+from database.pirep_submission_model import PirepSubmissionModel
 from database.mission_module import MissionDB
 from database.va_data_model import RankModel, AircraftModel, MultiplierModel
 from api.manager import InfiniteFlightAPIManager
@@ -27,10 +30,17 @@ except ImportError:
 from services.flight_generation_service import FlightService
 from services.pdf_service import PDFService
 from services.route_map_service import RouteMapService
+from services.route_map_warmer import RouteMapWarmer
 from services.checklist_pdf_service import ChecklistPDFService
+from services.pdf_render_service import PDFRenderService
 from services.simbrief_service import SimBriefService
 from services.flight_board_service import FlightBoardService
 from services.pirep_filing_service import PirepFilingService
+from services.flight_log_service import FlightLogService
+from services.pirep_feed_service import PirepFeedService
+from services.pirep_submission_queue import PirepSubmissionQueue
+from services.pilot_prefetcher import PilotContextPrefetcher
+from services.interaction_deadline import InteractionDeadlineManager
 
 load_dotenv()
 
@@ -53,6 +63,9 @@ class MyBot(commands.Bot):
         self.shop_model: ShopModel = None
         self.mission_db: MissionDB = None
         self.flight_board_model: FlightBoardModel = None
+        self.flight_log_model: FlightLogModel = None
+        self.pirep_feed_model: PirepFeedModel = None
+        self.pirep_submission_model: PirepSubmissionModel = None
         self.flightdata: FlightData = None
         # VA Data Models
         self.rank_model: RankModel = None
@@ -68,10 +81,17 @@ class MyBot(commands.Bot):
         self.flight_service: FlightService = None
         self.pdf_service: PDFService = None
         self.route_map_service: RouteMapService = None
+        self.route_map_warmer: RouteMapWarmer = None
         self.checklist_pdf_service: ChecklistPDFService = None
+        self.pdf_render_service: PDFRenderService = None
         self.simbrief_service: SimBriefService = None
         self.flight_board_service: FlightBoardService = None
         self.pirep_filing_service: PirepFilingService = None
+        self.flight_log_service: FlightLogService = None
+        self.pirep_feed_service: PirepFeedService = None
+        self.pirep_submission_queue: PirepSubmissionQueue = None
+        self.pilot_prefetcher: PilotContextPrefetcher = None
+        self.interaction_deadlines: InteractionDeadlineManager = None
 
     async def setup_hook(self):
         """
@@ -88,24 +108,36 @@ class MyBot(commands.Bot):
         self.shop_model = ShopModel(self.db_manager)
         self.mission_db = MissionDB(self.db_manager)
         self.flight_board_model = FlightBoardModel(self.db_manager)
+        self.flight_log_model = FlightLogModel(self.db_manager)
+        self.pirep_feed_model = PirepFeedModel(self.db_manager)
+        self.pirep_submission_model = PirepSubmissionModel(self.db_manager)
         
         # Initialize VA Data Models
-        self.rank_model = RankModel(self.db_manager)
         self.aircraft_model = AircraftModel(self.db_manager)
+        self.rank_model = RankModel(self.db_manager, self.aircraft_model)
         self.multiplier_model = MultiplierModel(self.db_manager)
         
         # --- Initialize Flight Data ---
-        self.flightdata = FlightData()
+        self.flightdata = FlightData(self.rank_model)
         
         # --- Initialize Services ---
         self.ai_service = AIService() if AIService else None
         self.flight_service = FlightService(self.flightdata)
         self.pdf_service = PDFService()
         self.route_map_service = RouteMapService()
+        self.route_map_warmer = RouteMapWarmer(self)
+        self.route_map_warmer.start()  # Waits for the bot to be ready, then pre-renders likely maps
         self.checklist_pdf_service = ChecklistPDFService()
+        self.pdf_render_service = PDFRenderService(self.pdf_service, self.checklist_pdf_service)
         self.simbrief_service = SimBriefService()
         self.flight_board_service = FlightBoardService(self)
         self.pirep_filing_service = PirepFilingService(self)
+        self.pilot_prefetcher = PilotContextPrefetcher(self)
+        self.interaction_deadlines = InteractionDeadlineManager()
+        self.flight_log_service = FlightLogService(self)
+        self.pirep_feed_service = PirepFeedService(self)
+        self.pirep_submission_queue = PirepSubmissionQueue(self)
+        self.pirep_submission_queue.start()  # Resumes any backlog left by the last run
         self.auto_pirep_service = None  # Lazy loaded in cog
         print("DatabaseManager, FlightData, and Services instances created.")
         
@@ -162,6 +194,7 @@ class MyBot(commands.Bot):
             await self.load_extension('cogs.flight_poll_system')
             await self.load_extension('cogs.ticket_system')
             await self.load_extension('cogs.pirep_validator')
+            await self.load_extension('cogs.flight_log_sync')
             await self.load_extension('cogs.message_cleaner')
            #  await self.load_extension('cogs.special_events')
           # await self.load_extension('cogs.gift_box')
@@ -225,6 +258,16 @@ class MyBot(commands.Bot):
         if self.cc_api_manager:
             await self.cc_api_manager.close()
 
+    async def close(self):
+        """Shuts down worker processes before closing the Discord connection."""
+        if self.route_map_warmer:
+            self.route_map_warmer.close()
+        if self.route_map_service:
+            self.route_map_service.close()
+        if self.pdf_render_service:
+            self.pdf_render_service.close()
+        await super().close()
+
 async def start_bot():
     """
     Function to create and run the bot.
@@ -18,6 +18,8 @@ from discord.ext import commands
 from datetime import datetime
 import logging
 
+from services.pirep_filing_service import FilingContext
+
 # Setup logging
 logger = logging.getLogger('oryxie.acars_cog')
 
@@ -102,6 +104,8 @@ class AcarsCog(commands.Cog):
     async def acars_command(self, interaction: discord.Interaction):
         """Main ACARS slash command - fetch flights and start PIREP filing."""
         logger.info(f"ACARS slash command triggered by user: {interaction.user.id} ({interaction.user.display_name})")
+        # Start the IF flights, rank and multiplier lookups while Discord acknowledges the command
+        self.bot.pilot_prefetcher.prefetch(interaction.user, include_flights=True, refresh=True)
         await interaction.response.send_message(f"{interaction.user.mention} 🔄 Fetching your recent flights from Infinite Flight...", ephemeral=False)
         await self.fetch_and_display_flights(interaction)
 
@@ -109,7 +113,7 @@ class AcarsCog(commands.Cog):
         """Fetch flights from IF API and display selection embed (for slash command usage)."""
         logger.info(f"Fetching IF flights for Discord user: {interaction.user.id}")
         # Call service to fetch flights
-        result = await self.bot.pirep_filing_service.fetch_if_flights(interaction.user.id)
+        result = await self.bot.pilot_prefetcher.if_flights(interaction.user.id)
         
         if not result['success']:
             logger.error(f"Failed to fetch flights: {result.get('error')}")
@@ -190,9 +194,13 @@ class FlightSelectionView(ui.View):
         await interaction.response.defer()
         
         logger.info(f"[ACARS V2] User {interaction.user.id} selected flight {flight_index + 1}: {flight.get('departure')} -> {flight.get('arrival')}")
+        # Warm the aircraft/route/rank lookups while the pilot reviews the raw data
+        filing_context = FilingContext(self.bot, self.pilot_data['id'], discord_id=interaction.user.id)
+        filing_context.warm(flight)
         flight_info = {
             'pilot_data': self.pilot_data,
-            'flight_data': flight
+            'flight_data': flight,
+            'filing_context': filing_context
         }
         embed = discord.Embed(
             title="🔍 Step 1: Verify Raw Flight Data",
@@ -392,6 +400,12 @@ class RawDataConfirmationView(ui.View):
         self.flight_info = flight_info
         self.original_user_id = original_user_id
 
+    async def on_timeout(self):
+        # Pilot never clicked Proceed: cancel the lookups warmed for them
+        filing_context = self.flight_info.pop('filing_context', None)
+        if filing_context:
+            filing_context.close()
+
     @ui.button(label="✅ Proceed", style=discord.ButtonStyle.success, custom_id="raw_proceed")
     async def proceed_btn(self, interaction: discord.Interaction, button: ui.Button):
         if interaction.user.id != self.original_user_id:
@@ -405,10 +419,17 @@ class RawDataConfirmationView(ui.View):
         logger.info(f"[ACARS V2] User {interaction.user.id} clicked Proceed. Auto-detecting flight type for {flight_data.get('departure')} -> {flight_data.get('arrival')}")
 
         # NEW: Call the waterfall logic service method
-        result = await self.bot.pirep_filing_service.auto_process_flight(
-            pilot_data['id'],
-            flight_data
-        )
+        # The warmed context is only good for this attempt; a retry after Edit builds its own
+        filing_context = self.flight_info.pop('filing_context', None)
+        try:
+            result = await self.bot.pirep_filing_service.auto_process_flight(
+                pilot_data['id'],
+                flight_data,
+                context=filing_context
+            )
+        finally:
+            if filing_context:
+                filing_context.close()
         
         logger.info(f"[ACARS V2] Auto-detection result: success={result.get('success')}, type={result.get('flight_type')}")
         
@@ -435,11 +456,8 @@ class RawDataConfirmationView(ui.View):
             await interaction.followup.send(content=f"<@{self.original_user_id}> ❌ **Route not found in the CC database.**\nPlease click **✏️ Edit** to correct your Departure or Arrival ICAO.", ephemeral=True)
             return
             
-        exact_aircraft = await self.bot.aircraft_model.get_aircraft_by_if_ids(
-            flight_data.get('aircraft_id', ''),
-            flight_data.get('livery_id', '')
-        )
-        is_invalid_aircraft = (exact_aircraft is None)
+        # The service already tried the exact IF aircraft + livery match
+        is_invalid_aircraft = result.get('is_invalid_aircraft', False)
         
         logger.info(f"[ACARS V2] Aircraft exact match: {not is_invalid_aircraft} (IF_ID: {flight_data.get('aircraft_id')})")
             
@@ -622,11 +640,18 @@ class FinalConfirmationView(ui.View):
         
         logger.info(f"[ACARS V2] PIREP Submission result: success={result.get('success')}")
         if result['success']:
-            embed = discord.Embed(
-                title="✅ PIREP Filed Successfully!", 
-                description="🎉 Your PIREP has been submitted to Crew Center!\n\nYour flight has been safely logged. Thanks for flying QRV! <:qatari:1094679033205227580>", 
-                color=discord.Color.green()
-            )
+            if result.get('queued'):
+                embed = discord.Embed(
+                    title="🕒 PIREP Queued",
+                    description=f"{result['response'].get('message')}\n\nThere is no need to file it again. Thanks for flying QRV! <:qatari:1094679033205227580>",
+                    color=discord.Color.gold()
+                )
+            else:
+                embed = discord.Embed(
+                    title="✅ PIREP Filed Successfully!", 
+                    description="🎉 Your PIREP has been submitted to Crew Center!\n\nYour flight has been safely logged. Thanks for flying QRV! <:qatari:1094679033205227580>", 
+                    color=discord.Color.green()
+                )
             embed.add_field(name="✈️ Flight Details", value=f"**{pirep_data.get('flight_num', 'N/A')}** | {pirep_data['departure']} → {pirep_data['arrival']}", inline=False)
             embed.add_field(name="⏱️ Duration", value=pirep_data['duration'], inline=True)
             embed.add_field(name="🎯 Multiplier", value=multiplier_label, inline=True)
@@ -34,7 +34,7 @@ class ChecklistCog(commands.Cog):
         
         try:
             # Access the PDF service through the bot instance and call the new function
-            pdf_file = self.bot.checklist_pdf_service.generate_checklist_pdf(aircraft.upper(), load, "checklist", direction)
+            pdf_file = await self.bot.pdf_render_service.generate_checklist_pdf(aircraft.upper(), load, "checklist", direction)
             await interaction.followup.send("Here is your flight checklist:", file=discord.File(pdf_file), ephemeral=False)
         except Exception as e:
             await interaction.followup.send(f"An error occurred: {e}", ephemeral=True)
@@ -97,7 +97,11 @@ class DatabaseAuditCog(commands.Cog):
         app_commands.Choice(name="OWD Route Lookup", value="owd_route_lookup"),
         app_commands.Choice(name="ROS Mission Progress", value="ros_mission_progress"),
         app_commands.Choice(name="Test AI-PDF Flow", value="test_ai_pdf_flow"),
-        app_commands.Choice(name="Sync Discord Status", value="sync_discord_status")
+        app_commands.Choice(name="Sync Discord Status", value="sync_discord_status"),
+        app_commands.Choice(name="Interaction Latency", value="interaction_latency"),
+        app_commands.Choice(name="PDF Rendering", value="pdf_rendering"),
+        app_commands.Choice(name="Reload Aircraft Catalog", value="reload_aircraft_catalog"),
+        app_commands.Choice(name="Reload Ranks", value="reload_ranks")
     ])
     @app_commands.checks.has_permissions(administrator=True)
     async def audit(self, interaction: discord.Interaction, action: str):
@@ -119,6 +123,14 @@ class DatabaseAuditCog(commands.Cog):
             await self._test_ai_pdf_flow(interaction)
         elif action == "sync_discord_status":
             await self._sync_discord_status(interaction)
+        elif action == "interaction_latency":
+            await self._interaction_latency(interaction)
+        elif action == "pdf_rendering":
+            await self._pdf_rendering(interaction)
+        elif action == "reload_aircraft_catalog":
+            await self._reload_aircraft_catalog(interaction)
+        elif action == "reload_ranks":
+            await self._reload_ranks(interaction)
 
     async def _check_ifc_usernames_validity(self, interaction: discord.Interaction):
         """Check all active pilots' IFC usernames by fetching user stats from API."""
@@ -788,7 +800,7 @@ class DatabaseAuditCog(commands.Cog):
             # 6. Call PDF Service
             print("[AUDIT-PDF-TEST] --- CALLING PDF SERVICE ---")
             pilot_info = {'rank': 'Test Rank', 'callsign': 'QRV999'}
-            pdf_output = self.bot.pdf_service.generate_flight_pdf(flight_data, flight_type, interaction.user, pilot_info)
+            pdf_output = await self.bot.pdf_render_service.generate_flight_pdf(flight_data, flight_type, interaction.user, pilot_info)
             print("[AUDIT-PDF-TEST] --- PDF SERVICE CALL COMPLETE ---")
 
             # 7. Report result
@@ -933,6 +945,58 @@ class DatabaseAuditCog(commands.Cog):
             print(f"[SYNC ERROR] Sync failed: {e}\n{error_trace}")
             await interaction.followup.send(f"❌ **Error during Discord status sync:** {str(e)}", ephemeral=False)
 
+    async def _interaction_latency(self, interaction: discord.Interaction):
+        """Shows how close guarded handlers get to Discord's 3s acknowledgement window."""
+        manager = getattr(self.bot, 'interaction_deadlines', None)
+        rows = manager.report() if manager else []
+        if not rows:
+            await interaction.response.send_message("No guarded interactions recorded since the last restart.", ephemeral=True)
+            return
+
+        report_msg = "**⏱️ INTERACTION ACK LATENCY** (since last restart)\n```\n"
+        report_msg += f"{'Handler':<24} {'Calls':>5} {'Avg':>6} {'Max':>6} {'Auto':>5} {'Late':>5}\n"
+        for row in rows:
+            report_msg += (
+                f"{row['name'][:24]:<24} {row['calls']:>5} {row['avg_ack']:>5.2f}s {row['max_ack']:>5.2f}s "
+                f"{row['auto_deferred']:>5} {row['missed']:>5}\n"
+            )
+        report_msg += "```\nAuto = deferred by the guard, Late = acknowledged after 3s."
+        await interaction.response.send_message(report_msg[:2000], ephemeral=True)
+
+    async def _pdf_rendering(self, interaction: discord.Interaction):
+        """Shows queue wait and render time of off-loop PDF generation."""
+        service = getattr(self.bot, 'pdf_render_service', None)
+        rows = service.report() if service else []
+        if not rows:
+            await interaction.response.send_message("No PDFs rendered since the last restart.", ephemeral=True)
+            return
+
+        report_msg = f"**📄 PDF RENDERING** (since last restart, {service.workers} workers, {service.pending} in progress)\n```\n"
+        report_msg += f"{'Kind':<10} {'OK':>4} {'Fail':>4} {'T/O':>4} {'Busy':>4} {'Wait':>6} {'Render':>7} {'Max':>6}\n"
+        for row in rows:
+            report_msg += (
+                f"{row['kind'][:10]:<10} {row['rendered']:>4} {row['failures']:>4} {row['timeouts']:>4} {row['rejected']:>4} "
+                f"{row['avg_wait']:>5.2f}s {row['avg_render']:>6.2f}s {row['max_total']:>5.2f}s\n"
+            )
+        report_msg += f"```\nT/O = over {service.timeout:.0f}s, Busy = rejected because the queue was full."
+        await interaction.response.send_message(report_msg[:2000], ephemeral=True)
+
+    async def _reload_aircraft_catalog(self, interaction: discord.Interaction):
+        """Reloads the in-memory aircraft catalog so fleet edits apply without waiting for the hourly refresh."""
+        await interaction.response.defer(ephemeral=True)
+        if await self.bot.aircraft_model.reload_catalog():
+            await interaction.followup.send("✅ Aircraft catalog reloaded from the database.", ephemeral=True)
+        else:
+            await interaction.followup.send("❌ Could not load the aircraft table; the previous catalog is still in use.", ephemeral=True)
+
+    async def _reload_ranks(self, interaction: discord.Interaction):
+        """Reloads the in-memory rank ladder so edits to the ranks table apply without waiting for the hourly refresh."""
+        await interaction.response.defer(ephemeral=True)
+        if await self.bot.rank_model.reload_ranks():
+            await interaction.followup.send("✅ Ranks reloaded from the database.", ephemeral=True)
+        else:
+            await interaction.followup.send("❌ Could not load the ranks table; the previous ranks are still in use.", ephemeral=True)
+
     async def cog_app_command_error(self, interaction: discord.Interaction, error: app_commands.AppCommandError):
         if isinstance(error, app_commands.MissingPermissions):
             await interaction.response.send_message("❌ **Permission Denied**\nYou must have the `Administrator` permission to use this command.", ephemeral=False)
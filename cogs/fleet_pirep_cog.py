@@ -122,7 +122,7 @@ class FleetPirepModal(discord.ui.Modal, title="Fleet Flight Details"):
             # Pilot 1 result
             p1_result = result.get('pilot1_result')
             if p1_result:
-                p1_status = "✅" if p1_result.get('success') else "❌"
+                p1_status = ("🕒" if p1_result.get('queued') else "✅") if p1_result.get('success') else "❌"
                 embed.add_field(
                     name=f"👤 Pilot 1",
                     value=f"{p1_status} {p1_result.get('pilot_name', 'Unknown')} - {p1_result.get('duration', 'N/A')} hours",
@@ -133,7 +133,7 @@ class FleetPirepModal(discord.ui.Modal, title="Fleet Flight Details"):
             if self.pilot2_id:
                 p2_result = result.get('pilot2_result')
                 if p2_result:
-                    p2_status = "✅" if p2_result.get('success') else "❌"
+                    p2_status = ("🕒" if p2_result.get('queued') else "✅") if p2_result.get('success') else "❌"
                     embed.add_field(
                         name=f"👤 Pilot 2",
                         value=f"{p2_status} {p2_result.get('pilot_name', 'Unknown')} - {p2_result.get('duration', 'N/A')} hours",
@@ -127,7 +127,7 @@ class ChecklistModal(discord.ui.Modal):
                 await interaction.followup.send(f"❌ Unable to determine flight direction. Got: {direction}", ephemeral=True)
                 return
             
-            pdf_file = interaction.client.checklist_pdf_service.generate_checklist_pdf(
+            pdf_file = await interaction.client.pdf_render_service.generate_checklist_pdf(
                 self.aircraft_icao.upper(), load_pct, "checklist", direction
             )
             
@@ -172,33 +172,27 @@ class StatusSelectView(discord.ui.View):
         # Build content with pilot mention
         content = f"Pilot: <@{self.flight_data.get('pilot_id')}>"
 
-        # Get attachments and preserve embed image references
+        # Preserve embed image references (and refresh an expired reused map URL)
         attachments_to_keep = []
         if getattr(self, "original_message", None):
-            if self.original_message.attachments:
-                attachments_to_keep = list(self.original_message.attachments)
-            
-            # Reconstruct attachment:// URLs by extracting filenames from the original embed's CDN URLs
-            if self.original_message.embeds:
-                orig_embed = self.original_message.embeds[0]
-                if orig_embed.image and orig_embed.image.url:
-                    filename = orig_embed.image.url.split('/')[-1].split('?')[0]
-                    embed.set_image(url=f"attachment://{filename}")
-                if orig_embed.thumbnail and orig_embed.thumbnail.url:
-                    filename = orig_embed.thumbnail.url.split('/')[-1].split('?')[0]
-                    embed.set_thumbnail(url=f"attachment://{filename}")
+            attachments_to_keep = await interaction.client.flight_board_service.carry_over_images(
+                embed, self.original_message, self.flight_data['departure'], self.flight_data['arrival']
+            )
 
         view = FlightBoardView(self.flight_data)
 
         try:
             # Pass attachments to prevent Discord from detaching them
             if attachments_to_keep:
-                await self.original_message.edit(
+                edited = await self.original_message.edit(
                     content=content,
                     embed=embed,
                     view=view,
                     attachments=attachments_to_keep
                 )
+                await interaction.client.flight_board_service.remember_route_map_url(
+                    self.flight_data['departure'], self.flight_data['arrival'], edited
+                )
             else:
                 await self.original_message.edit(
                     content=content,
@@ -391,31 +385,25 @@ class FlightEditModal(discord.ui.Modal):
         # Build content with pilot mention
         content = f"Pilot: <@{self.flight_data.get('pilot_id')}>"
 
-        # Get attachments and preserve embed image references
+        # Preserve embed image references (and refresh an expired reused map URL)
         attachments_to_keep = []
         if getattr(self, "message", None):
-            if self.message.attachments:
-                attachments_to_keep = list(self.message.attachments)
-            
-            # Reconstruct attachment:// URLs by extracting filenames from the original embed's CDN URLs
-            if self.message.embeds:
-                orig_embed = self.message.embeds[0]
-                if orig_embed.image and orig_embed.image.url:
-                    filename = orig_embed.image.url.split('/')[-1].split('?')[0]
-                    embed.set_image(url=f"attachment://{filename}")
-                if orig_embed.thumbnail and orig_embed.thumbnail.url:
-                    filename = orig_embed.thumbnail.url.split('/')[-1].split('?')[0]
-                    embed.set_thumbnail(url=f"attachment://{filename}")
+            attachments_to_keep = await interaction.client.flight_board_service.carry_over_images(
+                embed, self.message, self.flight_data['departure'], self.flight_data['arrival']
+            )
 
         try:
             # Pass attachments to prevent Discord from detaching them
             if attachments_to_keep:
-                await self.message.edit(
+                edited = await self.message.edit(
                     content=content,
                     embed=embed,
                     view=view,
                     attachments=attachments_to_keep
                 )
+                await interaction.client.flight_board_service.remember_route_map_url(
+                    self.flight_data['departure'], self.flight_data['arrival'], edited
+                )
             else:
                 await self.message.edit(
                     content=content,
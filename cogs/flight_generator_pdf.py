@@ -198,7 +198,7 @@ class FlightClaimConfirmView(discord.ui.View):
                     print(f"[DEBUG] Airport data missing - Dep: {dep_data is not None}, Dest: {dest_data is not None}")
 
             # Generate PDF
-            pdf_output = cog.pdf_service.generate_flight_pdf(self.flight_data, self.flight_type, interaction.user, pilot_info)
+            pdf_output = await cog.pdf_render_service.generate_flight_pdf(self.flight_data, self.flight_type, interaction.user, pilot_info)
             print(f"[DEBUG] PDF generation result: {pdf_output is not None}")
             
             if pdf_output:
@@ -284,7 +284,7 @@ class StaffPDFRegenerateView(discord.ui.View):
                 return await interaction.followup.send("❌ Service unavailable.", ephemeral=True)
             
             # Generate new PDF with same flight data
-            pdf_output = cog.pdf_service.generate_flight_pdf(self.flight_data, self.flight_type, interaction.user)
+            pdf_output = await cog.pdf_render_service.generate_flight_pdf(self.flight_data, self.flight_type, interaction.user)
             
             if pdf_output:
                 # Send PDF as ephemeral message to staff
@@ -506,6 +506,7 @@ class FlightGeneratorPDF(commands.Cog):
         self.ai_service = bot.ai_service
         self.flight_service = bot.flight_service
         self.pdf_service = bot.pdf_service
+        self.pdf_render_service = bot.pdf_render_service
         self.bot.add_view(FlightRequestView())
         self.bot.add_view(DispatchClaimView(None, None, None, None))
         self.bot.add_view(FlightClaimConfirmView(None, None, None, None))
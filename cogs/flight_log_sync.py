@@ -0,0 +1,36 @@
+import logging
+from discord.ext import commands, tasks
+
+logger = logging.getLogger('oryxie.flight_log_sync')
+
+
+class FlightLogSync(commands.Cog):
+    """Keeps the local IF flight log store fresh for recently active pilots."""
+
+    ACTIVE_DAYS = 7
+
+    def __init__(self, bot: commands.Bot):
+        self.bot = bot
+        self.sync_flight_logs.start()
+
+    def cog_unload(self):
+        self.sync_flight_logs.cancel()
+
+    @tasks.loop(minutes=30)
+    async def sync_flight_logs(self):
+        if not self.bot.if_api_manager or not self.bot.flight_log_service:
+            return
+        try:
+            synced = await self.bot.flight_log_service.sync_recent_pilots(days=self.ACTIVE_DAYS)
+            if synced:
+                logger.info(f"Flight log sync refreshed {synced} pilots.")
+        except Exception as e:
+            logger.error(f"Error during flight log sync: {e}")
+
+    @sync_flight_logs.before_loop
+    async def before_sync_flight_logs(self):
+        await self.bot.wait_until_ready()
+
+
+async def setup(bot: commands.Bot):
+    await bot.add_cog(FlightLogSync(bot))
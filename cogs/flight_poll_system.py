@@ -399,6 +399,10 @@ class FlightPollSystem(commands.Cog):
         if not valid_routes:
             return await interaction.followup.send("❌ None of the provided flight numbers were found in the database.")
 
+        # The winner gets a flight board post; have its map ready by then
+        if getattr(self.bot, 'route_map_warmer', None):
+            self.bot.route_map_warmer.enqueue(((r.get('dep'), r.get('arr')) for r in valid_routes), front=True)
+
         # Launch setup view
         view = PollSetupView(self.bot, interaction, valid_routes, title, duration, interaction.user)
         await interaction.followup.send(
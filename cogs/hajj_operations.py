@@ -8,6 +8,7 @@ from datetime import datetime, timezone
 import logging
 
 DASHBOARD_THUMBNAIL = "https://cdn.discordapp.com/attachments/1150347101205696562/1499493493494517770/content.png?ex=6a0ac064&is=6a096ee4&hm=adb3fcd36102c274fcadcbf4dda006d210a11bb7933cde0f9d75cf8b226377ea"
+PIREP_FEED_NAME = "hajj_operations"
 
 CONTINENT_EMOJI = {
     "AS": "🌏",
@@ -59,10 +60,12 @@ class HajjOperationsCog(commands.Cog):
             currency_name=self.hajj_currency_name
         )
 
+        self.pirep_queue = None
         self.update_dashboard.start()
 
     def cog_unload(self):
         self.update_dashboard.cancel()
+        self.bot.pirep_feed_service.unsubscribe(PIREP_FEED_NAME)
 
     def _load_hajj_config(self):
         try:
@@ -203,11 +206,23 @@ class HajjOperationsCog(commands.Cog):
 
         staff_log_channel = self.bot.get_channel(self.staff_log_channel_id) if self.staff_log_channel_id else None
         try:
-            all_pireps = await self.bot.pireps_model.get_accepted_pireps()
+            if self.pirep_queue is None:
+                self.pirep_queue = await self.bot.pirep_feed_service.subscribe(PIREP_FEED_NAME)
+
+            # Drain PIREPs accepted since the last run; _process_hajj_pirep's duplicate check
+            # makes redelivery from the at-least-once feed harmless. Failures are nacked and
+            # come back on a later run.
             processed_count = 0
-            for pirep_data in all_pireps:
-                if await self._process_hajj_pirep(pirep_data, staff_log_channel):
-                    processed_count += 1
+            while not self.pirep_queue.empty():
+                pirep_data = self.pirep_queue.get_nowait()
+                try:
+                    if await self._process_hajj_pirep(pirep_data, staff_log_channel):
+                        processed_count += 1
+                except Exception as e:
+                    logging.error(f"Error processing Hajj PIREP {pirep_data.get('pirep_id')}: {e}")
+                    await self.bot.pirep_feed_service.nack(PIREP_FEED_NAME, pirep_data, str(e))
+                else:
+                    await self.bot.pirep_feed_service.ack(PIREP_FEED_NAME, pirep_data['pirep_id'])
             if processed_count > 0:
                 logging.info(f"HajjOperationsCog processed {processed_count} new Hajj PIREPs.")
         except Exception as e:
@@ -244,6 +259,12 @@ class HajjOperationsCog(commands.Cog):
             logging.error(f"Error scanning pinned messages: {e}")
         return None
 
+    async def _transfer_pilgrims(self, pilot_id: int, pilgrim_count: int, from_reason: str, to_reason: str):
+        """Records both legs of a pilgrim transfer in one transaction; raises if it can't be written."""
+        async with self.bot.db_manager.transaction() as tx:
+            await self.hajj_event_model.add_transaction(pilot_id, -pilgrim_count, from_reason, tx=tx)
+            await self.hajj_event_model.add_transaction(pilot_id, pilgrim_count, to_reason, tx=tx)
+
     async def _process_hajj_pirep(self, pirep_data: dict, staff_log_channel: discord.TextChannel) -> bool:
         flight_number = pirep_data.get('flightnum', '').upper()
         if not flight_number.startswith("HAJJOPS"):
@@ -282,11 +303,10 @@ class HajjOperationsCog(commands.Cog):
                         f"{pilot_mention} ({pilot_callsign}) filed PIREP #{pirep_id} but continent for {departure_icao} could not be determined. Skipping."
                     )
                 return False
-            await self.hajj_event_model.add_transaction(
-                pilot_id, -pilgrim_count, f"HajjOps: Pilgrims from {continent_code} (PIREP #{pirep_id})"
-            )
-            await self.hajj_event_model.add_transaction(
-                pilot_id, pilgrim_count, f"HajjOps: Pilgrims to OTHH (PIREP #{pirep_id})"
+            await self._transfer_pilgrims(
+                pilot_id, pilgrim_count,
+                f"HajjOps: Pilgrims from {continent_code} (PIREP #{pirep_id})",
+                f"HajjOps: Pilgrims to OTHH (PIREP #{pirep_id})"
             )
             continent_name = CONTINENT_NAME.get(continent_code, continent_code)
             log_message = (
@@ -297,11 +317,10 @@ class HajjOperationsCog(commands.Cog):
             )
 
         elif is_phase2:
-            await self.hajj_event_model.add_transaction(
-                pilot_id, -pilgrim_count, f"HajjOps: Pilgrims from OTHH (PIREP #{pirep_id})"
-            )
-            await self.hajj_event_model.add_transaction(
-                pilot_id, pilgrim_count, f"HajjOps: Pilgrims to {arrival_icao} (PIREP #{pirep_id})"
+            await self._transfer_pilgrims(
+                pilot_id, pilgrim_count,
+                f"HajjOps: Pilgrims from OTHH (PIREP #{pirep_id})",
+                f"HajjOps: Pilgrims to {arrival_icao} (PIREP #{pirep_id})"
             )
             dest_name = "Makkah" if arrival_icao == "OEMA" else "Jeddah"
             log_message = (
@@ -320,11 +339,10 @@ class HajjOperationsCog(commands.Cog):
                         f"{pilot_mention} ({pilot_callsign}) filed PIREP #{pirep_id} but continent for {departure_icao} could not be determined. Skipping."
                     )
                 return False
-            await self.hajj_event_model.add_transaction(
-                pilot_id, -pilgrim_count, f"HajjOps: Pilgrims from {continent_code} (PIREP #{pirep_id})"
-            )
-            await self.hajj_event_model.add_transaction(
-                pilot_id, pilgrim_count, f"HajjOps: Pilgrims to {arrival_icao} (PIREP #{pirep_id})"
+            await self._transfer_pilgrims(
+                pilot_id, pilgrim_count,
+                f"HajjOps: Pilgrims from {continent_code} (PIREP #{pirep_id})",
+                f"HajjOps: Pilgrims to {arrival_icao} (PIREP #{pirep_id})"
             )
             continent_name = CONTINENT_NAME.get(continent_code, continent_code)
             dest_name = "Makkah" if arrival_icao == "OEMA" else "Jeddah"
@@ -1,11 +1,13 @@
 import discord
 from discord import app_commands
 from discord.ext import commands
+import asyncio
 import json
 import os
 import re
 import logging
 from datetime import datetime
+from typing import List
 
 from services.simbrief_service import SimBriefService
 from services.flight_board_service import FlightBoardService
@@ -159,7 +161,12 @@ class PirepConfirmView(discord.ui.View):
             multiplier_id=self.pirep_data.get('multiplier_id')
         )
         
-        msg = "✅ PIREP filed successfully!" if response and response.get('status') == 0 else f"❌ PIREP filing failed: {response.get('result', 'Unknown error') if response else 'No response'}"
+        if response and response.get('queued'):
+            msg = f"🕒 {response.get('message')}"
+        elif response and response.get('status') == 0:
+            msg = "✅ PIREP filed successfully!"
+        else:
+            msg = f"❌ PIREP filing failed: {response.get('result', 'Unknown error') if response else 'No response'}"
         await interaction.followup.send(msg, ephemeral=True)
         self.stop()
 
@@ -188,7 +195,7 @@ class MissionDispatcherCog(commands.Cog):
 
     async def _start_multiplier_selection(self, interaction: discord.Interaction, pirep_data: dict):
         """Fetches multipliers and shows the selection view."""
-        multipliers = await self.pirep_filing_service.get_pilot_multipliers(pirep_data.get('pilot_id'))
+        multipliers = await self.bot.pilot_prefetcher.multipliers(interaction.user.id)
         
         if not multipliers:
             confirm_view = PirepConfirmView(self, pirep_data)
@@ -268,11 +275,15 @@ class MissionDispatcherCog(commands.Cog):
         
         return details
 
-    async def execute_action(self, interaction, mode, details):
-        """Finalizes the action: Generates SimBrief link or Posts to Flight Board."""
+    async def execute_action(self, interaction, mode, details, guard=None):
+        """
+        Finalizes the action: Generates SimBrief link or Posts to Flight Board.
+        The pirep mode responds through ``guard`` (an InteractionGuard), since the
+        interaction may or may not have been deferred by the time it answers.
+        """
 
         if mode == "simbrief":
-            pilot_res = await self.bot.pilots_model.identify_pilot(interaction.user)
+            pilot_res = await self.bot.pilot_prefetcher.identify(interaction.user)
             if not pilot_res['success']:
                 await interaction.edit_original_response(content=f"❌ {pilot_res['error_message']}", view=None)
                 return
@@ -294,7 +305,7 @@ class MissionDispatcherCog(commands.Cog):
                 await interaction.edit_original_response(content="❌ SimBrief service unavailable.", view=None)
         
         elif mode == "board":
-            pilot_res = await self.bot.pilots_model.identify_pilot(interaction.user)
+            pilot_res = await self.bot.pilot_prefetcher.identify(interaction.user)
             if not pilot_res['success']:
                 await interaction.edit_original_response(content=f"❌ {pilot_res['error_message']}", view=None)
                 return
@@ -325,13 +336,18 @@ class MissionDispatcherCog(commands.Cog):
                 await interaction.edit_original_response(content="❌ Flight Board service unavailable.", view=None)
         
         elif mode == "pirep":
+            if guard is None:
+                async with self.bot.interaction_deadlines.guard(interaction, "mission_pirep", ephemeral=True) as guard:
+                    await self.execute_action(interaction, mode, details, guard=guard)
+                return
+
             prepared_data = await self.pirep_filing_service.prepare_pirep_data(
                 discord_id=interaction.user.id,
                 flight_data=details
             )
 
             if not prepared_data.get('success'):
-                await interaction.response.edit_message(content=f"❌ Error preparing PIREP: {prepared_data.get('error')}", view=None)
+                await guard.edit(content=f"❌ Error preparing PIREP: {prepared_data.get('error')}", view=None)
                 return
 
             pirep_to_file = {
@@ -346,13 +362,15 @@ class MissionDispatcherCog(commands.Cog):
 
             if pirep_to_file['duration']:
                 view = PirepDurationConfirmView(self, pirep_to_file)
-                await interaction.response.edit_message(
+                await guard.edit(
                     content=f"⏱️ **Flight Detected!**\nWe found a matching flight with duration: **{pirep_to_file['duration']}**.",
                     view=view
                 )
             else:
                 modal = PirepDurationModalHHMM(self, pirep_to_file)
-                await interaction.response.send_modal(modal)
+                await guard.send_modal(
+                    modal, prompt="No matching flight was found. Enter your flight time to continue.", label="Enter Flight Time"
+                )
 
     @app_commands.command(name="mission_dispatcher", description="Post the Mission Dispatcher panel.")
     @app_commands.checks.has_permissions(administrator=True)
@@ -383,6 +401,47 @@ class MissionDispatcherCog(commands.Cog):
             
         await interaction.followup.send("✅ Mission panel posted.", ephemeral=True)
 
+    async def set_autocomplete(self, interaction: discord.Interaction, current: str) -> List[app_commands.Choice[str]]:
+        sets = [name for name, missions in self.mission_data.items() if not name.startswith('_') and isinstance(missions, dict)]
+        return [app_commands.Choice(name=name, value=name) for name in sets if current.lower() in name.lower()][:25]
+
+    @app_commands.command(name="mission_overview", description="Post a map of every leg in a World Tour set.")
+    @app_commands.checks.has_permissions(administrator=True)
+    @app_commands.autocomplete(set_name=set_autocomplete)
+    async def mission_overview(self, interaction: discord.Interaction, set_name: str):
+        await interaction.response.defer()
+
+        missions = self.mission_data.get(set_name)
+        if set_name.startswith('_') or not isinstance(missions, dict):
+            await interaction.followup.send(f"❌ Unknown mission set `{set_name}`.", ephemeral=True)
+            return
+
+        details = await asyncio.gather(*(self.get_route_details(m) for m in missions.values()))
+        legs = [(mission_id, d) for mission_id, d in zip(missions.keys(), details) if d['departure'] and d['arrival']]
+        if not legs:
+            await interaction.followup.send(f"❌ No routes could be resolved for `{set_name}`.", ephemeral=True)
+            return
+
+        map_result = await self.bot.route_map_service.create_overview_map(
+            [(d['departure'], d['arrival']) for _, d in legs]
+        )
+        if isinstance(map_result, str):
+            await interaction.followup.send("❌ Failed to generate the overview map.", ephemeral=True)
+            return
+
+        lines = [
+            " ".join(filter(None, [f"**{mission_id}**", d['flight_number'], f"{d['departure']} → {d['arrival']}"]))
+            for mission_id, d in legs
+        ]
+        embed = discord.Embed(
+            title=f"🗺️ {set_name}",
+            description="\n".join(lines)[:4000],
+            color=MISSION_CONFIG["EMBED_COLOR"]
+        )
+        embed.set_image(url="attachment://route_overview.png")
+        embed.set_footer(text=MISSION_CONFIG["FOOTER_TEXT"])
+        await interaction.followup.send(embed=embed, file=discord.File(map_result, filename="route_overview.png"))
+
 class MissionDispatcherView(discord.ui.View):
     def __init__(self, cog):
         super().__init__(timeout=None)
@@ -399,6 +458,8 @@ class MissionDispatcherView(discord.ui.View):
             await interaction.response.send_message("No missions loaded.", ephemeral=True)
             return
 
+        # Resolve the pilot, rank and multipliers while they pick a mission
+        self.cog.bot.pilot_prefetcher.prefetch(interaction.user)
         await interaction.response.defer(ephemeral=True)
 
         if len(sets) == 1:
@@ -520,10 +581,13 @@ class MissionRouteSelectView(discord.ui.View):
         mission_data = self.missions.get(mission_key)
         
         if self.mode == 'pirep':
-            details = await self.cog.get_route_details(mission_data)
-            details['flight_number'] = mission_key
-            details['cc_aircraft_id'] = 11
-            await self.cog.execute_action(interaction, self.mode, details)
+            # Route lookup and PIREP preparation can outlast the 3s window, but the first
+            # response may need to be a modal, so we only defer if it gets close.
+            async with self.cog.bot.interaction_deadlines.guard(interaction, "mission_pirep_route", ephemeral=True) as guard:
+                details = await self.cog.get_route_details(mission_data)
+                details['flight_number'] = mission_key
+                details['cc_aircraft_id'] = 11
+                await self.cog.execute_action(interaction, self.mode, details, guard=guard)
             return
 
         await interaction.response.defer(ephemeral=True)
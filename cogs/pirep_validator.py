@@ -1,6 +1,5 @@
 import discord
 from discord.ext import commands
-import asyncio
 from discord import app_commands
 from typing import TYPE_CHECKING
 import os
@@ -9,6 +8,8 @@ import re
 from collections import defaultdict
 from datetime import datetime, timedelta
 from services.pirep_validation_service import PirepValidationService
+from services.landing_challenge import LandingChallenge
+from services.pirep_retry_scheduler import PirepRetryScheduler
 
 if TYPE_CHECKING:
     from ..bot import MyBot
@@ -91,7 +92,10 @@ class PirepRetryView(discord.ui.View):
                 retry_view = PirepRetryView(callsign, flight_num, dep, arr)
                 await interaction.followup.send(embed=report_embed, view=retry_view)
             else:
-                # Success! Show thread view
+                # Success! Show thread view and stop any scheduled automatic retries
+                cog = interaction.client.get_cog("PirepValidator")
+                if cog and interaction.channel:
+                    cog.retry_scheduler.cancel(interaction.channel.id)
                 view = PirepThreadView(target_pirep['pirep_id'], callsign, flight_num, dep, arr)
                 await interaction.followup.send(embed=report_embed, view=view)
         except Exception as e:
@@ -196,22 +200,69 @@ class PirepThreadView(discord.ui.View):
         await interaction.message.edit(view=self) 
 
 class PirepPaginationView(discord.ui.View):
-    def __init__(self, bot, pending_pireps, current_index=0, count_message=None, validation_service=None):
+    PAGE_SIZE = 10
+
+    def __init__(self, bot, window, total_count, count_message=None, validation_service=None):
         super().__init__(timeout=None)
         self.bot = bot
-        self.pending_pireps = pending_pireps
-        self.current_index = current_index
+        # Only a small window of the queue is held; further pages are fetched by (date, id) cursor
+        self.window = window
+        self.window_index = 0
+        self.position = 0
+        self.total_count = total_count
         self.count_message = count_message
         self.validation_service = validation_service or PirepValidationService(bot)
         self.update_buttons()
     
+    @property
+    def current_pirep(self):
+        return self.window[self.window_index]
+    
     def _check_staff_role(self, user) -> bool:
         """Check if user has staff role."""
         return any("staff" in role.name.lower() for role in user.roles)
     
     def update_buttons(self):
-        self.previous_button.disabled = self.current_index == 0
-        self.next_button.disabled = self.current_index >= len(self.pending_pireps) - 1
+        self.previous_button.disabled = self.position == 0
+        self.next_button.disabled = self.position >= self.total_count - 1
+    
+    async def _step(self, offset: int) -> bool:
+        """Move one PIREP forward (+1) or back (-1), fetching the adjacent page when leaving the window."""
+        new_index = self.window_index + offset
+        if 0 <= new_index < len(self.window):
+            self.window_index = new_index
+            self.position += offset
+            return True
+        
+        edge = self.window[-1] if offset > 0 else self.window[0]
+        page = await self.bot.pireps_model.get_pending_pireps_page(
+            cursor=(edge['date'], edge['pirep_id']),
+            page_size=self.PAGE_SIZE,
+            direction='next' if offset > 0 else 'prev'
+        )
+        if not page:
+            return False
+        
+        self.window = page
+        self.window_index = 0 if offset > 0 else len(page) - 1
+        self.position = max(0, self.position + offset)
+        return True
+    
+    async def _show_step(self, interaction: discord.Interaction, offset: int):
+        if not await self._step(offset):
+            if offset > 0:
+                # Queue shrank since the count was taken
+                self.total_count = self.position + 1
+            else:
+                self.position = 0
+            self.update_buttons()
+            await interaction.message.edit(view=self)
+            await interaction.followup.send("✅ No more pending PIREPs in that direction.", ephemeral=True)
+            return
+        
+        embed = await self.validation_service.validate_pirep(self.current_pirep)
+        self.update_buttons()
+        await interaction.message.edit(embed=embed, view=self)
     
     @discord.ui.button(label="⬅️ Previous", style=discord.ButtonStyle.secondary)
     async def previous_button(self, interaction: discord.Interaction, button: discord.ui.Button):
@@ -221,11 +272,8 @@ class PirepPaginationView(discord.ui.View):
         await interaction.response.defer()
         
         try:
-            if self.current_index > 0:
-                self.current_index -= 1
-                embed = await self.validation_service.validate_pirep(self.pending_pireps[self.current_index])
-                self.update_buttons()
-                await interaction.message.edit(embed=embed, view=self)
+            if self.position > 0:
+                await self._show_step(interaction, -1)
         except Exception as e:
             await interaction.followup.send(f"Error updating PIREP: {str(e)}", ephemeral=True)
     
@@ -237,11 +285,8 @@ class PirepPaginationView(discord.ui.View):
         await interaction.response.defer()
         
         try:
-            if self.current_index < len(self.pending_pireps) - 1:
-                self.current_index += 1
-                embed = await self.validation_service.validate_pirep(self.pending_pireps[self.current_index])
-                self.update_buttons()
-                await interaction.message.edit(embed=embed, view=self)
+            if self.position < self.total_count - 1:
+                await self._show_step(interaction, 1)
         except Exception as e:
             await interaction.followup.send(f"Error updating PIREP: {str(e)}", ephemeral=True)
     
@@ -252,20 +297,24 @@ class PirepPaginationView(discord.ui.View):
         
         await interaction.response.defer()
         
-        self.pending_pireps = await self.bot.pireps_model.get_pending_pireps()
+        window = await self.bot.pireps_model.get_pending_pireps_page(page_size=self.PAGE_SIZE)
         
-        if not self.pending_pireps:
+        if not window:
             await interaction.followup.send("✅ No more pending PIREPs!", ephemeral=True)
             return
         
+        self.window = window
+        self.window_index = 0
+        self.position = 0
+        self.total_count = await self.bot.pireps_model.count_pending_pireps()
+        
         if self.count_message:
             try:
-                await self.count_message.edit(content=f"📋 **{len(self.pending_pireps)} PIREPs pending validation**")
+                await self.count_message.edit(content=f"📋 **{self.total_count} PIREPs pending validation**")
             except (discord.NotFound, discord.Forbidden, discord.HTTPException) as e:
                 logger.error(f"Could not update count message: {e}")
         
-        self.current_index = 0
-        embed = await self.validation_service.validate_pirep(self.pending_pireps[0])
+        embed = await self.validation_service.validate_pirep(self.current_pirep)
         self.update_buttons()
         await interaction.message.edit(embed=embed, view=self)
     
@@ -276,7 +325,7 @@ class PirepPaginationView(discord.ui.View):
         
         await interaction.response.defer(ephemeral=True)
         
-        debug_messages = await self.validation_service.get_debug_info(self.pending_pireps[self.current_index])
+        debug_messages = await self.validation_service.get_debug_info(self.current_pirep)
         
         for msg in debug_messages:
             await interaction.followup.send(msg, ephemeral=True)
@@ -318,7 +367,48 @@ class PirepPaginationView(discord.ui.View):
     #         logger.error(f"Error approving PIREP {pirep_id}: {e}")
     #         await interaction.followup.send(f"❌ **Error:** {str(e)}", ephemeral=True)
 
+class BatchApprovalView(discord.ui.View):
+    """Offers staff a one-click approval of the clean bucket from /validate_all_pireps."""
+
+    def __init__(self, bot, clean_results: list):
+        super().__init__(timeout=900)
+        self.bot = bot
+        self.pirep_ids = [item['pirep']['pirep_id'] for item in clean_results]
+        self.approve_button.label = f"✅ Approve {len(self.pirep_ids)} Clean PIREPs"
+        self.approve_button.disabled = not self.pirep_ids
+
+    def _check_staff_role(self, user) -> bool:
+        return any("staff" in role.name.lower() for role in user.roles)
+
+    @discord.ui.button(label="✅ Approve Clean PIREPs", style=discord.ButtonStyle.success)
+    async def approve_button(self, interaction: discord.Interaction, button: discord.ui.Button):
+        if not self._check_staff_role(interaction.user):
+            return await interaction.response.send_message("You must have a role containing 'staff' to use this command.", ephemeral=True)
+
+        button.disabled = True
+        await interaction.response.edit_message(view=self)
+
+        result = await self.bot.pireps_model.update_pirep_statuses({1: self.pirep_ids})
+        if result is None:
+            button.disabled = False
+            await interaction.message.edit(view=self)
+            return await interaction.followup.send("❌ **Error:** Could not approve the PIREPs. Nothing was changed.", ephemeral=True)
+
+        approved = result.get(1, 0)
+        skipped = len(self.pirep_ids) - approved
+        logger.info(f"{interaction.user} bulk-approved {approved} clean PIREPs ({skipped} no longer pending)")
+        button.label = f"✅ Approved {approved}"
+        await interaction.message.edit(view=self)
+
+        msg = f"✅ **{approved} clean PIREPs approved by {interaction.user.mention}**"
+        if skipped:
+            msg += f"\n{skipped} were skipped because they are no longer pending."
+        await interaction.followup.send(msg)
+        self.stop()
+
 class PirepValidator(commands.Cog):
+    BATCH_PAGE_SIZE = 50  # pending PIREPs fetched per page by /validate_all_pireps
+
     def __init__(self, bot: 'MyBot'):
         self.bot = bot
         self.WATCH_CHANNEL_ID = 1459564652945084578  # Production channel
@@ -326,6 +416,10 @@ class PirepValidator(commands.Cog):
         self.validation_service = PirepValidationService(bot)
         self.rate_limit = defaultdict(list)
         self.max_requests_per_minute = 5
+        # (departure, arrival, timeframe_hours) -> LandingChallenge, refreshed incrementally
+        self.landing_challenges = {}
+        # Automatic re-validation of unmatched PIREPs, keyed by thread ID
+        self.retry_scheduler = PirepRetryScheduler(self._auto_retry)
         
         # Add persistent views for button handling after bot restart
         try:
@@ -336,6 +430,47 @@ class PirepValidator(commands.Cog):
         except Exception as e:
             logger.error(f"Could not add persistent views: {e}")
     
+    def cog_unload(self):
+        self.retry_scheduler.close()
+
+    def _retry_schedule_text(self) -> str:
+        minutes = [str(delay // 60) for delay in self.retry_scheduler.backoff]
+        return f"{', '.join(minutes[:-1])} and {minutes[-1]} minutes"
+
+    async def _auto_retry(self, job, final: bool) -> bool:
+        """Scheduled re-validation for a thread; returns True once a result has been posted."""
+        p = job.payload
+        thread = self.bot.get_channel(job.key)
+        if thread is None:
+            try:
+                thread = await self.bot.fetch_channel(job.key)
+            except (discord.NotFound, discord.Forbidden):
+                logger.warning(f"Auto-retry thread {job.key} is gone; dropping retry for {p['callsign']} {p['flight_num']}")
+                return True
+
+        logger.info(f"[DEBUG] Auto-retry {job.attempt + 1}/{len(self.retry_scheduler.backoff)} for {p['callsign']} {p['flight_num']}")
+        target_pirep = await self.validation_service.find_pirep_by_callsign_flight_and_route(p['callsign'], p['flight_num'], p['departure'], p['arrival'])
+        retry_view = PirepRetryView(p['callsign'], p['flight_num'], p['departure'], p['arrival'])
+
+        if not target_pirep:
+            if final:
+                await thread.send(
+                    "⚠️ **PIREP still not found after automatic retries.**\n"
+                    "Use the button below to retry manually.",
+                    view=retry_view
+                )
+            return final
+
+        report_embed = await self.validation_service.validate_pirep(target_pirep)
+        if "MATCH NOT FOUND" in str(report_embed.fields[0].name if report_embed.fields else ""):
+            if final:
+                await thread.send(content="⚠️ **No matching IF flight after automatic retries.**", embed=report_embed, view=retry_view)
+            return final
+
+        view = PirepThreadView(target_pirep['pirep_id'], p['callsign'], p['flight_num'], p['departure'], p['arrival'])
+        await thread.send(content="🔄 **Automatic retry succeeded.**", embed=report_embed, view=view)
+        return True
+
     def _check_rate_limit(self, user_id: int) -> bool:
         """Check if user is rate limited."""
         now = datetime.now()
@@ -407,10 +542,11 @@ class PirepValidator(commands.Cog):
         if not target_pirep:
             logger.warning(f"[DEBUG] Initial lookup failed for {callsign_str} {flight_num_str}. Sending Retry View.")
             retry_view = PirepRetryView(callsign_str, flight_num_str, departure_str, arrival_str)
+            self.retry_scheduler.schedule(thread.id, callsign=callsign_str, flight_num=flight_num_str, departure=departure_str, arrival=arrival_str)
             await thread.send(
                 f"⚠️ **Could not find PIREP in database.**\n"
                 f"Callsign: `{callsign_str}` | Flight: `{flight_num_str}` | Route: `{departure_str} - {arrival_str}`\n"
-                f"This may happen if the pilot hasn't despawned yet. Use the button below to retry validation once the pilot has despawned.",
+                f"This may happen if the pilot hasn't despawned yet. Retrying automatically after {self._retry_schedule_text()}, or use the button below to retry now.",
                 view=retry_view
             )
             return
@@ -422,9 +558,14 @@ class PirepValidator(commands.Cog):
             
             # Check if validation failed to find a match (for retry button)
             if "MATCH NOT FOUND" in str(report_embed.fields[0].name if report_embed.fields else ""):
-                # Add retry button for failed matches (player didn't despawn)
+                # Add retry button for failed matches (player didn't despawn) and retry automatically
+                self.retry_scheduler.schedule(thread.id, callsign=callsign_str, flight_num=flight_num_str, departure=departure_str, arrival=arrival_str)
                 retry_view = PirepRetryView(callsign_str, flight_num_str, departure_str, arrival_str)
-                await thread.send(embed=report_embed, view=retry_view)
+                await thread.send(
+                    content=f"🔄 Retrying automatically after {self._retry_schedule_text()}.",
+                    embed=report_embed,
+                    view=retry_view
+                )
             else:
                 # Normal validation with thread buttons
                 view = PirepThreadView(target_pirep['pirep_id'], callsign_str, flight_num_str, departure_str, arrival_str)
@@ -448,28 +589,75 @@ class PirepValidator(commands.Cog):
         await interaction.response.defer(ephemeral=False)
         
         try:
-            pending_pireps = await self.bot.pireps_model.get_pending_pireps()
+            first_page = await self.bot.pireps_model.get_pending_pireps_page(page_size=PirepPaginationView.PAGE_SIZE)
 
-            if not pending_pireps:
+            if not first_page:
                 return await interaction.followup.send("There are no pending PIREPs to validate.", ephemeral=False)
             
-            count_message = await interaction.followup.send(f"📋 **{len(pending_pireps)} PIREPs pending validation**", ephemeral=False)
+            total_count = await self.bot.pireps_model.count_pending_pireps()
+            count_message = await interaction.followup.send(f"📋 **{total_count} PIREPs pending validation**", ephemeral=False)
             
-            embed = await self.validation_service.validate_pirep(pending_pireps[0])
-            view = PirepPaginationView(self.bot, pending_pireps, 0, count_message, self.validation_service)
+            embed = await self.validation_service.validate_pirep(first_page[0])
+            view = PirepPaginationView(self.bot, first_page, total_count, count_message, self.validation_service)
             await interaction.followup.send(embed=embed, view=view, ephemeral=False)
             
         except Exception as e:
             logger.error(f"SLASH ERROR: {e}")
             await interaction.followup.send(f"Error: {str(e)}", ephemeral=True)
 
+    @app_commands.command(name="validate_all_pireps", description="Validate every pending PIREP at once and get a summary report.")
+    async def validate_all_pireps(self, interaction: discord.Interaction):
+        """Batch validation of the whole pending queue into clean / suspicious / failed buckets."""
+        if not any("staff" in role.name.lower() for role in interaction.user.roles):
+            return await interaction.response.send_message("You must have a role containing 'staff' to use this command.", ephemeral=True)
+        
+        if not self._check_rate_limit(interaction.user.id):
+            return await interaction.response.send_message("Rate limit exceeded. Please wait before trying again.", ephemeral=True)
+            
+        await interaction.response.defer(ephemeral=False)
+        
+        try:
+            # Walk the queue a page at a time instead of loading all of it up front
+            page = await self.bot.pireps_model.get_pending_pireps_page(page_size=self.BATCH_PAGE_SIZE)
+            if not page:
+                return await interaction.followup.send("There are no pending PIREPs to validate.", ephemeral=False)
+
+            status_msg = await interaction.followup.send("🔍 Validating pending PIREPs...")
+            buckets = {bucket: [] for bucket in self.validation_service.BATCH_BUCKETS}
+            validated = 0
+            while page:
+                page_buckets = await self.validation_service.validate_batch(page)
+                for bucket, items in page_buckets.items():
+                    buckets[bucket].extend(items)
+                validated += len(page)
+                await status_msg.edit(content=f"🔍 Validating pending PIREPs... **{validated}** done")
+
+                if len(page) < self.BATCH_PAGE_SIZE:
+                    break
+                edge = page[-1]
+                page = await self.bot.pireps_model.get_pending_pireps_page(
+                    cursor=(edge['date'], edge['pirep_id']), page_size=self.BATCH_PAGE_SIZE
+                )
+            embed, csv_file = self.validation_service.build_batch_report(buckets)
+
+            await status_msg.delete()
+            if buckets['clean']:
+                await interaction.followup.send(embed=embed, file=csv_file, view=BatchApprovalView(self.bot, buckets['clean']))
+            else:
+                await interaction.followup.send(embed=embed, file=csv_file)
+            
+        except Exception as e:
+            logger.error(f"Error in validate_all_pireps command: {e}", exc_info=True)
+            await interaction.followup.send(f"Error: {str(e)}", ephemeral=True)
+
     @app_commands.command(name="landing_challenge", description="Show the landing challenge leaderboard for a specific route.")
     @app_commands.describe(
         departure="Departure airport ICAO code (e.g., OTHH)",
         arrival="Arrival airport ICAO code (e.g., OMDB)",
-        timeframe_hours="Number of hours to look back (default: 48)"
+        timeframe_hours="Number of hours to look back (default: 48)",
+        reset="Discard the cached standings and rebuild from scratch"
     )
-    async def landing_challenge(self, interaction: discord.Interaction, departure: str, arrival: str, timeframe_hours: int = 48):
+    async def landing_challenge(self, interaction: discord.Interaction, departure: str, arrival: str, timeframe_hours: int = 48, reset: bool = False):
         """Host a landing challenge leaderboard based on approved PIREPs on a route."""
         if not any("staff" in role.name.lower() for role in interaction.user.roles):
             return await interaction.response.send_message("You must have a role containing 'staff' to use this command.", ephemeral=True)
@@ -480,116 +668,26 @@ class PirepValidator(commands.Cog):
         await interaction.response.defer(ephemeral=False)
         
         try:
-            # 1. Fetch approved PIREPs on the route
-            matched_pireps = await self.bot.pireps_model.get_approved_pireps_by_route_and_date_range(departure, arrival, timeframe_hours)
-            
-            if not matched_pireps:
-                await interaction.followup.send(f"❌ No approved PIREPs found for route **{departure} ➔ {arrival}** in the last {timeframe_hours} hours.")
+            key = (departure, arrival, timeframe_hours)
+            challenge = self.landing_challenges.get(key)
+            if reset or challenge is None:
+                challenge = LandingChallenge(departure, arrival, timeframe_hours, self.validation_service.landing_engine)
+                self.landing_challenges[key] = challenge
+
+            status_msg = await interaction.followup.send("🔍 Checking for newly approved PIREPs and fetching Infinite Flight landing statistics...")
+
+            # Only pilots with PIREPs approved since the last refresh are re-read
+            stats = await challenge.refresh(self.bot, self.validation_service)
+            logger.info(f"Landing challenge {departure}-{arrival} ({timeframe_hours}h) refresh: {stats}")
+
+            if not challenge.participant_count:
+                await status_msg.edit(content=f"❌ No approved PIREPs found for route **{departure} ➔ {arrival}** in the last {timeframe_hours} hours.")
                 return
-                
-            # 2. Group by pilot
-            pilot_records = {}
-            for p in matched_pireps:
-                pilot_id = p['pilotid']
-                if pilot_id not in pilot_records:
-                    pilot_records[pilot_id] = {
-                        "name": p['pilot_name'],
-                        "callsign": p['callsign'],
-                        "ifuserid": p['ifuserid'],
-                        "ifc": p['ifc'],
-                        "pireps": []
-                    }
-                pilot_records[pilot_id]["pireps"].append(p)
-                
-            status_msg = await interaction.followup.send(f"🔍 Found {len(pilot_records)} unique pilots who participated. Fetching Infinite Flight landing statistics...")
-            
-            leaderboard_data = []
-            
-            for pilot_id, record in pilot_records.items():
-                ifuserid = record["ifuserid"]
-                
-                # Resolve ifuserid if missing
-                if not ifuserid:
-                    dummy_pirep = {"ifuserid": None, "ifc": record["ifc"]}
-                    ifuserid = await self.validation_service.resolve_ifuserid(dummy_pirep)
-                    await asyncio.sleep(2.1)  # Rate limit safety sleep after resolve
-                    
-                if not ifuserid:
-                    logger.warning(f"Could not resolve IF User ID for pilot {record['name']} ({record['callsign']})")
-                    continue
-                    
-                # Fetch recent flights
-                try:
-                    user_flights_data = await self.bot.if_api_manager.get_user_flights(ifuserid, hours=72)
-                    await asyncio.sleep(2.1)  # Rate limit safety sleep after flight fetch
-                except Exception as e:
-                    logger.error(f"API error getting flights for pilot {record['callsign']}: {e}")
-                    continue
-                    
-                if not user_flights_data or not user_flights_data.get('result'):
-                    continue
-                    
-                result_data = user_flights_data['result']
-                user_flights = result_data.get('data', []) if isinstance(result_data, dict) else result_data
-                
-                pilot_landing_scores = []
-                
-                for flight in user_flights:
-                    if not isinstance(flight, dict):
-                        continue
-                    # Match route
-                    if flight.get('originAirport') == departure and flight.get('destinationAirport') == arrival:
-                        landing_stats = flight.get('landingStats', [])
-                        if landing_stats:
-                            # Use the final landing (last in chronological order)
-                            final_landing = landing_stats[-1]
-                            score_data = self.validation_service.calculate_landing_score(final_landing)
-                            if score_data:
-                                pilot_landing_scores.append(score_data)
-                                
-                if pilot_landing_scores:
-                    # Average touchdown statistics and scores
-                    avg_score = sum(s['average'] for s in pilot_landing_scores) / len(pilot_landing_scores)
-                    avg_g = sum(s['g_force'] for s in pilot_landing_scores if s['g_force'] is not None) / len(pilot_landing_scores)
-                    avg_c = sum(s['centerline'] for s in pilot_landing_scores if s['centerline'] is not None) / len(pilot_landing_scores)
-                    avg_d = sum(s['dist_1k'] for s in pilot_landing_scores if s['dist_1k'] is not None) / len(pilot_landing_scores)
-                    avg_v = sum(s['vspeed_fpm'] for s in pilot_landing_scores if s['vspeed_fpm'] is not None) / len(pilot_landing_scores)
-                    
-                    # Generate stars and text label for average score
-                    if avg_score >= 4.75:
-                        stars = "⭐⭐⭐⭐⭐"
-                        rating_text = "Exceptional"
-                    elif avg_score >= 4.25:
-                        stars = "⭐⭐⭐⭐☆"
-                        rating_text = "Excellent"
-                    elif avg_score >= 3.50:
-                        stars = "⭐⭐⭐☆☆"
-                        rating_text = "Good"
-                    elif avg_score >= 2.50:
-                        stars = "⭐⭐☆☆☆"
-                        rating_text = "Acceptable"
-                    else:
-                        stars = "⭐☆☆☆☆"
-                        rating_text = "Needs Improvement"
-                        
-                    leaderboard_data.append({
-                        "name": record["name"],
-                        "callsign": record["callsign"],
-                        "average_score": avg_score,
-                        "stars": stars,
-                        "rating_text": rating_text,
-                        "g_force": avg_g,
-                        "centerline": avg_c,
-                        "dist_1k": avg_d,
-                        "vspeed_fpm": avg_v
-                    })
-                    
+
+            leaderboard_data = challenge.standings()
             if not leaderboard_data:
-                await status_msg.edit(content=f"⚠️ No detailed landing statistics were found in Infinite Flight for any of the {len(pilot_records)} participating pilots.")
+                await status_msg.edit(content=f"⚠️ No detailed landing statistics were found in Infinite Flight for any of the {challenge.participant_count} participating pilots.")
                 return
-                
-            # Sort leaderboard: score desc, vspeed asc (softer is better), g_force asc
-            leaderboard_data.sort(key=lambda x: (-x["average_score"], x["vspeed_fpm"], x["g_force"]))
             
             # Build embed
             embed = discord.Embed(
@@ -604,10 +702,13 @@ class PirepValidator(commands.Cog):
             for rank, entry in enumerate(leaderboard_data, 1):
                 medal = medals[rank - 1] if rank <= 3 else f"`#{rank:02d}`"
                 
+                fpm = f"-{round(entry['vspeed_fpm'])} FPM" if entry['vspeed_fpm'] is not None else "N/A"
+                g_force = f"{entry['g_force']:.2f} G" if entry['g_force'] is not None else "N/A"
+                centerline = f"{entry['centerline']:.1f} m" if entry['centerline'] is not None else "N/A"
                 line = (
                     f"{medal} **{entry['name']} ({entry['callsign']})**\n"
                     f"⭐ **Score:** {entry['stars']} ({entry['average_score']:.2f}/5.00 - {entry['rating_text']})\n"
-                    f"• **FPM:** -{round(entry['vspeed_fpm'])} FPM | **G-Force:** {entry['g_force']:.2f} G | **Centerline:** {entry['centerline']:.1f} m\n"
+                    f"• **FPM:** {fpm} | **G-Force:** {g_force} | **Centerline:** {centerline}\n"
                 )
                 leaderboard_lines.append(line)
                 
@@ -621,7 +722,7 @@ class PirepValidator(commands.Cog):
                     inline=False
                 )
                 
-            embed.set_footer(text=f"Total Participants: {len(leaderboard_data)} | Qatari Virtual Bot")
+            embed.set_footer(text=f"Total Participants: {len(leaderboard_data)} | Landings Scored: {len(challenge.landings)} | Qatari Virtual Bot")
             embed.timestamp = discord.utils.utcnow()
             
             await status_msg.delete()
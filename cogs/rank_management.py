@@ -9,7 +9,9 @@ import os
 # ⚙️ CONFIGURATION
 # =============================================================================
 
-# Load configuration from JSON file
+# Channel and emoji settings from the JSON file. The ranks themselves (names,
+# role IDs, hour thresholds) are read from bot.rank_model, which reloads them
+# when the file changes.
 def load_rank_config():
     config_path = os.path.join(os.path.dirname(__file__), '..', 'assets', 'rank_config.json')
     with open(config_path, 'r') as f:
@@ -18,7 +20,6 @@ def load_rank_config():
 RANK_DATA = load_rank_config()
 ASK_FOR_CARGO_CHANNEL_ID = RANK_DATA['ask_for_cargo_channel_id']
 QATARI_EMOJI = RANK_DATA['qatari_emoji']
-RANK_CONFIG = RANK_DATA['ranks']
 
 # FOOTER TEXTS
 FOOTER_STANDARD = f"Thank you for flying with us! Keep the blue skies in sight and happy landings! {QATARI_EMOJI}"
@@ -162,11 +163,12 @@ class RankSelectView(discord.ui.View):
         self.cog = cog
         self.pilot_data = pilot_data
         self.actual_hours = actual_hours
+        # Built per view so rank edits show up without reloading the cog
+        self.select_callback.options = [
+            discord.SelectOption(label=rank) for rank in cog.bot.rank_model.get_config_ranks()
+        ][:25]
 
-    @discord.ui.select(
-        placeholder="Override: Select the desired rank...",
-        options=[discord.SelectOption(label=rank) for rank in RANK_CONFIG.keys()]
-    )
+    @discord.ui.select(placeholder="Override: Select the desired rank...")
     async def select_callback(self, interaction: discord.Interaction, select: discord.ui.Select):
         selected_rank = select.values[0]
         # Proceed with confirmation
@@ -218,13 +220,8 @@ class RankManagement(commands.Cog):
 
     def _get_rank_from_hours(self, hours: float) -> str:
         """Determines the appropriate rank name based on flight hours."""
-        best_rank = "Cadet"
-        # We assume RANK_CONFIG follows the correct order (Low -> High)
-        # We iterate and if hours >= requirement, we set that as the best rank so far.
-        for rank_name, data in RANK_CONFIG.items():
-            if hours >= data["min_hours"]:
-                best_rank = rank_name
-        return best_rank
+        # Resolved against the shared min_hours ladder in RankModel (bisect, reloads on config change)
+        return self.bot.rank_model.get_config_rank_name(hours) or "Cadet"
 
     async def _manage_roles(self, member: discord.Member, target_rank: str) -> bool:
         """
@@ -235,9 +232,10 @@ class RankManagement(commands.Cog):
             guild = member.guild
             roles_to_remove = []
             roles_to_add = []
+            rank_config = self.bot.rank_model.get_config_ranks()
             
             # 1. Gather all Roles mentioned in config to potentially Remove
-            for r_name, r_data in RANK_CONFIG.items():
+            for r_name, r_data in rank_config.items():
                 rid = r_data["role_id"]
                 if rid != 0:
                     role_obj = guild.get_role(rid)
@@ -252,7 +250,7 @@ class RankManagement(commands.Cog):
                         roles_to_remove.append(c_role)
 
             # 2. Identify the specific roles needed for the Target Rank
-            target_data = RANK_CONFIG.get(target_rank)
+            target_data = rank_config.get(target_rank)
             if target_data:
                 # Add Main Rank Role
                 target_id = target_data["role_id"]
@@ -334,7 +332,7 @@ class RankManagement(commands.Cog):
     #     role_status.append("")
         
     #     # Check all rank roles
-    #     for rank_name, rank_data in RANK_CONFIG.items():
+    #     for rank_name, rank_data in self.bot.rank_model.get_config_ranks().items():
     #         role_id = rank_data["role_id"]
     #         role = guild.get_role(role_id)
             
@@ -1,7 +1,6 @@
 import discord
 from discord import app_commands
 from discord.ext import commands
-import asyncio
 from database.shop_model import ShopModel
 
 class ItemSelect(discord.ui.Select):
@@ -96,32 +95,24 @@ class ConfirmView(discord.ui.View):
             child.disabled = True
         await interaction.response.edit_message(view=self)
 
-        async with self.cog.db_lock:
-            pilot_result = await self.cog.bot.pilots_model.identify_pilot(interaction.user)
-            if not pilot_result['success']:
-                return await interaction.followup.send(pilot_result['error_message'], ephemeral=True)
-            
-            pilot_record = pilot_result['pilot_data']
-            pilot_id, callsign = pilot_record['id'], pilot_record['callsign']
-
-            item = await self.cog.shop_model.get_item(self.item_id)
-            if not item or item['stock'] == 0 or item['shop_name'] != self.shop_name:
-                return await interaction.followup.send("Sorry, this item is not available!", ephemeral=True)
+        pilot_result = await self.cog.bot.pilots_model.identify_pilot(interaction.user)
+        if not pilot_result['success']:
+            return await interaction.followup.send(pilot_result['error_message'], ephemeral=True)
 
-            balance = await self.cog.bot.event_transaction_model.get_balance(pilot_id)
-            if balance < item['price']:
-                return await interaction.followup.send(f"You don't have enough Cookies! You need {item['price']}, but you only have {balance}.", ephemeral=True)
+        pilot_id = pilot_result['pilot_data']['id']
+        result = await self.cog.shop_model.purchase_item(self.item_id, self.shop_name, pilot_id, self.cog.bot.event_transaction_model)
+        item = result['item']
 
-            if not await self.cog.bot.event_transaction_model.add_transaction(pilot_id, -item['price'], f"Shop Purchase: {item['name']}"):
-                return await interaction.followup.send("Transaction failed. Please try again.", ephemeral=True)
-            
-            if item['stock'] != -1 and not await self.cog.shop_model.decrease_item_stock(self.item_id):
-                await self.cog.bot.event_transaction_model.add_transaction(pilot_id, item['price'], f"Shop Refund: {item['name']} (sold out)")
-                return await interaction.followup.send("Item sold out during purchase. Your cookies have been refunded.", ephemeral=True)
+        if not result['success']:
+            if result['error'] == 'unavailable':
+                return await interaction.followup.send("Sorry, this item is not available!", ephemeral=True)
+            if result['error'] == 'insufficient_funds':
+                return await interaction.followup.send(f"You don't have enough Cookies! You need {item['price']}, but you only have {result['balance']}.", ephemeral=True)
+            return await interaction.followup.send("Transaction failed. Please try again.", ephemeral=True)
 
-            await self.cog.log_to_thread(interaction.guild, interaction.user, item)
-            await self.cog.refresh_shop_embed(interaction.guild, item['shop_name'])
-            await interaction.followup.send(f"✅ Purchase successful! You bought **{item['name']}**.", ephemeral=True)
+        await self.cog.log_to_thread(interaction.guild, interaction.user, item)
+        await self.cog.refresh_shop_embed(interaction.guild, item['shop_name'])
+        await interaction.followup.send(f"✅ Purchase successful! You bought **{item['name']}**.", ephemeral=True)
 
     @discord.ui.button(label="Cancel", style=discord.ButtonStyle.danger)
     async def cancel_button(self, interaction: discord.Interaction, button: discord.ui.Button):
@@ -261,7 +252,6 @@ class ShopCog(commands.Cog, name="Shop"):
     def __init__(self, bot):
         self.bot = bot
         self.shop_model = bot.shop_model
-        self.db_lock = asyncio.Lock()
         
     async def cog_load(self):
         """Called when cog is loaded - restore persistent views"""
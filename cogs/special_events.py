@@ -23,6 +23,10 @@ EVENT_CONFIG = {
     "EMBED_COLOR": 0xc41e3a,
 }
 
+PIREP_FEED_NAME = "special_events"
+REWARD_CAP = 10  # PIREP rewards (and cookie log posts) per window, as the old 30-minute pass did
+REWARD_WINDOW = 30 * 60  # seconds
+
 def get_cookie_multiplier(flightnum: str) -> int:
     """Returns cookie multiplier based on flight number (case insensitive, ignores spaces)."""
     normalized = flightnum.replace(" ", "").upper()
@@ -278,25 +282,8 @@ class SpecialEventsCog(commands.Cog):
                 rewards_given = 0
                 
                 for pirep in accepted_pireps:
-                    flightnum = pirep.get('flightnum', '')
-                    cookie_mult = get_cookie_multiplier(flightnum)
-                    
-                    if cookie_mult >= 1:
-                        if await self.bot.event_transaction_model.process_pirep_reward(pirep, self.bot.pilots_model, cookie_mult):
-                            pilot_data = await self.bot.pilots_model.get_pilot_by_id(pirep['pilotid'])
-                            if pilot_data:
-                                flight_time_seconds = pirep.get('flighttime', 0)
-                                multiplier = float(pirep.get('multi', 1) or 1)
-                                raw_flight_time_seconds = flight_time_seconds / multiplier if multiplier > 0 else flight_time_seconds
-                                base_cookies = max(1, int(raw_flight_time_seconds // 60)) if raw_flight_time_seconds else 1
-                                cookie_amount = base_cookies * cookie_mult
-                                
-                                flight_info = {
-                                    'departure': pirep.get('departure', 'Unknown'),
-                                    'arrival': pirep.get('arrival', 'Unknown')
-                                }
-                                await self.log_cookie_transaction(pilot_data, cookie_amount, f"PIREP Reward: #{pirep['pirep_id']} ({cookie_mult}x)", flight_info=flight_info)
-                                rewards_given += 1
+                    if await self._reward_pirep(pirep):
+                        rewards_given += 1
                                 
                 await interaction.followup.send(f"✅ PIREP polling complete! Awarded {rewards_given} Christmas PIREP rewards.", ephemeral=True)
                 
@@ -340,47 +327,65 @@ class SpecialEventsCog(commands.Cog):
             
         await interaction.response.send_message("\n".join(message_parts), ephemeral=True)
 
-    @tasks.loop(minutes=30)
-    async def pirep_checker(self):
-        if not self.tasks_started:
-            return
+    async def _reward_pirep(self, pirep: dict) -> bool:
+        flightnum = pirep.get('flightnum', '') or ''
+        cookie_mult = get_cookie_multiplier(flightnum)
+        if cookie_mult < 1:
+            return False
+
+        rewarded = await self.bot.event_transaction_model.process_pirep_reward(pirep, self.bot.pilots_model, cookie_mult)
+        if rewarded is None:
+            raise RuntimeError(f"Reward for PIREP #{pirep['pirep_id']} could not be recorded")
+        if not rewarded:
+            return False
+
+        pilot_data = await self.bot.pilots_model.get_pilot_by_id(pirep['pilotid'])
+        if pilot_data:
+            flight_time_seconds = pirep.get('flighttime', 0)
+            multiplier = float(pirep.get('multi', 1) or 1)
+            raw_flight_time_seconds = flight_time_seconds / multiplier if multiplier > 0 else flight_time_seconds
+            base_cookies = max(1, int(raw_flight_time_seconds // 60)) if raw_flight_time_seconds else 1
+            cookie_amount = base_cookies * cookie_mult
             
-        try:
-            accepted_pireps = await self.bot.pireps_model.get_accepted_pireps()
-            if not accepted_pireps:
-                return
-        except Exception as e:
-            logger.error(f"Error in pirep_checker: {e}")
-            return
+            flight_info = {
+                'departure': pirep.get('departure', 'Unknown'),
+                'arrival': pirep.get('arrival', 'Unknown')
+            }
+            await self.log_cookie_transaction(pilot_data, cookie_amount, f"PIREP Reward: #{pirep['pirep_id']} ({cookie_mult}x)", flight_info=flight_info)
+        return True
+
+    @tasks.loop(count=1)
+    async def pirep_checker(self):
+        # Consumes newly accepted PIREPs from the shared PIREP change feed.
+        # Delivery is at-least-once; process_pirep_reward's duplicate check keeps rewards idempotent.
+        # Failed rewards are nacked so the feed redelivers them. At most REWARD_CAP rewards
+        # are given per REWARD_WINDOW; the rest wait in the queue for the next window.
+        await self.bot.wait_until_ready()
+        queue = await self.bot.pirep_feed_service.subscribe(PIREP_FEED_NAME)
+        feed = self.bot.pirep_feed_service
+        loop = asyncio.get_running_loop()
+        window_start, rewards_in_window = loop.time(), 0
         
-        processed_count = 0
-        for pirep in accepted_pireps:
+        while self.tasks_started:
+            if loop.time() - window_start >= REWARD_WINDOW:
+                window_start, rewards_in_window = loop.time(), 0
+            elif rewards_in_window >= REWARD_CAP:
+                await asyncio.sleep(window_start + REWARD_WINDOW - loop.time())
+                continue
+
+            pirep = await queue.get()
             try:
-                flightnum = pirep.get('flightnum', '')
-                cookie_mult = get_cookie_multiplier(flightnum)
-                
-                if cookie_mult >= 1:
-                    if await self.bot.event_transaction_model.process_pirep_reward(pirep, self.bot.pilots_model, cookie_mult):
-                        pilot_data = await self.bot.pilots_model.get_pilot_by_id(pirep['pilotid'])
-                        if pilot_data:
-                            flight_time_seconds = pirep.get('flighttime', 0)
-                            multiplier = float(pirep.get('multi', 1) or 1)
-                            raw_flight_time_seconds = flight_time_seconds / multiplier if multiplier > 0 else flight_time_seconds
-                            base_cookies = max(1, int(raw_flight_time_seconds // 60)) if raw_flight_time_seconds else 1
-                            cookie_amount = base_cookies * cookie_mult
-                            
-                            flight_info = {
-                                'departure': pirep.get('departure', 'Unknown'),
-                                'arrival': pirep.get('arrival', 'Unknown')
-                            }
-                            await self.log_cookie_transaction(pilot_data, cookie_amount, f"PIREP Reward: #{pirep['pirep_id']} ({cookie_mult}x)", flight_info=flight_info)
-                            processed_count += 1
-                            
-                if processed_count >= 10:
-                    break
+                if await self._reward_pirep(pirep):
+                    rewards_in_window += 1
             except Exception as e:
                 logger.error(f"Error processing pirep {pirep.get('pirep_id', 'unknown')}: {e}")
-                continue
+                await feed.nack(PIREP_FEED_NAME, pirep, str(e))
+            else:
+                await feed.ack(PIREP_FEED_NAME, pirep['pirep_id'])
+
+    @pirep_checker.after_loop
+    async def after_pirep_checker(self):
+        self.bot.pirep_feed_service.unsubscribe(PIREP_FEED_NAME)
 
     @tasks.loop(count=1)
     async def cookie_drop_scheduler(self):
@@ -7,7 +7,8 @@ class EventTransactionModel:
         self.event_name = event_name
         self.currency_name = currency_name
 
-    async def get_balance(self, pilot_id: int) -> int:
+    async def get_balance(self, pilot_id: int, tx=None) -> int:
+        # Pass tx (a DatabaseManager Transaction) to read inside an open transaction
         # V3 Logic: PIREPs from V3 only + All other Cookie transactions (drops, admin, shop) excluding old system corrections
         query = """SELECT COALESCE(SUM(amount), 0) AS balance 
                    FROM event_transactions 
@@ -15,13 +16,14 @@ class EventTransactionModel:
                        (event_name = %s) OR
                        (event_name != %s AND reason NOT LIKE %s AND reason NOT LIKE %s AND reason NOT LIKE %s AND reason NOT LIKE %s)
                    )"""
-        result = await self.db.fetch_one(query, (pilot_id, self.currency_name, self.event_name, self.event_name, '%PIREP%', 'Nuclear Reset%', 'Multiplier Fix%', 'test%'))
+        result = await (tx or self.db).fetch_one(query, (pilot_id, self.currency_name, self.event_name, self.event_name, '%PIREP%', 'Nuclear Reset%', 'Multiplier Fix%', 'test%'))
         return int(result['balance']) if result else 0
 
-    async def add_transaction(self, pilot_id: int, amount: int, reason: str) -> bool:
+    async def add_transaction(self, pilot_id: int, amount: int, reason: str, tx=None) -> bool:
         query = "INSERT INTO event_transactions (pilot_id, event_name, currency_name, amount, reason) VALUES (%s, %s, %s, %s, %s)"
         args = (pilot_id, self.event_name, self.currency_name, amount, reason)
-        return await self.db.execute(query, args) is not None
+        # execute() returns the row count, 0 when the write failed
+        return bool(await (tx or self.db).execute(query, args))
 
     async def check_duplicate(self, pilot_id: int, reason_pattern: str) -> bool:
         query = "SELECT id FROM event_transactions WHERE pilot_id = %s AND event_name = %s AND reason LIKE %s"
@@ -68,7 +70,11 @@ class EventTransactionModel:
                    ORDER BY transaction_date DESC LIMIT 1"""
         return await self.db.fetch_one(query, (pilot_id, reason_pattern))
 
-    async def process_pirep_reward(self, pirep_data: Dict, pilots_model, cookie_multiplier: int) -> bool:
+    async def process_pirep_reward(self, pirep_data: Dict, pilots_model, cookie_multiplier: int) -> Optional[bool]:
+        """
+        True if the reward was recorded, False if there is nothing to reward
+        (already rewarded, unknown pilot), None if the write failed.
+        """
         pirep_id = pirep_data['pirep_id']
         pilot_id = pirep_data['pilotid']
         flight_time_seconds = pirep_data.get('flighttime', 0)
@@ -91,7 +97,9 @@ class EventTransactionModel:
         if not pilot_data:
             return False
             
-        return await self.add_transaction(pilot_id, final_cookie_amount, reason)
+        if not await self.add_transaction(pilot_id, final_cookie_amount, reason):
+            return None
+        return True
 
     async def get_candy_balance_report(self) -> List[Dict]:
         """Get candy balance for all members minus candy drops after Nov 1, 2025"""
@@ -6,6 +6,7 @@ Enables persistent storage of flight board data for better recovery and performa
 
 Tables:
 - flight_board: Main flight records
+- route_map_urls: Discord CDN URL of the uploaded route map per route
 
 Route lookup is done dynamically using flight_num:
 - First tries routes_model (CC routes)
@@ -291,6 +292,46 @@ class FlightBoardModel:
         except:
             return 0
     
+    # =========================================================================
+    # ROUTE MAP URLS
+    # =========================================================================
+
+    async def get_route_map_url(self, departure: str, arrival: str, style_version: int) -> Optional[Dict]:
+        """Get the stored CDN URL (with expiry and the message it was uploaded with) of a route's map image."""
+        query = """
+            SELECT url, expires_at, channel_id, message_id FROM route_map_urls
+            WHERE departure = %s AND arrival = %s AND style_version = %s
+        """
+        return await self.db.fetch_one(query, (departure, arrival, style_version))
+
+    async def save_route_map_url(self, departure: str, arrival: str, style_version: int, url: str,
+                                 channel_id: int, message_id: int, expires_at: Optional[datetime] = None) -> bool:
+        """Store (or replace) the CDN URL of a route's map image and the message that carries it."""
+        query = """
+            INSERT INTO route_map_urls (departure, arrival, style_version, url, channel_id, message_id, expires_at, updated_at)
+            VALUES (%s, %s, %s, %s, %s, %s, %s, UTC_TIMESTAMP())
+            ON DUPLICATE KEY UPDATE url = VALUES(url), channel_id = VALUES(channel_id), message_id = VALUES(message_id),
+                                    expires_at = VALUES(expires_at), updated_at = UTC_TIMESTAMP()
+        """
+        return bool(await self.db.execute(
+            query, (departure, arrival, style_version, url, channel_id, message_id, expires_at)
+        ))
+
+    async def get_recent_map_routes(self, limit: int = 20) -> List[Dict]:
+        """(departure, arrival) of the routes whose maps were most recently uploaded to the board, any style version."""
+        query = """
+            SELECT departure, arrival, MAX(updated_at) AS last_uploaded FROM route_map_urls
+            GROUP BY departure, arrival
+            ORDER BY last_uploaded DESC
+            LIMIT %s
+        """
+        return await self.db.fetch_all(query, (limit,))
+
+    async def delete_route_map_url(self, departure: str, arrival: str, style_version: int) -> bool:
+        """Forget a route's map URL (e.g. the message it was uploaded with was deleted)."""
+        query = "DELETE FROM route_map_urls WHERE departure = %s AND arrival = %s AND style_version = %s"
+        return bool(await self.db.execute(query, (departure, arrival, style_version)))
+
     # =========================================================================
     # STATISTICS
     # =========================================================================
@@ -345,4 +386,24 @@ CREATE TABLE IF NOT EXISTS flight_board (
     FOREIGN KEY (pilot_id) REFERENCES pilots(id) ON DELETE CASCADE,
     FOREIGN KEY (aircraft_id) REFERENCES aircraft(id) ON DELETE SET NULL
 );
+
+-- ==============================================================================
+-- ROUTE MAP URLS TABLE
+-- ==============================================================================
+-- CDN URL of the first uploaded route map per route, reused by later boards
+-- until Discord's signed URL expires (expires_at, UTC) or the message it was
+-- uploaded with (channel_id, message_id) is deleted
+
+CREATE TABLE IF NOT EXISTS route_map_urls (
+    departure                       VARCHAR(4) NOT NULL,
+    arrival                         VARCHAR(4) NOT NULL,
+    style_version                   INT NOT NULL,
+    url                             VARCHAR(1000) NOT NULL,
+    channel_id                      BIGINT NULL,
+    message_id                      BIGINT NULL,
+    expires_at                      DATETIME NULL,
+    updated_at                      DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
+
+    PRIMARY KEY (departure, arrival, style_version)
+);
 """
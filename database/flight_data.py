@@ -6,7 +6,9 @@ from datetime import datetime, timedelta
 from typing import Optional
 
 class FlightData:
-    def __init__(self):
+    def __init__(self, rank_model=None):
+        # Shared RankModel; when given, rank thresholds come from its in-memory ladder
+        self.rank_model = rank_model
         self.airports_db = None
         self._load_airport_data()
         self._load_configuration()
@@ -139,6 +141,8 @@ class FlightData:
 
     def get_rank_from_hours(self, total_hours: float) -> str:
         """Get pilot rank based on flight hours"""
+        if self.rank_model is not None:
+            return self.rank_model.get_config_rank_name(total_hours) or "Cadet"
         if not self.RANK_CONFIG or 'ranks' not in self.RANK_CONFIG:
             return "Cadet"
         
@@ -0,0 +1,237 @@
+"""
+Flight Log Database Models
+
+Local copy of Infinite Flight flight logs for VA pilots.
+
+The IF API only returns the most recent page of a user's flights, so every
+validation, history lookup and landing challenge used to re-download the same
+data. Flights are stored here keyed by their IF flight ID, which keeps them
+available after they drop off the API page.
+
+Tables:
+- if_flight_logs: One row per IF flight (route, times, aircraft, landing stats)
+- if_flight_sync_state: Last successful sync per IF user
+"""
+
+from typing import Optional, Dict, List
+from datetime import datetime
+import json
+import logging
+from .manager import DatabaseManager
+
+logger = logging.getLogger('oryxie.flight_log_model')
+
+
+class FlightLogModel:
+    """
+    Handles operations related to stored Infinite Flight flight logs.
+    Rows are returned in the same shape as the IF API flight objects
+    (originAirport, destinationAirport, created, totalTime, landingStats, ...)
+    so callers can use them interchangeably.
+    """
+
+    def __init__(self, db_manager: DatabaseManager):
+        self.db = db_manager
+
+    # =========================================================================
+    # WRITE OPERATIONS
+    # =========================================================================
+
+    async def upsert_flights(self, rows: List[Dict]) -> int:
+        """
+        Insert or update flight log rows in a single statement.
+
+        Args:
+            rows: Normalized flight rows with keys matching the table columns
+                (if_flight_id, if_user_id, origin, destination, created_at, ...)
+
+        Returns:
+            int: Number of rows written
+        """
+        if not rows:
+            return 0
+
+        columns = (
+            "if_flight_id", "if_user_id", "callsign", "origin", "destination",
+            "created_at", "total_time", "aircraft_id", "livery_id", "server",
+            "landing_count", "violations", "landing_stats"
+        )
+        row_placeholder = "(" + ", ".join(["%s"] * len(columns) + ["UTC_TIMESTAMP()"]) + ")"
+        updates = ", ".join(f"{col} = VALUES({col})" for col in columns if col != "if_flight_id")
+
+        query = f"""
+            INSERT INTO if_flight_logs ({", ".join(columns)}, synced_at)
+            VALUES {", ".join([row_placeholder] * len(rows))}
+            ON DUPLICATE KEY UPDATE {updates}, synced_at = UTC_TIMESTAMP()
+        """
+        args = []
+        for row in rows:
+            landing_stats = row.get("landing_stats")
+            args.extend([
+                row["if_flight_id"], row["if_user_id"], row.get("callsign"),
+                row.get("origin"), row.get("destination"), row.get("created_at"),
+                row.get("total_time"), row.get("aircraft_id"), row.get("livery_id"),
+                row.get("server"), row.get("landing_count"), row.get("violations"),
+                json.dumps(landing_stats) if landing_stats is not None else None
+            ])
+
+        rowcount = await self.db.execute(query, tuple(args))
+        if not rowcount:
+            logger.error(f"Failed to upsert {len(rows)} flight logs")
+            return 0
+        return len(rows)
+
+    async def mark_user_synced(self, if_user_id: str, flight_count: int) -> None:
+        """Record a successful API sync for an IF user."""
+        query = """
+            INSERT INTO if_flight_sync_state (if_user_id, last_synced_at, flight_count)
+            VALUES (%s, UTC_TIMESTAMP(), %s)
+            ON DUPLICATE KEY UPDATE last_synced_at = UTC_TIMESTAMP(), flight_count = VALUES(flight_count)
+        """
+        await self.db.execute(query, (if_user_id, flight_count))
+
+    # =========================================================================
+    # READ OPERATIONS
+    # =========================================================================
+
+    async def get_last_sync(self, if_user_id: str) -> Optional[datetime]:
+        """Get the UTC time of the last successful sync for an IF user (naive)."""
+        query = "SELECT last_synced_at FROM if_flight_sync_state WHERE if_user_id = %s"
+        result = await self.db.fetch_one(query, (if_user_id,))
+        return result['last_synced_at'] if result else None
+
+    async def get_user_flights(
+        self,
+        if_user_id: str,
+        since: datetime = None,
+        until: datetime = None,
+        departure: str = None,
+        arrival: str = None,
+        limit: int = 100
+    ) -> List[Dict]:
+        """
+        Get stored flights for an IF user, newest first.
+
+        Args:
+            if_user_id: Infinite Flight user ID
+            since: Only flights created at or after this UTC time
+            until: Only flights created at or before this UTC time
+            departure: Optional origin ICAO filter
+            arrival: Optional destination ICAO filter
+            limit: Maximum number of flights to return
+
+        Returns:
+            List of flights in IF API format
+        """
+        conditions = ["if_user_id = %s"]
+        args = [if_user_id]
+
+        if since is not None:
+            conditions.append("created_at >= %s")
+            args.append(since)
+        if until is not None:
+            conditions.append("created_at <= %s")
+            args.append(until)
+        if departure:
+            conditions.append("origin = %s")
+            args.append(departure)
+        if arrival:
+            conditions.append("destination = %s")
+            args.append(arrival)
+
+        query = f"""
+            SELECT * FROM if_flight_logs
+            WHERE {" AND ".join(conditions)}
+            ORDER BY created_at DESC
+            LIMIT %s
+        """
+        args.append(limit)
+
+        rows = await self.db.fetch_all(query, tuple(args))
+        return [self._row_to_flight(row) for row in rows or []]
+
+    async def get_flight_by_id(self, if_flight_id: str) -> Optional[Dict]:
+        """Get a single stored flight by its IF flight ID."""
+        query = "SELECT * FROM if_flight_logs WHERE if_flight_id = %s"
+        row = await self.db.fetch_one(query, (if_flight_id,))
+        return self._row_to_flight(row) if row else None
+
+    async def get_flight_count(self) -> int:
+        """Get total number of stored flights."""
+        query = "SELECT COUNT(*) as count FROM if_flight_logs"
+        result = await self.db.fetch_one(query)
+        return result['count'] if result else 0
+
+    # =========================================================================
+    # HELPERS
+    # =========================================================================
+
+    def _row_to_flight(self, row: Dict) -> Dict:
+        """Convert a table row back into the IF API flight shape."""
+        created_at = row.get('created_at')
+        landing_stats = []
+        if row.get('landing_stats'):
+            try:
+                landing_stats = json.loads(row['landing_stats'])
+            except (TypeError, ValueError):
+                logger.warning(f"Invalid landing_stats JSON for flight {row.get('if_flight_id')}")
+
+        return {
+            "id": row['if_flight_id'],
+            "userId": row['if_user_id'],
+            "callsign": row.get('callsign'),
+            "originAirport": row.get('origin'),
+            "destinationAirport": row.get('destination'),
+            "created": created_at.strftime('%Y-%m-%dT%H:%M:%S.%fZ') if created_at else None,
+            "totalTime": row.get('total_time'),
+            "aircraftId": row.get('aircraft_id'),
+            "liveryId": row.get('livery_id'),
+            "server": row.get('server'),
+            "landingCount": row.get('landing_count'),
+            "violations": row.get('violations'),
+            "landingStats": landing_stats,
+        }
+
+
+# ==============================================================================
+# SQL SCHEMA DEFINITION
+# ==============================================================================
+
+FLIGHT_LOG_SCHEMA = """
+-- ==============================================================================
+-- IF FLIGHT LOGS TABLE
+-- ==============================================================================
+-- One row per Infinite Flight flight, keyed by the IF flight ID.
+-- created_at is stored as naive UTC.
+
+CREATE TABLE IF NOT EXISTS if_flight_logs (
+    if_flight_id                    VARCHAR(36) PRIMARY KEY,
+    if_user_id                      VARCHAR(36) NOT NULL,
+    callsign                        VARCHAR(50),
+    origin                          VARCHAR(10),
+    destination                     VARCHAR(10),
+    created_at                      DATETIME(6),
+    total_time                      DOUBLE,
+    aircraft_id                     VARCHAR(36),
+    livery_id                       VARCHAR(36),
+    server                          VARCHAR(50),
+    landing_count                   INT,
+    violations                      INT,
+    landing_stats                   TEXT,
+    synced_at                       DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
+
+    INDEX idx_user_created (if_user_id, created_at),
+    INDEX idx_route_created (origin, destination, created_at)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
+
+-- ==============================================================================
+-- IF FLIGHT SYNC STATE TABLE
+-- ==============================================================================
+-- Last successful API sync per IF user, used to decide when to refresh.
+
+CREATE TABLE IF NOT EXISTS if_flight_sync_state (
+    if_user_id                      VARCHAR(36) PRIMARY KEY,
+    last_synced_at                  DATETIME NOT NULL,
+    flight_count                    INT NOT NULL DEFAULT 0
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
+"""
@@ -1,11 +1,96 @@
 import os
+import random
 import aiomysql
 import asyncio
+from contextlib import asynccontextmanager
 from dotenv import load_dotenv
 
 load_dotenv()
 
+# MySQL error codes worth retrying the whole transaction for
+DEADLOCK_ERRORS = (1213, 1205)  # ER_LOCK_DEADLOCK, ER_LOCK_WAIT_TIMEOUT
+# Client error codes meaning this connection is unusable (server gone away, lost connection, ...)
+CONNECTION_ERRORS = (2003, 2006, 2013, 2055)
+
+
+def _env_number(name: str, default, cast=int):
+    try:
+        return cast(os.getenv(name, default))
+    except (TypeError, ValueError):
+        print(f"Invalid value for {name}; using {default}")
+        return default
+
+
+def _is_connection_error(e: Exception) -> bool:
+    if isinstance(e, aiomysql.InterfaceError):
+        return True
+    return isinstance(e, aiomysql.OperationalError) and bool(e.args) and e.args[0] in CONNECTION_ERRORS
+
+
+async def _run_query(conn, query: str, args: tuple, fetch_type: str):
+    async with conn.cursor() as cursor:
+        await cursor.execute(query, args)
+        if fetch_type == 'one':
+            return await cursor.fetchone()
+        elif fetch_type == 'all':
+            return await cursor.fetchall()
+        elif fetch_type == 'insert':
+            return cursor.lastrowid
+        return cursor.rowcount
+
+
+class Transaction:
+    """
+    Queries bound to one pinned connection inside DatabaseManager.transaction().
+    Same methods as DatabaseManager, but errors are raised (so the transaction
+    rolls back) instead of being swallowed.
+    """
+
+    def __init__(self, conn):
+        self.conn = conn
+        self._savepoints = 0
+
+    async def _run(self, query: str, args: tuple, fetch_type: str):
+        return await _run_query(self.conn, query, args, fetch_type)
+
+    async def fetch_one(self, query: str, args: tuple = None):
+        return await self._run(query, args, 'one')
+
+    async def fetch_all(self, query: str, args: tuple = None):
+        return await self._run(query, args, 'all')
+
+    async def execute(self, query: str, args: tuple = None):
+        return await self._run(query, args, 'none')
+
+    async def insert(self, query: str, args: tuple = None):
+        return await self._run(query, args, 'insert')
+
+    @asynccontextmanager
+    async def savepoint(self):
+        """Nested unit of work: an exception inside rolls back to the savepoint and is re-raised."""
+        self._savepoints += 1
+        name = f"sp_{self._savepoints}"
+        await self.execute(f"SAVEPOINT {name}")
+        try:
+            yield self
+        except BaseException:
+            await self.execute(f"ROLLBACK TO SAVEPOINT {name}")
+            raise
+        else:
+            await self.execute(f"RELEASE SAVEPOINT {name}")
+
+
 class DatabaseManager:
+    """
+    aiomysql pool wrapper. Pool size and timeouts come from the environment:
+    DB_POOL_MIN, DB_POOL_MAX, DB_POOL_RECYCLE (seconds before a connection is
+    replaced), DB_ACQUIRE_TIMEOUT and DB_PING_IDLE (connections idle longer
+    than this are pinged before reuse).
+
+    A broken connection is closed and dropped on its own; the rest of the pool
+    keeps serving other queries.
+    """
+
     def __init__(self, bot):
         self.bot = bot
         self._pool = None 
@@ -18,6 +103,11 @@ class DatabaseManager:
             "charset": "utf8mb4",
             "cursorclass": aiomysql.DictCursor
         }
+        self.pool_min = _env_number("DB_POOL_MIN", 1)
+        self.pool_max = max(self.pool_min, _env_number("DB_POOL_MAX", 10))
+        self.pool_recycle = _env_number("DB_POOL_RECYCLE", 3600)
+        self.acquire_timeout = _env_number("DB_ACQUIRE_TIMEOUT", 10.0, float)
+        self.ping_idle = _env_number("DB_PING_IDLE", 60.0, float)
         self._lock = asyncio.Lock()
 
     async def connect(self):
@@ -27,11 +117,12 @@ class DatabaseManager:
                 try:
                     self._pool = await aiomysql.create_pool(
                         **self._db_config,
-                        minsize=1,
-                        maxsize=10,
+                        minsize=self.pool_min,
+                        maxsize=self.pool_max,
+                        pool_recycle=self.pool_recycle,
                         connect_timeout=10 
                     )
-                    print("MySQL connection pool created successfully!")
+                    print(f"MySQL connection pool created successfully! (size {self.pool_min}-{self.pool_max})")
                 except Exception as e:
                     print(f"CRITICAL: Failed to connect to MySQL: {e}")
                     self._pool = None
@@ -50,41 +141,67 @@ class DatabaseManager:
             await self.connect()
         return self._pool
 
+    async def _checkout(self, pool):
+        """Acquire a connection, pinging it first if it has been idle; dead ones are dropped."""
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.acquire_timeout
+        while True:
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                raise asyncio.TimeoutError()
+            conn = await asyncio.wait_for(pool.acquire(), timeout=remaining)
+            last_usage = getattr(conn, 'last_usage', None)
+            if last_usage is None or loop.time() - last_usage < self.ping_idle:
+                return conn
+            try:
+                await conn.ping(reconnect=False)
+                return conn
+            except Exception as e:
+                print(f"Discarding stale MySQL connection: {e}")
+                conn.close()
+                pool.release(conn)
+
+    @asynccontextmanager
+    async def _connection(self):
+        """
+        Check out one healthy connection. If the block fails because the
+        connection itself broke, only that connection is closed and discarded.
+        """
+        pool = await self._get_pool()
+        if not pool:
+            raise RuntimeError("Database pool is not available")
+        conn = await self._checkout(pool)
+        try:
+            yield conn
+        except Exception as e:
+            if _is_connection_error(e):
+                conn.close()
+            raise
+        finally:
+            pool.release(conn)
+
     async def _execute_query(self, query: str, args: tuple = None, fetch_type: str = 'none'):
         """
         The central workhorse method for all database operations.
-        Includes reconnection and retry logic.
+        A query that fails because its connection broke is retried once on a fresh connection.
         fetch_type can be 'one', 'all', 'insert', or 'none'.
         """
         for attempt in range(2):
             try:
-                pool = await self._get_pool()
-                if not pool:
-                    print("Error: Database pool is not available.")
-                    return None if fetch_type in ['one', 'insert'] else [] if fetch_type == 'all' else 0
-
-                async with pool.acquire() as conn:
-                    async with conn.cursor() as cursor:
-                        await cursor.execute(query, args)
-                        
-                        if fetch_type == 'one':
-                            return await cursor.fetchone()
-                        elif fetch_type == 'all':
-                            return await cursor.fetchall()
-                        elif fetch_type == 'insert':
-                            return cursor.lastrowid
-                        else:
-                            return cursor.rowcount
-
-            except aiomysql.OperationalError as e:
-                print(f"OperationalError on attempt {attempt + 1}: {e}. Query: {query}")
-                if attempt == 0:
-                    print("Closing stale pool and attempting to reconnect...")
-                    await self.close()
-                    await asyncio.sleep(1) 
-                    continue 
-                else:
-                    print("Failed to execute query after reconnecting. The database might be down.")
+                async with self._connection() as conn:
+                    return await _run_query(conn, query, args, fetch_type)
+
+            except (aiomysql.OperationalError, aiomysql.InterfaceError) as e:
+                print(f"{type(e).__name__} on attempt {attempt + 1}: {e}. Query: {query}")
+                if attempt == 0 and _is_connection_error(e):
+                    print("Dropped the broken connection; retrying on a fresh one...")
+                    continue
+                if attempt > 0:
+                    print("Failed to execute query on a fresh connection. The database might be down.")
+                break
+            except asyncio.TimeoutError:
+                print(f"Timed out after {self.acquire_timeout}s waiting for a database connection. Query: {query}")
+                break
             except Exception as e:
                 print(f"An unexpected database error occurred: {e} - Query: {query} Args: {args}")
                 break
@@ -105,4 +222,70 @@ class DatabaseManager:
 
     async def insert(self, query: str, args: tuple = None):
         """Executes an INSERT query and returns the last inserted ID."""
-        return await self._execute_query(query, args, fetch_type='insert')
\ No newline at end of file
+        return await self._execute_query(query, args, fetch_type='insert')
+
+    @asynccontextmanager
+    async def transaction(self):
+        """
+        Pins one pooled connection for a multi-statement transaction.
+
+            async with db.transaction() as tx:
+                row = await tx.fetch_one("SELECT ... FOR UPDATE", (...))
+                await tx.execute("UPDATE ...", (...))
+
+        Commits when the block exits normally and rolls back on any exception,
+        which is re-raised. Use run_transaction() to also retry on deadlock.
+        """
+        async with self._connection() as conn:
+            await conn.begin()
+            try:
+                yield Transaction(conn)
+            except BaseException:
+                try:
+                    await conn.rollback()
+                except Exception as e:
+                    print(f"Rollback failed, discarding connection: {e}")
+                    conn.close()
+                raise
+            else:
+                await conn.commit()
+
+    async def run_transaction(self, func, retries: int = 3):
+        """
+        Runs ``await func(tx)`` inside transaction() and returns its result.
+        The whole function is re-run (with a short backoff) if MySQL reports a
+        deadlock or lock wait timeout; other errors are raised.
+        """
+        for attempt in range(retries):
+            try:
+                async with self.transaction() as tx:
+                    return await func(tx)
+            except (aiomysql.OperationalError, aiomysql.InternalError) as e:
+                code = e.args[0] if e.args else None
+                if code not in DEADLOCK_ERRORS or attempt == retries - 1:
+                    raise
+                delay = 0.05 * (2 ** attempt) + random.uniform(0, 0.05)
+                print(f"Transaction hit lock error {code} on attempt {attempt + 1}; retrying in {delay:.2f}s")
+                await asyncio.sleep(delay)
+
+    async def execute_many(self, statements: list):
+        """
+        Executes several write statements in a single transaction.
+
+        Args:
+            statements: List of (query, args) tuples, run in order.
+
+        Returns:
+            List of row counts (one per statement), or None if the transaction was rolled back.
+        """
+        if not statements:
+            return []
+
+        async def run(tx):
+            return [await tx.execute(query, args) for query, args in statements]
+
+        try:
+            return await self.run_transaction(run)
+        except Exception as e:
+            print(f"Transaction rolled back: {e} - Statements: {[q for q, _ in statements]}")
+            return None
@@ -354,6 +354,27 @@ class PilotsModel:
         query = "SELECT id, callsign, name, discordid, status FROM pilots"
         return await self.db.fetch_all(query)
 
+    async def get_recently_active_pilots(self, days: int = 7) -> list:
+        """
+        Retrieves active pilots with a known IF user ID who filed a PIREP in the last X days.
+
+        Args:
+            days: Look-back window in days.
+
+        Returns:
+            A list of dicts with id, callsign and ifuserid.
+        """
+        query = """
+            SELECT DISTINCT pi.id, pi.callsign, pi.ifuserid
+            FROM pilots AS pi
+            INNER JOIN pireps AS p ON p.pilotid = pi.id
+            WHERE pi.status = 1
+              AND pi.ifuserid IS NOT NULL AND pi.ifuserid != ''
+              AND p.date >= DATE_SUB(CURDATE(), INTERVAL %s DAY)
+        """
+        args = (days,)
+        return await self.db.fetch_all(query, args)
+
     async def update_pilot_status(self, pilot_id: int, status: int) -> int:
         """
         Updates the status for a pilot with a given ID.
@@ -0,0 +1,61 @@
+"""
+PIREP Feed Database Models
+
+Persists the per-subscriber cursor of the PIREP change feed.
+
+Tables:
+- pirep_feed_cursors: Highest pireps.id each subscriber has fully processed
+"""
+
+from typing import Optional
+import logging
+from .manager import DatabaseManager
+
+logger = logging.getLogger('oryxie.pirep_feed_model')
+
+
+class PirepFeedModel:
+    """
+    Handles the high-water marks used by services.pirep_feed_service.
+    A cursor of N means every PIREP with id <= N that the subscriber cares
+    about has been delivered and acknowledged.
+    """
+
+    def __init__(self, db_manager: DatabaseManager):
+        self.db = db_manager
+
+    async def get_cursor(self, subscriber: str) -> Optional[int]:
+        """Get the stored cursor for a subscriber, or None if it never acknowledged anything."""
+        query = "SELECT last_id FROM pirep_feed_cursors WHERE subscriber = %s"
+        result = await self.db.fetch_one(query, (subscriber,))
+        return result['last_id'] if result else None
+
+    async def set_cursor(self, subscriber: str, last_id: int) -> bool:
+        """Store a subscriber's cursor."""
+        query = """
+            INSERT INTO pirep_feed_cursors (subscriber, last_id, updated_at)
+            VALUES (%s, %s, UTC_TIMESTAMP())
+            ON DUPLICATE KEY UPDATE last_id = VALUES(last_id), updated_at = UTC_TIMESTAMP()
+        """
+        result = await self.db.execute(query, (subscriber, last_id))
+        if not result:
+            logger.error(f"Failed to persist PIREP feed cursor {last_id} for {subscriber}")
+        return bool(result)
+
+
+# ==============================================================================
+# SQL SCHEMA DEFINITION
+# ==============================================================================
+
+PIREP_FEED_SCHEMA = """
+-- ==============================================================================
+-- PIREP FEED CURSORS TABLE
+-- ==============================================================================
+-- One row per PIREP change-feed subscriber (e.g. special_events, hajj_operations)
+
+CREATE TABLE IF NOT EXISTS pirep_feed_cursors (
+    subscriber                      VARCHAR(64) PRIMARY KEY,
+    last_id                         INT NOT NULL DEFAULT 0,
+    updated_at                      DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
+"""
@@ -0,0 +1,152 @@
+"""
+PIREP Submission Database Models
+
+Persists outbound Crew Center PIREP submissions so they survive restarts
+and cannot be filed twice.
+
+Tables:
+- pirep_submissions: One row per idempotency key with payload, state and retry info
+"""
+
+from datetime import datetime
+from typing import Dict, List, Optional
+import json
+import logging
+from .manager import DatabaseManager
+
+logger = logging.getLogger('oryxie.pirep_submission_model')
+
+STATUS_PENDING = 'pending'
+STATUS_SENT = 'sent'
+STATUS_FAILED = 'failed'
+
+
+class PirepSubmissionModel:
+    """
+    Backlog for services.pirep_submission_queue.
+    A row is written before the first send attempt and moves to 'sent' or
+    'failed'; 'pending' rows are retried until then.
+    """
+
+    def __init__(self, db_manager: DatabaseManager):
+        self.db = db_manager
+
+    @staticmethod
+    def _decode(row: Optional[Dict]) -> Optional[Dict]:
+        if not row:
+            return None
+        row = dict(row)
+        for field in ('payload', 'response'):
+            if row.get(field):
+                try:
+                    row[field] = json.loads(row[field])
+                except (TypeError, ValueError):
+                    row[field] = None
+        return row
+
+    async def get_submission(self, idempotency_key: str) -> Optional[Dict]:
+        """Get a submission by key, with payload/response decoded."""
+        query = "SELECT * FROM pirep_submissions WHERE idempotency_key = %s"
+        return self._decode(await self.db.fetch_one(query, (idempotency_key,)))
+
+    async def create_submission(self, idempotency_key: str, pilot_id: int, payload: Dict) -> bool:
+        """
+        Record a submission as pending before it is sent.
+        A previously failed row with the same key is reset so it can be filed again;
+        pending and sent rows are left untouched.
+        """
+        query = """
+            INSERT INTO pirep_submissions
+                (idempotency_key, pilot_id, payload, status, attempts, next_attempt_at, created_at, updated_at)
+            VALUES (%s, %s, %s, %s, 0, UTC_TIMESTAMP(), UTC_TIMESTAMP(), UTC_TIMESTAMP())
+            ON DUPLICATE KEY UPDATE
+                payload = IF(status = %s, VALUES(payload), payload),
+                attempts = IF(status = %s, 0, attempts),
+                last_error = IF(status = %s, NULL, last_error),
+                updated_at = IF(status = %s, UTC_TIMESTAMP(), updated_at),
+                status = IF(status = %s, %s, status)
+        """
+        args = (
+            idempotency_key, pilot_id, json.dumps(payload), STATUS_PENDING,
+            STATUS_FAILED, STATUS_FAILED, STATUS_FAILED, STATUS_FAILED, STATUS_FAILED, STATUS_PENDING,
+        )
+        result = await self.db.execute(query, args)
+        if not result:
+            logger.error(f"Failed to persist PIREP submission {idempotency_key}")
+        return bool(result)
+
+    async def mark_sent(self, idempotency_key: str, attempts: int, response: Dict) -> bool:
+        query = """
+            UPDATE pirep_submissions
+            SET status = %s, attempts = %s, response = %s, last_error = NULL, updated_at = UTC_TIMESTAMP()
+            WHERE idempotency_key = %s
+        """
+        return bool(await self.db.execute(query, (STATUS_SENT, attempts, json.dumps(response), idempotency_key)))
+
+    async def mark_retry(self, idempotency_key: str, attempts: int, next_attempt_at: datetime, error: str) -> bool:
+        query = """
+            UPDATE pirep_submissions
+            SET attempts = %s, next_attempt_at = %s, last_error = %s, updated_at = UTC_TIMESTAMP()
+            WHERE idempotency_key = %s AND status = %s
+        """
+        return bool(await self.db.execute(query, (attempts, next_attempt_at, error[:500], idempotency_key, STATUS_PENDING)))
+
+    async def mark_failed(self, idempotency_key: str, attempts: int, error: str, response: Optional[Dict] = None) -> bool:
+        query = """
+            UPDATE pirep_submissions
+            SET status = %s, attempts = %s, last_error = %s, response = %s, updated_at = UTC_TIMESTAMP()
+            WHERE idempotency_key = %s
+        """
+        encoded = json.dumps(response) if response is not None else None
+        return bool(await self.db.execute(query, (STATUS_FAILED, attempts, error[:500], encoded, idempotency_key)))
+
+    async def get_due_submissions(self, limit: int = 20) -> List[Dict]:
+        """Pending submissions whose next attempt is due, oldest first."""
+        query = """
+            SELECT * FROM pirep_submissions
+            WHERE status = %s AND next_attempt_at <= UTC_TIMESTAMP()
+            ORDER BY next_attempt_at ASC
+            LIMIT %s
+        """
+        rows = await self.db.fetch_all(query, (STATUS_PENDING, limit))
+        return [self._decode(r) for r in rows or []]
+
+    async def get_failed_submissions(self, limit: int = 25) -> List[Dict]:
+        """Most recent submissions that gave up, for staff follow-up."""
+        query = """
+            SELECT * FROM pirep_submissions
+            WHERE status = %s
+            ORDER BY updated_at DESC
+            LIMIT %s
+        """
+        rows = await self.db.fetch_all(query, (STATUS_FAILED, limit))
+        return [self._decode(r) for r in rows or []]
+
+
+# ==============================================================================
+# SQL SCHEMA DEFINITION
+# ==============================================================================
+
+PIREP_SUBMISSION_SCHEMA = """
+-- ==============================================================================
+-- PIREP SUBMISSIONS TABLE
+-- ==============================================================================
+-- Outbound Crew Center PIREP submissions keyed by
+-- sha1(pilot, flight number, route, date, duration)
+
+CREATE TABLE IF NOT EXISTS pirep_submissions (
+    idempotency_key                 CHAR(40) PRIMARY KEY,
+    pilot_id                        INT NOT NULL,
+    payload                         TEXT NOT NULL,
+    status                          ENUM('pending', 'sent', 'failed') NOT NULL DEFAULT 'pending',
+    attempts                        INT NOT NULL DEFAULT 0,
+    next_attempt_at                 DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    last_error                      VARCHAR(500) NULL,
+    response                        TEXT NULL,
+    created_at                      DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    updated_at                      DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
+
+    INDEX idx_status_due (status, next_attempt_at),
+    INDEX idx_pilot (pilot_id)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
+"""
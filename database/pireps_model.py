@@ -1,4 +1,5 @@
 import discord
+from typing import Optional
 from database.manager import DatabaseManager
 
 class PirepsModel:
@@ -61,6 +62,83 @@ class PirepsModel:
 
         return pending_reports
 
+    async def get_pending_pireps_page(self, cursor: tuple = None, page_size: int = 10, direction: str = 'next') -> list[dict]:
+        """
+        Fetches one page of pending PIREPs using keyset pagination on (date, id).
+        The queue is ordered newest first (date DESC, id DESC), same as get_pending_pireps.
+
+        Args:
+            cursor: A (date, pirep_id) tuple marking the edge of the current page.
+                    None starts from the top of the queue.
+            page_size: Maximum number of PIREPs to return.
+            direction: 'next' returns rows after the cursor (older PIREPs),
+                       'prev' returns rows before the cursor (newer PIREPs).
+
+        Returns:
+            A list of PIREP dictionaries, always in queue order (newest first).
+        """
+        if direction not in ('next', 'prev'):
+            raise ValueError(f"Invalid pagination direction: {direction}")
+
+        where = "p.status = %s"
+        args = [0]
+
+        if cursor is not None:
+            cursor_date, cursor_id = cursor
+            if direction == 'next':
+                where += " AND (p.date < %s OR (p.date = %s AND p.id < %s))"
+            else:
+                where += " AND (p.date > %s OR (p.date = %s AND p.id > %s))"
+            args.extend([cursor_date, cursor_date, cursor_id])
+
+        # Walking backwards means scanning in ascending order and flipping the result
+        order = "p.date DESC, p.id DESC" if direction == 'next' else "p.date ASC, p.id ASC"
+
+        query = f"""
+            SELECT
+                p.id AS pirep_id,
+                p.flightnum,
+                p.departure,
+                p.arrival,
+                p.flighttime,
+                p.pilotid,
+                p.fuelused,
+                p.date,
+                p.multi,
+                pi.name AS pilot_name,
+                pi.ifuserid,
+                pi.ifc,
+                a.name AS aircraft_name
+            FROM
+                pireps AS p
+            INNER JOIN
+                pilots AS pi ON p.pilotid = pi.id
+            INNER JOIN
+                aircraft AS a ON p.aircraftid = a.id
+            WHERE
+                {where}
+            ORDER BY
+                {order}
+            LIMIT %s
+        """
+        args.append(page_size)
+
+        page = await self.db.fetch_all(query, tuple(args))
+
+        if direction == 'prev':
+            page = list(reversed(page))
+
+        for report in page:
+            report['formatted_flighttime'] = self._format_flight_time(report.get('flighttime'))
+
+        return page
+
+    async def count_pending_pireps(self) -> int:
+        """Counts the PIREPs with a status of 0 (pending)."""
+        query = "SELECT COUNT(*) AS count FROM pireps WHERE status = %s"
+        result = await self.db.fetch_one(query, (0,))
+        return result['count'] if result else 0
+
     async def get_accepted_pireps(self) -> list[dict]:
         """
         Fetches all PIREPs with a status of 1 (accepted), joining with the pilots
@@ -125,6 +203,50 @@ class PirepsModel:
         """
         return await self.db.fetch_all(query, (last_id,))
 
+    async def get_max_pirep_id(self) -> Optional[int]:
+        """Returns the highest PIREP ID in the table (0 if empty, None on database error)."""
+        result = await self.db.fetch_one("SELECT COALESCE(MAX(id), 0) AS max_id FROM pireps")
+        return result['max_id'] if result else None
+
+    async def get_feed_pireps(self, after_id: int, up_to_id: int = None, ids=(), statuses=None) -> list[dict]:
+        """
+        Retrieves PIREPs for the PIREP change feed: every PIREP with after_id < id <= up_to_id,
+        plus the specific PIREPs in `ids` (used to re-check ones that were pending).
+
+        Args:
+            after_id: Exclusive lower bound on the PIREP ID.
+            up_to_id: Optional inclusive upper bound on the PIREP ID.
+            ids: Extra PIREP IDs to include regardless of the range.
+            statuses: Optional list of statuses to restrict the result to.
+        """
+        range_filter = "id > %s"
+        args = [after_id]
+        if up_to_id is not None:
+            range_filter += " AND id <= %s"
+            args.append(up_to_id)
+
+        where = f"({range_filter})"
+        if ids:
+            where = f"({range_filter} OR id IN ({', '.join(['%s'] * len(ids))}))"
+            args.extend(ids)
+        if statuses:
+            where += f" AND status IN ({', '.join(['%s'] * len(statuses))})"
+            args.extend(statuses)
+
+        query = f"""
+            SELECT id AS pirep_id, pilotid, flightnum, departure, arrival, flighttime, multi, date, status
+            FROM pireps
+            WHERE {where}
+            ORDER BY pirep_id ASC
+        """
+        return await self.db.fetch_all(query, tuple(args))
+
+    async def get_pending_pirep_ids(self, after_id: int, up_to_id: int) -> list[int]:
+        """Returns the IDs of pending (status 0) PIREPs with after_id < id <= up_to_id."""
+        query = "SELECT id FROM pireps WHERE status = 0 AND id > %s AND id <= %s"
+        rows = await self.db.fetch_all(query, (after_id, up_to_id))
+        return [row['id'] for row in rows or []]
+
     async def get_rejected_pireps_last_10_days(self) -> list[dict]:
         """
         Fetches all PIREPs with a status of 2 (rejected) from the last 10 days,
@@ -564,6 +686,38 @@ class PirepsModel:
         
         return await self.db.execute(query, tuple(args))
 
+    async def update_pirep_statuses(self, updates: dict[int, list[int]], only_pending: bool = True) -> Optional[dict[int, int]]:
+        """
+        Updates many PIREPs in one transaction, one UPDATE ... WHERE id IN (...) per status.
+
+        Args:
+            updates: Mapping of new status (0=pending, 1=accepted, 2=rejected) to PIREP IDs.
+            only_pending: Only touch PIREPs that are still pending, so a PIREP handled
+                by someone else in the meantime is left alone.
+
+        Returns:
+            Mapping of status to rows affected, or None if nothing was written.
+        """
+        statements = []
+        statuses = []
+        for status, pirep_ids in updates.items():
+            ids = sorted({int(i) for i in pirep_ids})
+            if not ids:
+                continue
+            placeholders = ", ".join(["%s"] * len(ids))
+            query = f"UPDATE pireps SET status = %s WHERE id IN ({placeholders})"
+            if only_pending:
+                query += " AND status = 0"
+            statements.append((query, (status, *ids)))
+            statuses.append(status)
+
+        if not statements:
+            return {}
+        rowcounts = await self.db.execute_many(statements)
+        if rowcounts is None:
+            return None
+        return dict(zip(statuses, rowcounts))
+
     async def get_top_pilots_last_31_days(self) -> list[dict]:
         """
         Fetches the top 10 pilots with the most flight hours in the last 31 days.
@@ -733,6 +887,23 @@ class PirepsModel:
             'total_flights': len(pireps)
         }
 
+    async def get_popular_routes(self, days: int = 30, limit: int = 50) -> list[dict]:
+        """
+        Most flown routes among approved PIREPs in the last X days.
+
+        Returns:
+            List of dicts with departure, arrival and flights, busiest first.
+        """
+        query = """
+            SELECT departure, arrival, COUNT(*) AS flights
+            FROM pireps
+            WHERE status = 1 AND date >= DATE_SUB(CURDATE(), INTERVAL %s DAY)
+            GROUP BY departure, arrival
+            ORDER BY flights DESC
+            LIMIT %s
+        """
+        return await self.db.fetch_all(query, (days, limit))
+
     async def get_approved_pireps_by_route_and_date_range(self, departure: str, arrival: str, hours: int = 48) -> list[dict]:
         """
         Retrieves all approved PIREPs (status=1) for a specific route within the last X hours.
@@ -766,6 +937,46 @@ class PirepsModel:
         args = (departure, arrival, days)
         return await self.db.fetch_all(query, args)
 
+    async def get_route_pireps_after_id(self, departure: str, arrival: str, since_date, last_id: int, recheck_ids=()) -> list[dict]:
+        """
+        Retrieves PIREPs of any status on a route filed on/after since_date with id > last_id,
+        plus the PIREPs in recheck_ids (e.g. ones that were still pending on the last call).
+        Used for incremental leaderboards that keep a high-water mark on pireps.id.
+        """
+        id_filter = "p.id > %s"
+        args = [departure, arrival, since_date, last_id]
+        if recheck_ids:
+            id_filter = f"(p.id > %s OR p.id IN ({', '.join(['%s'] * len(recheck_ids))}))"
+            args.extend(recheck_ids)
+
+        query = f"""
+            SELECT 
+                p.id AS pirep_id,
+                p.flightnum,
+                p.departure,
+                p.arrival,
+                p.pilotid,
+                p.date,
+                p.multi,
+                p.status,
+                pi.name AS pilot_name,
+                pi.callsign,
+                pi.ifuserid,
+                pi.ifc
+            FROM 
+                pireps AS p
+            INNER JOIN 
+                pilots AS pi ON p.pilotid = pi.id
+            WHERE 
+                p.departure = %s
+                AND p.arrival = %s
+                AND p.date >= %s
+                AND {id_filter}
+            ORDER BY 
+                p.id ASC
+        """
+        return await self.db.fetch_all(query, tuple(args))
+
 '''
 === DATABASE STRUCTURE: pireps ===
 
@@ -123,6 +123,39 @@ class ShopModel:
         except Exception:
             return False
     
+    async def purchase_item(self, item_id: int, shop_name: str, pilot_id: int, transaction_model) -> Dict:
+        """
+        Charge the pilot and take one item from stock in a single transaction.
+
+        The item row and then the pilot row are locked (FOR UPDATE), so purchases of
+        the same item or by the same pilot are serialized by MySQL while everything
+        else runs concurrently. Deadlocks are retried by run_transaction.
+
+        Returns:
+            Dict with success, item and balance, plus error ('unavailable',
+            'insufficient_funds' or 'failed') when success is False.
+        """
+        async def purchase(tx):
+            item = await tx.fetch_one("SELECT * FROM shop_items WHERE id = %s FOR UPDATE", (item_id,))
+            if not item or item['stock'] == 0 or item['shop_name'] != shop_name:
+                return {'success': False, 'error': 'unavailable', 'item': item, 'balance': None}
+
+            await tx.fetch_one("SELECT id FROM pilots WHERE id = %s FOR UPDATE", (pilot_id,))
+            balance = await transaction_model.get_balance(pilot_id, tx=tx)
+            if balance < item['price']:
+                return {'success': False, 'error': 'insufficient_funds', 'item': item, 'balance': balance}
+
+            await transaction_model.add_transaction(pilot_id, -item['price'], f"Shop Purchase: {item['name']}", tx=tx)
+            if item['stock'] != -1:
+                await tx.execute("UPDATE shop_items SET stock = stock - 1 WHERE id = %s", (item_id,))
+            return {'success': True, 'item': item, 'balance': balance - item['price']}
+
+        try:
+            return await self.db.run_transaction(purchase)
+        except Exception as e:
+            print(f"Shop purchase of item {item_id} by pilot {pilot_id} failed: {e}")
+            return {'success': False, 'error': 'failed', 'item': None, 'balance': None}
+
     async def delete_item(self, item_id: int) -> bool:
         """Delete item"""
         try:
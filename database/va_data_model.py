@@ -3,9 +3,12 @@ Database models for VA data: Rank, Aircraft, and Multiplier.
 These models provide methods to query ranks, aircraft mappings, and multipliers.
 """
 from typing import Optional, Dict, List, Any
+import asyncio
+import bisect
 import json
 import os
 import logging
+import time
 from .manager import DatabaseManager
 
 logger = logging.getLogger('oryxie.rank_model')
@@ -15,16 +18,40 @@ class RankModel:
     Handles operations related to pilot ranks.
     Uses the 'ranks' table and pilot's flight hours to determine rank.
     Enriches DB data with Discord Role IDs from JSON.
+
+    The ranks table almost never changes, so it is loaded once into a ladder
+    sorted by timereq and hours are resolved with bisect. The ladder is
+    re-merged whenever rank_config.json changes on disk and reloaded from the
+    DB after LADDER_MAX_AGE seconds; call reload_ranks() (/audit "Reload
+    Ranks") after editing the ranks table.
     """
-    def __init__(self, db_manager: DatabaseManager):
+    CONFIG_PATH = os.path.join('assets', 'rank_config.json')
+    LADDER_MAX_AGE = 3600  # seconds
+
+    def __init__(self, db_manager: DatabaseManager, aircraft_model: Optional['AircraftModel'] = None):
         self.db = db_manager
+        # Shared aircraft catalog for rank requirements; created on demand if not given
+        self.aircraft_model = aircraft_model or AircraftModel(db_manager)
+        self._config_mtime: Optional[float] = None
         self.rank_config = self._load_rank_config()
 
+        self._db_ranks: List[Dict] = []
+        self._ranks_loaded_at: Optional[float] = None
+        self._ladder: List[Dict] = []
+        self._ladder_timereqs: List[int] = []
+        self._ranks_by_id: Dict[int, Dict] = {}
+        self._ranks_by_name: Dict[str, Dict] = {}
+        self._config_ladder: List[tuple] = []
+        self._config_min_hours: List[float] = []
+        self._ladder_lock = asyncio.Lock()
+        self._build_config_ladder()
+
     def _load_rank_config(self) -> dict:
         """Load Discord-specific rank config (Role IDs, etc) from JSON."""
-        config_path = os.path.join('assets', 'rank_config.json')
+        config_path = self.CONFIG_PATH
         try:
             if os.path.exists(config_path):
+                self._config_mtime = os.path.getmtime(config_path)
                 with open(config_path, 'r') as f:
                     data = json.load(f)
                     return data.get('ranks', {})
@@ -42,43 +69,121 @@ class RankModel:
         
         # Merge them (JSON data takes precedence for Discord fields)
         return {**db_rank, **json_info}
+
+    # =========================================================================
+    # IN-MEMORY RANK LADDER
+    # =========================================================================
+
+    def _build_config_ladder(self):
+        """Sort rank_config.json ranks by min_hours for bisect lookups."""
+        self._config_ladder = sorted(
+            ((data.get('min_hours', 0), name) for name, data in self.rank_config.items()),
+            key=lambda item: item[0]
+        )
+        self._config_min_hours = [min_hours for min_hours, _ in self._config_ladder]
+
+    def _build_ladder(self):
+        """(Re)merge the cached DB ranks with the current JSON config."""
+        self._ladder = [self._enrich_rank_data(r) for r in sorted(self._db_ranks, key=lambda r: r['timereq'])]
+        self._ladder_timereqs = [r['timereq'] for r in self._ladder]
+        self._ranks_by_id = {r['id']: r for r in self._ladder}
+        self._ranks_by_name = {r['name']: r for r in self._ladder}
+
+    def _check_config_changed(self):
+        """Pick up edits to rank_config.json without a restart."""
+        try:
+            mtime = os.path.getmtime(self.CONFIG_PATH)
+        except OSError:
+            return
+        if mtime != self._config_mtime:
+            logger.info("rank_config.json changed on disk, reloading rank config")
+            self.rank_config = self._load_rank_config()
+            self._build_config_ladder()
+            self._build_ladder()
+
+    async def reload_ranks(self) -> bool:
+        """Reload the ranks table into memory. Returns False if the DB returned nothing."""
+        async with self._ladder_lock:
+            return await self._reload_ranks_locked()
+
+    async def _reload_ranks_locked(self) -> bool:
+        rows = await self.db.fetch_all("SELECT * FROM ranks ORDER BY timereq ASC")
+        if not rows:
+            logger.warning("Could not load ranks table; rank lookups will retry on next call")
+            return False
+        self._db_ranks = [dict(r) for r in rows]
+        self._build_ladder()
+        self._ranks_loaded_at = time.monotonic()
+        logger.info(f"Loaded {len(self._ladder)} ranks into memory")
+        return True
+
+    def _ladder_fresh(self) -> bool:
+        return self._ranks_loaded_at is not None and time.monotonic() - self._ranks_loaded_at < self.LADDER_MAX_AGE
+
+    async def _ensure_ladder(self) -> bool:
+        self._check_config_changed()
+        if self._ladder_fresh():
+            return True
+        async with self._ladder_lock:
+            if self._ladder_fresh():
+                return True
+            # A failed refresh keeps serving the previous ladder
+            return await self._reload_ranks_locked() or bool(self._ladder)
+
+    def get_config_ranks(self) -> Dict[str, Dict]:
+        """
+        rank_config.json ranks (role_id, cargo_role_id, min_hours) keyed by name,
+        lowest min_hours first. Reloaded whenever the file changes.
+        """
+        self._check_config_changed()
+        return {name: dict(self.rank_config[name]) for _, name in self._config_ladder}
+
+    def get_config_rank_name(self, hours: float) -> Optional[str]:
+        """
+        Resolve flight hours (not seconds) to a rank name using rank_config.json min_hours.
+        Used by the Discord role logic, which works off the JSON thresholds.
+        """
+        self._check_config_changed()
+        index = bisect.bisect_right(self._config_min_hours, hours) - 1
+        if index < 0:
+            return self._config_ladder[0][1] if self._config_ladder else None
+        return self._config_ladder[index][1]
+
+    # =========================================================================
+    # RANK LOOKUPS
+    # =========================================================================
     
     async def get_rank_by_id(self, rank_id: int) -> Optional[Dict]:
         """Get rank details by ID."""
-        query = "SELECT * FROM ranks WHERE id = %s"
-        result = await self.db.fetch_one(query, (rank_id,))
-        return self._enrich_rank_data(result)
+        if not await self._ensure_ladder():
+            return None
+        rank = self._ranks_by_id.get(rank_id)
+        return dict(rank) if rank else None
     
     async def get_rank_by_name(self, rank_name: str) -> Optional[Dict]:
         """Get rank details by name."""
-        query = "SELECT * FROM ranks WHERE name = %s"
-        result = await self.db.fetch_one(query, (rank_name,))
-        return self._enrich_rank_data(result)
+        if not await self._ensure_ladder():
+            return None
+        rank = self._ranks_by_name.get(rank_name)
+        return dict(rank) if rank else None
     
     async def get_all_ranks(self) -> List[Dict]:
         """Get all ranks ordered by time requirement."""
-        query = "SELECT * FROM ranks ORDER BY timereq ASC"
-        return await self.db.fetch_all(query)
+        if not await self._ensure_ladder():
+            return []
+        return [dict(r) for r in self._ladder]
     
     async def get_rank_by_hours(self, total_hours_seconds: int) -> Optional[Dict]:
         """
         Determine rank based on flight hours (in seconds).
         Returns the highest rank the pilot qualifies for.
         """
-        query = """
-            SELECT * FROM ranks 
-            WHERE timereq <= %s 
-            ORDER BY timereq DESC 
-            LIMIT 1
-        """
-        result = await self.db.fetch_one(query, (total_hours_seconds,))
+        if not await self._ensure_ladder():
+            return None
+        index = bisect.bisect_right(self._ladder_timereqs, total_hours_seconds) - 1
         
         # If no rank found (shouldn't happen as Cadet has 0 requirement), return first rank
-        if not result:
-            query = "SELECT * FROM ranks ORDER BY timereq ASC LIMIT 1"
-            result = await self.db.fetch_one(query)
-        
-        return self._enrich_rank_data(result)
+        return dict(self._ladder[max(index, 0)])
 
     async def is_owd_eligible(self, pilot_id: int) -> bool:
         """Checks if a pilot is eligible for OneWorld Discover routes."""
@@ -97,14 +202,12 @@ class RankModel:
         Returns:
             Dict with rank info (id, name, timereq) or None if aircraft not found
         """
-        query = "SELECT rankreq FROM aircraft WHERE id = %s"
-        aircraft = await self.db.fetch_one(query, (aircraft_id,))
-        
-        if not aircraft or not aircraft.get('rankreq'):
+        # Precomputed in the aircraft catalog
+        rank_id = await self.aircraft_model.get_rank_requirement_id(aircraft_id)
+        if not rank_id:
             return None
         
-        # Get the rank details
-        rank_id = aircraft['rankreq']
+        # Get the rank details from the in-memory ladder
         return await self.get_rank_by_id(rank_id)
     
     async def can_pilot_fly_aircraft(self, pilot_id: int, aircraft_id: int) -> Dict:
@@ -122,6 +225,16 @@ class RankModel:
                 - 'required_rank': Dict with aircraft's required rank info
                 - 'message': str explanation
         """
+        # Get pilot's current rank and the aircraft's required rank
+        pilot_rank = await self.get_pilot_rank(pilot_id)
+        required_rank = await self.get_aircraft_rank_requirement(aircraft_id) if pilot_rank else None
+        return self.compare_ranks(pilot_rank, required_rank)
+
+    def compare_ranks(self, pilot_rank: Optional[Dict], required_rank: Optional[Dict]) -> Dict:
+        """
+        Build the can_pilot_fly_aircraft result from already-fetched ranks.
+        Lets callers that have the ranks in hand skip the lookups.
+        """
         result = {
             'can_fly': False,
             'pilot_rank': None,
@@ -129,14 +242,10 @@ class RankModel:
             'message': ''
         }
         
-        # Get pilot's current rank
-        pilot_rank = await self.get_pilot_rank(pilot_id)
         if not pilot_rank:
             result['message'] = 'Pilot not found in database'
             return result
         
-        # Get aircraft's required rank
-        required_rank = await self.get_aircraft_rank_requirement(aircraft_id)
         if not required_rank:
             result['pilot_rank'] = pilot_rank
             result['message'] = 'Aircraft not found or has no rank requirement'
@@ -172,10 +281,7 @@ class RankModel:
             Dict with same structure as can_pilot_fly_aircraft
         """
         # First, find the VA aircraft by IF aircraft ID
-        from .va_data_model import AircraftModel
-        aircraft_model = AircraftModel(self.db)
-        
-        aircraft = await aircraft_model.get_aircraft_by_if_id(if_aircraft_id)
+        aircraft = await self.aircraft_model.get_aircraft_by_if_id(if_aircraft_id)
         if not aircraft:
             return {
                 'can_fly': False,
@@ -194,10 +300,6 @@ class RankModel:
         """
         # Get pilot data including transfer hours
         pilot_query = "SELECT transhours FROM pilots WHERE id = %s"
-        pilot_data = await self.db.fetch_one(pilot_query, (pilot_id,))
-        
-        if not pilot_data:
-            return None
         
         # Get PIREP hours (sum of approved flight times)
         pirep_query = """
@@ -205,9 +307,17 @@ class RankModel:
             FROM pireps 
             WHERE pilotid = %s AND status = 1 AND flighttime > 300
         """
-        pirep_data = await self.db.fetch_one(pirep_query, (pilot_id,))
         
-        total_seconds = (pilot_data.get('transhours', 0) or 0) + (pirep_data.get('pirep_hours', 0) or 0)
+        # The two lookups are independent, so run them on separate pool connections
+        pilot_data, pirep_data = await asyncio.gather(
+            self.db.fetch_one(pilot_query, (pilot_id,)),
+            self.db.fetch_one(pirep_query, (pilot_id,))
+        )
+        
+        if not pilot_data:
+            return None
+        
+        total_seconds = (pilot_data.get('transhours', 0) or 0) + ((pirep_data or {}).get('pirep_hours', 0) or 0)
         
         return await self.get_rank_by_hours(total_seconds)
 
@@ -216,19 +326,118 @@ class AircraftModel:
     """
     Handles operations related to aircraft.
     Provides mapping between Infinite Flight aircraft IDs and Crew Center aircraft IDs.
+
+    The aircraft table is loaded into an in-memory catalog with hash indexes
+    for every lookup key, so each resolution step is a dict lookup. The
+    catalog refreshes itself after CATALOG_MAX_AGE seconds; call
+    reload_catalog() (/audit "Reload Aircraft Catalog") after editing the fleet.
     """
+    CATALOG_MAX_AGE = 3600  # seconds
+
     def __init__(self, db_manager: DatabaseManager):
         self.db = db_manager
+        self._catalog_loaded_at: Optional[float] = None
+        self._catalog_lock = asyncio.Lock()
+        self._by_id: Dict[int, Dict] = {}
+        self._by_if_ids: Dict[tuple, Dict] = {}
+        self._by_if_id: Dict[str, Dict] = {}
+        self._by_icao: Dict[str, Dict] = {}
+        self._by_name: Dict[str, Dict] = {}
+        self._by_name_livery: Dict[tuple, Dict] = {}
+        self._active: List[Dict] = []
+        self.rank_requirements: Dict[int, Optional[int]] = {}
+
+    # =========================================================================
+    # CATALOG
+    # =========================================================================
+
+    @staticmethod
+    def _key(value) -> str:
+        # MySQL compares these columns case-insensitively, so the indexes do too
+        return str(value).strip().lower() if value is not None else ''
+
+    def _build_catalog(self, rows: List[Dict]):
+        by_id, by_if_ids, by_if_id, by_icao, by_name, by_name_livery = {}, {}, {}, {}, {}, {}
+        rank_requirements = {}
+        active = []
+        for row in sorted(rows, key=lambda r: r['id']):
+            by_id[row['id']] = row
+            rank_requirements[row['id']] = row.get('rankreq') or None
+            # get_aircraft_by_if_id historically ignored status; keep that
+            if row.get('ifaircraftid'):
+                by_if_id.setdefault(self._key(row['ifaircraftid']), row)
+
+            if row.get('status') != 1:
+                continue
+            active.append(row)
+            if row.get('ifaircraftid') and row.get('ifliveryid'):
+                by_if_ids.setdefault((self._key(row['ifaircraftid']), self._key(row['ifliveryid'])), row)
+            if row.get('icao'):
+                by_icao.setdefault(self._key(row['icao']), row)
+            if row.get('name'):
+                by_name.setdefault(self._key(row['name']), row)
+                if row.get('livery'):
+                    by_name_livery.setdefault((self._key(row['name']), self._key(row['livery'])), row)
+
+        self._by_id, self._by_if_ids, self._by_if_id = by_id, by_if_ids, by_if_id
+        self._by_icao, self._by_name, self._by_name_livery = by_icao, by_name, by_name_livery
+        self._active = sorted(active, key=lambda r: r.get('name') or '')
+        self.rank_requirements = rank_requirements
+
+    async def reload_catalog(self) -> bool:
+        """Reload the aircraft table into memory. Returns False if the DB returned nothing."""
+        async with self._catalog_lock:
+            return await self._reload_catalog_locked()
+
+    async def _reload_catalog_locked(self) -> bool:
+        rows = await self.db.fetch_all("SELECT * FROM aircraft")
+        if not rows:
+            logger.warning("Could not load aircraft table; aircraft lookups will retry on next call")
+            return False
+        self._build_catalog([dict(r) for r in rows])
+        self._catalog_loaded_at = time.monotonic()
+        logger.info(f"Loaded {len(self._by_id)} aircraft into memory ({len(self._active)} active)")
+        return True
+
+    def _catalog_fresh(self) -> bool:
+        return self._catalog_loaded_at is not None and time.monotonic() - self._catalog_loaded_at < self.CATALOG_MAX_AGE
+
+    async def _ensure_catalog(self) -> bool:
+        if self._catalog_fresh():
+            return True
+        async with self._catalog_lock:
+            if self._catalog_fresh():
+                return True
+            # A failed refresh keeps serving the previous catalog
+            return await self._reload_catalog_locked() or self._catalog_loaded_at is not None
+
+    async def _lookup(self, index_name: str, key) -> Optional[Dict]:
+        if not await self._ensure_catalog():
+            return None
+        row = getattr(self, index_name).get(key)
+        return dict(row) if row else None
+
+    async def get_rank_requirement_id(self, aircraft_id: int) -> Optional[int]:
+        """Get the rankreq (rank ID) for an aircraft, or None if it has none."""
+        if not await self._ensure_catalog():
+            return None
+        return self.rank_requirements.get(aircraft_id)
+
+    # =========================================================================
+    # LOOKUPS
+    # =========================================================================
     
     async def get_aircraft_by_id(self, aircraft_id: int) -> Optional[Dict]:
         """Get aircraft details by Crew Center ID."""
-        query = "SELECT * FROM aircraft WHERE id = %s"
-        return await self.db.fetch_one(query, (aircraft_id,))
+        try:
+            aircraft_id = int(aircraft_id)
+        except (TypeError, ValueError):
+            return None
+        return await self._lookup('_by_id', aircraft_id)
     
     async def get_aircraft_by_if_id(self, if_aircraft_id: str) -> Optional[Dict]:
         """Get aircraft details by Infinite Flight aircraft UUID."""
-        query = "SELECT * FROM aircraft WHERE ifaircraftid = %s"
-        return await self.db.fetch_one(query, (if_aircraft_id,))
+        return await self._lookup('_by_if_id', self._key(if_aircraft_id))
     
     async def get_aircraft_by_if_ids(self, if_aircraft_id: str, if_livery_id: str) -> Optional[Dict]:
         """
@@ -242,8 +451,7 @@ class AircraftModel:
         Returns:
             Dict with aircraft details including 'id' (CC aircraft ID) or None if not found
         """
-        query = "SELECT * FROM aircraft WHERE ifaircraftid = %s AND ifliveryid = %s AND status = 1"
-        return await self.db.fetch_one(query, (if_aircraft_id, if_livery_id))
+        return await self._lookup('_by_if_ids', (self._key(if_aircraft_id), self._key(if_livery_id)))
     
     async def get_aircraft_by_if_ids_fallback(self, if_aircraft_id: str, if_livery_id: str) -> Optional[Dict]:
         """
@@ -269,23 +477,21 @@ class AircraftModel:
     
     async def get_aircraft_by_icao(self, icao: str) -> Optional[Dict]:
         """Get aircraft details by ICAO code."""
-        query = "SELECT * FROM aircraft WHERE icao = %s AND status = 1"
-        return await self.db.fetch_one(query, (icao,))
+        return await self._lookup('_by_icao', self._key(icao))
     
     async def get_aircraft_by_name(self, name: str) -> Optional[Dict]:
         """Get aircraft details by full name."""
-        query = "SELECT * FROM aircraft WHERE name = %s AND status = 1"
-        return await self.db.fetch_one(query, (name,))
+        return await self._lookup('_by_name', self._key(name))
     
     async def get_aircraft_by_name_and_livery(self, name: str, livery: str) -> Optional[Dict]:
         """Get aircraft details by full name and livery."""
-        query = "SELECT * FROM aircraft WHERE name = %s AND livery = %s AND status = 1"
-        return await self.db.fetch_one(query, (name, livery))
+        return await self._lookup('_by_name_livery', (self._key(name), self._key(livery)))
     
     async def get_all_aircraft(self) -> List[Dict]:
         """Get all active aircraft."""
-        query = "SELECT * FROM aircraft WHERE status = 1 ORDER BY name"
-        return await self.db.fetch_all(query)
+        if not await self._ensure_catalog():
+            return []
+        return [dict(row) for row in self._active]
     
     async def get_aircraft_by_route(self, route_id: int) -> List[Dict]:
         """
@@ -321,35 +527,105 @@ class AircraftModel:
 class MultiplierModel:
     """
     Handles operations related to flight multipliers.
+
+    The multipliers table is cached in memory together with the dropdown menu
+    for every rank ID and an id -> submission code map, refreshed after
+    CACHE_MAX_AGE seconds or via reload_multipliers().
     """
+    CACHE_MAX_AGE = 3600  # seconds
+
     def __init__(self, db_manager: DatabaseManager):
         self.db = db_manager
+        self._loaded_at: Optional[float] = None
+        self._lock = asyncio.Lock()
+        self._multipliers: List[Dict] = []
+        self._by_id: Dict[int, Dict] = {}
+        self._by_code: Dict[str, Dict] = {}
+        self._menus: List[List[Dict]] = []
+        self.codes_by_id: Dict[int, str] = {}
+
+    # =========================================================================
+    # CACHE
+    # =========================================================================
+
+    def _build_cache(self, rows: List[Dict]):
+        multipliers = sorted(rows, key=lambda m: float(m.get('multiplier') or 0))
+        self._multipliers = multipliers
+        self._by_id = {m['id']: m for m in multipliers}
+        self._by_code = {str(m['code']): m for m in multipliers if m.get('code') is not None}
+        # The API expects the 'code' value (e.g. 120000); older rows without one fall back to the name
+        self.codes_by_id = {m['id']: str(m['code']) if m.get('code') else m.get('name') for m in multipliers}
+
+        # _menus[r] = multipliers with minrankid <= r; any higher rank gets the last (full) menu
+        max_rank = max((m.get('minrankid') or 0 for m in multipliers), default=0)
+        self._menus = [
+            [m for m in multipliers if (m.get('minrankid') or 0) <= rank_id]
+            for rank_id in range(max_rank + 1)
+        ]
+
+    async def reload_multipliers(self) -> bool:
+        """Reload the multipliers table. Returns False if the DB returned nothing."""
+        async with self._lock:
+            return await self._reload_locked()
+
+    async def _reload_locked(self) -> bool:
+        rows = await self.db.fetch_all("SELECT * FROM multipliers")
+        if not rows:
+            logger.warning("Could not load multipliers table; multiplier lookups will retry on next call")
+            return False
+        self._build_cache([dict(r) for r in rows])
+        self._loaded_at = time.monotonic()
+        return True
+
+    def _cache_fresh(self) -> bool:
+        return self._loaded_at is not None and time.monotonic() - self._loaded_at < self.CACHE_MAX_AGE
+
+    async def _ensure_cache(self) -> bool:
+        if self._cache_fresh():
+            return True
+        async with self._lock:
+            if self._cache_fresh():
+                return True
+            # A failed refresh keeps serving the previous cache
+            return await self._reload_locked() or self._loaded_at is not None
+
+    # =========================================================================
+    # LOOKUPS
+    # =========================================================================
     
     async def get_multiplier_by_id(self, multiplier_id: int) -> Optional[Dict]:
         """Get multiplier details by ID."""
-        query = "SELECT * FROM multipliers WHERE id = %s"
-        return await self.db.fetch_one(query, (multiplier_id,))
+        if not await self._ensure_cache():
+            return None
+        row = self._by_id.get(multiplier_id)
+        return dict(row) if row else None
     
     async def get_multiplier_by_code(self, code: int) -> Optional[Dict]:
         """Get multiplier by code."""
-        query = "SELECT * FROM multipliers WHERE code = %s"
-        return await self.db.fetch_one(query, (code,))
+        if not await self._ensure_cache():
+            return None
+        row = self._by_code.get(str(code))
+        return dict(row) if row else None
+
+    async def get_multiplier_code(self, multiplier_id: int) -> Optional[str]:
+        """Get the value Crew Center expects for a multiplier ID."""
+        if not await self._ensure_cache():
+            return None
+        return self.codes_by_id.get(multiplier_id)
     
     async def get_all_multipliers(self) -> List[Dict]:
         """Get all multipliers."""
-        query = "SELECT * FROM multipliers ORDER BY multiplier"
-        return await self.db.fetch_all(query)
+        if not await self._ensure_cache():
+            return []
+        return [dict(m) for m in self._multipliers]
     
     async def get_multipliers_for_rank(self, rank_id: int) -> List[Dict]:
         """
         Get all multipliers available for a specific rank.
         """
-        query = """
-            SELECT * FROM multipliers 
-            WHERE minrankid <= %s 
-            ORDER BY multiplier
-        """
-        return await self.db.fetch_all(query, (rank_id,))
+        if not await self._ensure_cache() or not self._menus or rank_id is None or rank_id < 0:
+            return []
+        return [dict(m) for m in self._menus[min(rank_id, len(self._menus) - 1)]]
     
     async def get_route_multiplier(self, dep_icao: str, arr_icao: str) -> Optional[float]:
         """
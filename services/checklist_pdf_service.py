@@ -1,10 +1,13 @@
 import json
+import logging
 from fpdf import FPDF
 from PyPDF2 import PdfReader, PdfWriter
 from PyPDF2.generic import DictionaryObject, NumberObject, NameObject, ArrayObject, TextStringObject
 import os
 import io
 
+logger = logging.getLogger('oryxie.checklist_pdf_service')
+
 class PDF(FPDF):
     def __init__(self):
         super().__init__('P', 'mm', 'A4')
@@ -81,8 +84,9 @@ class ChecklistPDFService:
             perf['va_speed'] = str(takeoff_perf['va'])
         return perf
 
-    def _add_checkboxes(self, input_file, output_file, positions):
-        reader = PdfReader(input_file)
+    def _add_checkboxes(self, pdf_bytes: bytes, positions) -> bytes:
+        """Adds checkbox widgets over the drawn boxes, entirely in memory."""
+        reader = PdfReader(io.BytesIO(pdf_bytes))
         writer = PdfWriter()
         
         for page in reader.pages:
@@ -110,8 +114,9 @@ class ChecklistPDFService:
                 })
             )
         
-        with open(output_file, 'wb') as f:
-            writer.write(f)
+        output = io.BytesIO()
+        writer.write(output)
+        return output.getvalue()
 
     def generate_checklist_pdf(self, aircraft_type: str, load: int, checklist_type: str, direction: str) -> io.BytesIO:
         if aircraft_type not in self.aircraft_db:
@@ -447,28 +452,14 @@ class ChecklistPDFService:
 
             pdf.ln(2)
 
-        temp_file = f"temp_{aircraft_type}_{checklist_type}.pdf"
-        final_file = f"checklist_{aircraft_type}_{checklist_type}.pdf"
-        
-        pdf.output(temp_file)
-        
+        # Nothing touches the disk, so concurrent requests for the same aircraft can't collide
+        pdf_bytes = bytes(pdf.output())
         try:
-            self._add_checkboxes(temp_file, final_file, pdf.checkbox_positions)
-            os.remove(temp_file)
-        except:
-            if os.path.exists(temp_file):
-                if os.path.exists(final_file):
-                    os.remove(final_file)
-                os.rename(temp_file, final_file)
-        
-        # Read into memory and cleanup
-        with open(final_file, 'rb') as f:
-            pdf_buffer = io.BytesIO(f.read())
-            
-        pdf_buffer.name = final_file # Set filename for discord.File
-        pdf_buffer.seek(0)
-        
-        if os.path.exists(final_file):
-            os.remove(final_file)
-            
+            pdf_bytes = self._add_checkboxes(pdf_bytes, pdf.checkbox_positions)
+        except Exception as e:
+            # The boxes are still drawn, they just aren't clickable
+            logger.warning(f"Could not add checkboxes to {aircraft_type} checklist: {e}")
+
+        pdf_buffer = io.BytesIO(pdf_bytes)
+        pdf_buffer.name = f"checklist_{aircraft_type}_{checklist_type}.pdf"  # Set filename for discord.File
         return pdf_buffer
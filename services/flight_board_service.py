@@ -5,16 +5,23 @@ import re
 import logging
 import airportsdata
 import io
+import time
 from datetime import datetime, timedelta
-from typing import Optional, Dict, List
+from typing import Optional, Dict, List, Tuple
+from urllib.parse import urlparse, parse_qs
 from cogs.flight_board_views import FlightBoardView, FlightEditModal
 
 class FlightBoardService:
+    ROUTE_MAP_FILENAME = "route_map.png"
+    URL_EXPIRY_MARGIN = 3600  # seconds; don't reuse a CDN URL this close to expiring
+
     def __init__(self, bot):
         self.bot = bot
         self.aircraft_db = self._load_aircraft_data()
         self.airports = airportsdata.load('ICAO')
         self.logos = self._load_logos()
+        # (dep, arr) -> {'url', 'expires' (unix time or None), 'channel_id', 'message_id'}
+        self._map_urls: Dict[Tuple[str, str], Dict] = {}
     
     def _load_aircraft_data(self) -> dict:
         aircraft_db_path = os.path.join('assets', 'aircraft_data.json')
@@ -184,26 +191,151 @@ class FlightBoardService:
                         pilot_hours = 0.0
                     
                     # Get rank
-                    rank_config_path = os.path.join('assets', 'rank_config.json')
-                    try:
-                        with open(rank_config_path, 'r') as f:
-                            rank_config = json.load(f)
-                            ranks = rank_config.get('ranks', {})
-                            sorted_ranks = sorted(ranks.items(), key=lambda x: x[1].get('min_hours', 0))
-                            rank_name = next((r for r, d in reversed(sorted_ranks) if pilot_hours >= d.get('min_hours', 0)), None)
-                            
-                            if rank_name in ['Ruby', 'Sapphire', 'Emerald', 'OneWorld', 'Oryx']:
-                                footer_text += f" | Senior Captain | {rank_name} Award Holder"
-                            elif rank_name:
-                                footer_text += f" | {rank_name}"
-                    except:
-                        pass
+                    rank_name = self.bot.rank_model.get_config_rank_name(pilot_hours) if hasattr(self.bot, 'rank_model') else None
+                    if rank_name in ['Ruby', 'Sapphire', 'Emerald', 'OneWorld', 'Oryx']:
+                        footer_text += f" | Senior Captain | {rank_name} Award Holder"
+                    elif rank_name:
+                        footer_text += f" | {rank_name}"
             except:
                 pass
         
         embed.set_footer(text=footer_text)
         return embed, thumbnail_file
     
+    # =========================================================================
+    # ROUTE MAP IMAGES
+    # =========================================================================
+
+    def _map_style_version(self) -> int:
+        return getattr(self.bot.route_map_service, 'STYLE_VERSION', 1)
+
+    @staticmethod
+    def _url_expiry(url: str) -> Optional[float]:
+        """Unix expiry of a signed Discord CDN URL (hex 'ex' parameter), None if unsigned."""
+        try:
+            ex = parse_qs(urlparse(url).query).get('ex')
+            return float(int(ex[0], 16)) if ex else None
+        except (ValueError, TypeError):
+            return None
+
+    def _usable(self, expires: Optional[float]) -> bool:
+        return expires is None or expires - self.URL_EXPIRY_MARGIN > time.time()
+
+    async def get_route_map_url(self, dep: str, arr: str) -> Optional[str]:
+        """
+        CDN URL of an earlier upload of this route's map, if it is still valid.
+        The URL dies with the message it was uploaded with, so that message is
+        checked first and the entry dropped if it has been deleted.
+        """
+        key = (dep.upper(), arr.upper())
+        cached = self._map_urls.get(key)
+        if cached is None and hasattr(self.bot, 'flight_board_model'):
+            row = await self.bot.flight_board_model.get_route_map_url(key[0], key[1], self._map_style_version())
+            if row:
+                cached = {
+                    'url': row['url'],
+                    'expires': self._url_expiry(row['url']),
+                    'channel_id': row.get('channel_id'),
+                    'message_id': row.get('message_id'),
+                }
+                self._map_urls[key] = cached
+        if not cached or not self._usable(cached['expires']) or not cached['message_id']:
+            return None
+
+        try:
+            channel = self.bot.get_channel(cached['channel_id']) or await self.bot.fetch_channel(cached['channel_id'])
+            await channel.fetch_message(cached['message_id'])
+        except discord.NotFound:
+            logging.info(f"Route map source message for {key[0]}-{key[1]} was deleted; rendering a new map")
+            self._map_urls.pop(key, None)
+            if hasattr(self.bot, 'flight_board_model'):
+                await self.bot.flight_board_model.delete_route_map_url(key[0], key[1], self._map_style_version())
+            return None
+        except discord.HTTPException as e:
+            # Can't tell whether the URL still works; upload a fresh map rather than risk a broken image
+            logging.warning(f"Could not check route map source message for {key[0]}-{key[1]}: {e}")
+            return None
+        return cached['url']
+
+    async def remember_route_map_url(self, dep: str, arr: str, message: Optional[discord.Message]):
+        """Store the CDN URL of a map uploaded with message so later boards can reuse it."""
+        if not message:
+            return
+        attachment = next((a for a in message.attachments if a.filename == self.ROUTE_MAP_FILENAME), None)
+        if not attachment:
+            return
+        key = (dep.upper(), arr.upper())
+        if self._map_urls.get(key, {}).get('url') == attachment.url:
+            return
+        expires = self._url_expiry(attachment.url)
+        self._map_urls[key] = {
+            'url': attachment.url,
+            'expires': expires,
+            'channel_id': message.channel.id,
+            'message_id': message.id,
+        }
+        if hasattr(self.bot, 'flight_board_model'):
+            expires_at = datetime.utcfromtimestamp(expires) if expires else None
+            await self.bot.flight_board_model.save_route_map_url(
+                key[0], key[1], self._map_style_version(), attachment.url,
+                message.channel.id, message.id, expires_at
+            )
+
+    async def attach_route_map(self, embed: discord.Embed, dep: str, arr: str) -> Optional[discord.File]:
+        """
+        Set the route map as the embed image. Reuses the CDN URL of an earlier
+        upload when it is still valid (nothing to render or upload); otherwise
+        renders the map and returns the file to attach.
+        """
+        if not hasattr(self.bot, 'route_map_service'):
+            return None
+
+        url = await self.get_route_map_url(dep, arr)
+        if url:
+            embed.set_image(url=url)
+            return None
+
+        try:
+            map_result = await self.bot.route_map_service.create_route_map(dep, arr)
+            if isinstance(map_result, str):
+                return None
+            if isinstance(map_result, bytes):
+                map_result = io.BytesIO(map_result)
+            if hasattr(map_result, 'seek'):
+                map_result.seek(0)
+            embed.set_image(url=f"attachment://{self.ROUTE_MAP_FILENAME}")
+            return discord.File(map_result, filename=self.ROUTE_MAP_FILENAME)
+        except Exception as e:
+            logging.error(f"Map generation failed: {e}")
+            return None
+
+    async def carry_over_images(self, embed: discord.Embed, message: discord.Message, dep: str, arr: str) -> list:
+        """
+        Point a rebuilt embed at the images of the message it replaces. Returns the
+        attachments to pass to message.edit (existing ones plus a fresh map upload
+        if the reused map URL has expired). Call remember_route_map_url after the edit.
+        """
+        attachments = list(message.attachments)
+        names = {a.filename for a in attachments}
+        if not message.embeds:
+            return attachments
+
+        # Reconstruct attachment:// URLs by extracting filenames from the original embed's CDN URLs
+        orig_embed = message.embeds[0]
+        if orig_embed.thumbnail and orig_embed.thumbnail.url:
+            filename = orig_embed.thumbnail.url.split('/')[-1].split('?')[0]
+            embed.set_thumbnail(url=f"attachment://{filename}")
+        if orig_embed.image and orig_embed.image.url:
+            filename = orig_embed.image.url.split('/')[-1].split('?')[0]
+            if filename in names:
+                embed.set_image(url=f"attachment://{filename}")
+            else:
+                # The board reused another message's map URL
+                map_file = await self.attach_route_map(embed, dep, arr)
+                if map_file:
+                    attachments.append(map_file)
+        return attachments
+
     async def post_flight_board(self, flight_data: dict) -> Optional[discord.Message]:
         """
         Post flight to board with embed, view, and optional map.
@@ -236,22 +368,9 @@ class FlightBoardService:
         if thumbnail_file:
             files.append(thumbnail_file)
         
-        if hasattr(self.bot, 'route_map_service'):
-            try:
-                map_result = await self.bot.route_map_service.create_route_map(
-                    flight_data['departure'], flight_data['arrival']
-                )
-                if not isinstance(map_result, str):
-                    if isinstance(map_result, bytes):
-                        map_result = io.BytesIO(map_result)
-                    
-                    if hasattr(map_result, 'seek'):
-                        map_result.seek(0)
-                    
-                    files.append(discord.File(map_result, filename="route_map.png"))
-                    embed.set_image(url="attachment://route_map.png")
-            except Exception as e:
-                logging.error(f"Map generation failed: {e}")
+        map_file = await self.attach_route_map(embed, flight_data['departure'], flight_data['arrival'])
+        if map_file:
+            files.append(map_file)
         
         content = f"Pilot: <@{flight_data.get('pilot_id')}>"
 
@@ -260,4 +379,6 @@ class FlightBoardService:
         else:
             msg = await channel.send(content=content, embed=embed, view=view)
 
+        if map_file:
+            await self.remember_route_map_url(flight_data['departure'], flight_data['arrival'], msg)
         return msg
\ No newline at end of file
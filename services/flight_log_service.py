@@ -0,0 +1,216 @@
+import asyncio
+import logging
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional
+
+from services.pirep_validation_service import parse_api_datetime
+
+
+class FlightLogService:
+    """
+    Local-first access to Infinite Flight flight logs.
+
+    Flights are read from the flight_log_model table. A user's logs are only
+    re-downloaded from the IF API when their last sync is older than the
+    requested max age, and every download is merged into the store so older
+    flights remain available after they fall off the API page.
+    """
+
+    DEFAULT_MAX_AGE = timedelta(minutes=10)
+    MIN_API_INTERVAL = 2.1  # seconds between IF API calls made by this service
+
+    def __init__(self, bot):
+        self.bot = bot
+        self.logger = logging.getLogger('oryxie.flight_log_service')
+        self._user_locks: Dict[str, asyncio.Lock] = {}
+        self._api_lock = asyncio.Lock()
+        self._last_api_call = 0.0
+
+    # =========================================================================
+    # SYNC
+    # =========================================================================
+
+    def _flight_to_row(self, if_user_id: str, flight: Dict) -> Optional[Dict]:
+        """Normalize an IF API flight object into a flight_log row."""
+        if not isinstance(flight, dict) or not flight.get('id'):
+            return None
+
+        created_at = None
+        if flight.get('created'):
+            try:
+                created_at = parse_api_datetime(flight['created'])
+                if created_at.tzinfo:
+                    created_at = created_at.astimezone(timezone.utc).replace(tzinfo=None)
+            except ValueError:
+                self.logger.warning(f"Unparseable created time on flight {flight.get('id')}: {flight.get('created')}")
+
+        return {
+            "if_flight_id": flight['id'],
+            "if_user_id": if_user_id,
+            "callsign": flight.get('callsign'),
+            "origin": (flight.get('originAirport') or '').upper() or None,
+            "destination": (flight.get('destinationAirport') or '').upper() or None,
+            "created_at": created_at,
+            "total_time": flight.get('totalTime'),
+            "aircraft_id": flight.get('aircraftId'),
+            "livery_id": flight.get('liveryId'),
+            "server": flight.get('server'),
+            "landing_count": flight.get('landingCount'),
+            "violations": flight.get('violations'),
+            "landing_stats": flight.get('landingStats'),
+        }
+
+    async def _throttled(self, call, *args):
+        """Await call(*args), keeping at least MIN_API_INTERVAL between IF API calls."""
+        async with self._api_lock:
+            loop = asyncio.get_running_loop()
+            wait = self._last_api_call + self.MIN_API_INTERVAL - loop.time()
+            if wait > 0:
+                await asyncio.sleep(wait)
+            try:
+                return await call(*args)
+            finally:
+                self._last_api_call = loop.time()
+
+    async def _throttled_fetch(self, if_user_id: str) -> Optional[Dict]:
+        return await self._throttled(self.bot.if_api_manager.get_user_flights, if_user_id)
+
+    async def lookup_ifc_user(self, ifc_username: str) -> Optional[Dict]:
+        """IF API user lookup by IFC username, sharing this service's request spacing."""
+        return await self._throttled(self.bot.if_api_manager.get_user_by_ifc_username, ifc_username)
+
+    async def sync_user(self, if_user_id: str) -> Optional[List[Dict]]:
+        """
+        Download the user's recent flights from the IF API and store them.
+
+        Returns:
+            The raw API flights, or None if the API was unavailable.
+        """
+        if not self.bot.if_api_manager:
+            return None
+
+        try:
+            response = await self._throttled_fetch(if_user_id)
+        except Exception as e:
+            self.logger.error(f"API error syncing flights for {if_user_id}: {e}")
+            return None
+
+        if not response or not response.get('result'):
+            return None
+
+        result_data = response['result']
+        flights = result_data.get('data', []) if isinstance(result_data, dict) else result_data
+        flights = [f for f in flights if isinstance(f, dict)]
+
+        rows = [row for row in (self._flight_to_row(if_user_id, f) for f in flights) if row]
+        stored = await self.bot.flight_log_model.upsert_flights(rows)
+        if stored or not rows:
+            await self.bot.flight_log_model.mark_user_synced(if_user_id, len(rows))
+
+        self.logger.info(f"Synced {stored}/{len(rows)} flights for IF user {if_user_id}")
+        return flights
+
+    async def _is_stale(self, if_user_id: str, max_age: timedelta) -> bool:
+        last_sync = await self.bot.flight_log_model.get_last_sync(if_user_id)
+        if last_sync is None:
+            return True
+        return datetime.now(timezone.utc).replace(tzinfo=None) - last_sync >= max_age
+
+    async def refresh_if_stale(self, if_user_id: str, max_age: timedelta = None) -> Optional[List[Dict]]:
+        """
+        Sync the user from the API if their stored logs are older than max_age.
+
+        Returns:
+            The raw API flights if a sync happened, otherwise None.
+        """
+        max_age = self.DEFAULT_MAX_AGE if max_age is None else max_age
+        lock = self._user_locks.setdefault(if_user_id, asyncio.Lock())
+        async with lock:
+            # Re-check under the lock so concurrent callers share one API call
+            if not await self._is_stale(if_user_id, max_age):
+                return None
+            return await self.sync_user(if_user_id)
+
+    async def sync_recent_pilots(self, days: int = 7, max_age: timedelta = None) -> int:
+        """
+        Refresh stored flights for every pilot who filed a PIREP in the last X days.
+
+        Returns:
+            Number of pilots synced from the API.
+        """
+        pilots = await self.bot.pilots_model.get_recently_active_pilots(days)
+        synced = 0
+        for pilot in pilots or []:
+            try:
+                if await self.refresh_if_stale(pilot['ifuserid'], max_age) is not None:
+                    synced += 1
+            except Exception as e:
+                self.logger.error(f"Error syncing flights for {pilot.get('callsign')}: {e}")
+        return synced
+
+    # =========================================================================
+    # READ
+    # =========================================================================
+
+    def _filter_flights(self, flights: List[Dict], since, until, departure, arrival) -> List[Dict]:
+        """Apply the store's filters to raw API flights (used when the DB write failed)."""
+        matched = []
+        for flight in flights:
+            if departure and flight.get('originAirport') != departure:
+                continue
+            if arrival and flight.get('destinationAirport') != arrival:
+                continue
+            if since is not None or until is not None:
+                try:
+                    created = parse_api_datetime(flight['created'])
+                    if created.tzinfo:
+                        created = created.astimezone(timezone.utc).replace(tzinfo=None)
+                except (KeyError, TypeError, ValueError):
+                    continue
+                if since is not None and created < since:
+                    continue
+                if until is not None and created > until:
+                    continue
+            matched.append(flight)
+        matched.sort(key=lambda f: f.get('created') or '', reverse=True)
+        return matched
+
+    async def get_user_flights(
+        self,
+        if_user_id: str,
+        since: datetime = None,
+        until: datetime = None,
+        departure: str = None,
+        arrival: str = None,
+        limit: int = 100,
+        max_age: timedelta = None
+    ) -> Optional[List[Dict]]:
+        """
+        Get a user's flights in IF API format, newest first.
+
+        Args:
+            if_user_id: Infinite Flight user ID
+            since / until: Naive UTC bounds on the flight's created time
+            departure / arrival: Optional route filter
+            limit: Maximum number of flights
+            max_age: Re-sync from the API when the stored logs are older than this
+
+        Returns:
+            List of flights (possibly empty), or None if the user has never been
+            synced and the API is unavailable.
+        """
+        fetched = await self.refresh_if_stale(if_user_id, max_age)
+
+        flights = await self.bot.flight_log_model.get_user_flights(
+            if_user_id, since=since, until=until, departure=departure, arrival=arrival, limit=limit
+        )
+        if flights:
+            return flights
+
+        if fetched:
+            return self._filter_flights(fetched, since, until, departure, arrival)[:limit]
+
+        if fetched is None and await self.bot.flight_log_model.get_last_sync(if_user_id) is None:
+            return None
+
+        return []
@@ -0,0 +1,178 @@
+import asyncio
+import logging
+import time
+from typing import Dict, List, Optional
+
+import discord
+
+ACK_WINDOW = 3.0  # seconds Discord allows before the interaction fails
+DEFAULT_MARGIN = 2.2  # auto-defer once this much of the window has been used
+POLL_INTERVAL = 0.1
+
+
+class _ModalLauncherView(discord.ui.View):
+    """Fallback when a modal is needed but the interaction was already deferred."""
+
+    def __init__(self, modal: discord.ui.Modal, label: str):
+        super().__init__(timeout=300)
+        self.modal = modal
+        button = discord.ui.Button(label=label, style=discord.ButtonStyle.primary)
+        button.callback = self._open
+        self.add_item(button)
+
+    async def _open(self, interaction: discord.Interaction):
+        await interaction.response.send_modal(self.modal)
+        self.stop()
+
+
+class InteractionGuard:
+    """Tracks one interaction's ack deadline and defers it automatically."""
+
+    def __init__(self, manager: 'InteractionDeadlineManager', interaction: discord.Interaction, name: str,
+                 ephemeral: bool = False, thinking: bool = False, margin: float = DEFAULT_MARGIN):
+        self.manager = manager
+        self.interaction = interaction
+        self.name = name
+        self.ephemeral = ephemeral
+        self.thinking = thinking
+        self.auto_deferred = False
+        self.ack_seconds: Optional[float] = None
+
+        # Count from whichever is later: Discord's timestamp or when we started, so clock skew
+        # can only make the guard defer earlier, never later.
+        age = max(0.0, (discord.utils.utcnow() - interaction.created_at).total_seconds())
+        self._started = time.monotonic() - min(age, margin)
+        self._deadline = self._started + margin
+        self._lock = asyncio.Lock()
+        self._watchdog: Optional[asyncio.Task] = None
+
+    def _elapsed(self) -> float:
+        return time.monotonic() - self._started
+
+    def _mark_acked(self):
+        if self.ack_seconds is None:
+            self.ack_seconds = self._elapsed()
+
+    async def __aenter__(self) -> 'InteractionGuard':
+        self._watchdog = asyncio.create_task(self._watch())
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        if self._watchdog:
+            self._watchdog.cancel()
+        if self.interaction.response.is_done():
+            self._mark_acked()
+        self.manager.record(self.name, self.ack_seconds, self.auto_deferred)
+        return False
+
+    async def _watch(self):
+        while not self.interaction.response.is_done():
+            if time.monotonic() >= self._deadline:
+                await self.defer(auto=True)
+                return
+            await asyncio.sleep(POLL_INTERVAL)
+        self._mark_acked()
+
+    # =========================================================================
+    # RESPONSES
+    # =========================================================================
+
+    async def defer(self, auto: bool = False):
+        async with self._lock:
+            if self.interaction.response.is_done():
+                return
+            try:
+                await self.interaction.response.defer(ephemeral=self.ephemeral, thinking=self.thinking)
+            except discord.HTTPException as e:
+                self.manager.logger.warning(f"Could not defer {self.name} after {self._elapsed():.2f}s: {e}")
+                return
+            self._mark_acked()
+            if auto:
+                self.auto_deferred = True
+                self.manager.logger.info(f"Auto-deferred {self.name} after {self._elapsed():.2f}s")
+
+    async def send(self, content: str = None, **kwargs):
+        """Send a message: initial response if still possible, otherwise a followup."""
+        kwargs.setdefault('ephemeral', self.ephemeral)
+        async with self._lock:
+            if not self.interaction.response.is_done():
+                await self.interaction.response.send_message(content, **kwargs)
+                self._mark_acked()
+                return
+        return await self.interaction.followup.send(content, **kwargs)
+
+    async def edit(self, **kwargs):
+        """Edit the message the interaction came from (components) or the original response."""
+        async with self._lock:
+            if not self.interaction.response.is_done() and self.interaction.message is not None:
+                await self.interaction.response.edit_message(**kwargs)
+                self._mark_acked()
+                return
+        if not self.interaction.response.is_done():
+            await self.defer()
+        return await self.interaction.edit_original_response(**kwargs)
+
+    async def send_modal(self, modal: discord.ui.Modal, prompt: str = "Please fill in the form to continue.",
+                         label: str = "Open Form"):
+        """Open a modal; if the interaction was already deferred, post a button that opens it."""
+        async with self._lock:
+            if not self.interaction.response.is_done():
+                await self.interaction.response.send_modal(modal)
+                self._mark_acked()
+                return
+        await self.interaction.followup.send(prompt, view=_ModalLauncherView(modal, label), ephemeral=True)
+
+
+class InteractionDeadlineManager:
+    """
+    Keeps slow handlers inside Discord's 3 second acknowledgement window.
+
+    Wrap a handler that does DB or API work before responding in a guard. If it
+    has not responded by the safety margin, the guard defers on its behalf.
+    Respond through the guard's send/edit/send_modal helpers so the followup
+    path is used once the interaction has been deferred.
+
+    Usage:
+        async with bot.interaction_deadlines.guard(interaction, "mission_pirep", ephemeral=True) as guard:
+            details = await slow_lookup()
+            await guard.edit(content="Done", view=None)
+
+    Ack latency is recorded per handler name and shown in /audit.
+    """
+
+    SLOW_ACK = 2.0  # seconds; log handlers that get this close to the window
+
+    def __init__(self, margin: float = DEFAULT_MARGIN):
+        self.margin = margin
+        self.logger = logging.getLogger('oryxie.interaction_deadline')
+        self.stats: Dict[str, Dict] = {}
+
+    def guard(self, interaction: discord.Interaction, name: str, ephemeral: bool = False,
+              thinking: bool = False) -> InteractionGuard:
+        return InteractionGuard(self, interaction, name, ephemeral=ephemeral, thinking=thinking, margin=self.margin)
+
+    def record(self, name: str, ack_seconds: Optional[float], auto_deferred: bool):
+        stats = self.stats.setdefault(name, {
+            'calls': 0, 'acked': 0, 'auto_deferred': 0, 'missed': 0, 'total_ack': 0.0, 'max_ack': 0.0,
+        })
+        stats['calls'] += 1
+        stats['auto_deferred'] += int(auto_deferred)
+        if ack_seconds is None:
+            return
+        stats['acked'] += 1
+        stats['total_ack'] += ack_seconds
+        stats['max_ack'] = max(stats['max_ack'], ack_seconds)
+        if ack_seconds > ACK_WINDOW:
+            stats['missed'] += 1
+            self.logger.warning(f"{name} acknowledged after {ack_seconds:.2f}s, past Discord's {ACK_WINDOW:.0f}s window")
+        elif ack_seconds > self.SLOW_ACK and not auto_deferred:
+            self.logger.info(f"{name} acknowledged after {ack_seconds:.2f}s")
+
+    def report(self) -> List[Dict]:
+        """Per-handler stats, closest to the limit first."""
+        rows = []
+        for name, stats in self.stats.items():
+            avg = stats['total_ack'] / stats['acked'] if stats['acked'] else 0.0
+            rows.append({'name': name, **stats, 'avg_ack': avg})
+        return sorted(rows, key=lambda r: r['max_ack'], reverse=True)
+
@@ -0,0 +1,148 @@
+import asyncio
+import logging
+from datetime import date, datetime, timedelta
+from typing import Dict, List, Optional, Set
+
+logger = logging.getLogger('oryxie.landing_challenge')
+
+PIREP_PENDING = 0
+PIREP_ACCEPTED = 1
+
+
+class LandingChallenge:
+    """
+    Incrementally maintained landing leaderboard for one (route, window).
+
+    The challenge keeps a high-water mark on pireps.id plus the IDs of route
+    PIREPs that were still pending at the last refresh. A refresh only looks at
+    PIREPs above the mark or newly approved ones, and only re-reads flight logs
+    for the pilots behind them. A pilot whose flights were already read (or
+    whose IF user ID could not be resolved) is left alone until they file
+    another approved PIREP. IF flights that were already scored are never
+    scored twice.
+    """
+
+    def __init__(self, departure: str, arrival: str, timeframe_hours: int, engine):
+        self.departure = departure
+        self.arrival = arrival
+        self.timeframe_hours = timeframe_hours
+        self.engine = engine
+
+        # Same window as get_approved_pireps_by_route_and_date_range, fixed at creation
+        self.since_date: date = date.today() - timedelta(days=max(1, timeframe_hours // 24))
+        self.created_at = datetime.utcnow()
+        self.last_refreshed: Optional[datetime] = None
+
+        self.last_pirep_id = 0
+        self.pending_pirep_ids: Set[int] = set()
+        self.scored_pirep_ids: Set[int] = set()
+        self.scored_flight_ids: Set[str] = set()
+
+        self.pilots: Dict[int, dict] = {}
+        self.landing_keys: List[int] = []
+        self.landings: List[dict] = []
+
+        self._lock = asyncio.Lock()
+
+    async def _resolve_ifuserid(self, bot, validation_service, pilot: dict) -> Optional[str]:
+        if pilot.get("ifuserid"):
+            return pilot["ifuserid"]
+        # Throttled by the flight log service; a failure is retried on the pilot's next PIREP
+        ifuserid = await validation_service.resolve_ifuserid({"ifuserid": None, "ifc": pilot.get("ifc")})
+        pilot["ifuserid"] = ifuserid
+        return ifuserid
+
+    async def refresh(self, bot, validation_service) -> dict:
+        """
+        Pull in PIREPs approved since the last refresh and score their pilots' new landings.
+
+        Returns:
+            Counts of new approved PIREPs, pilots re-read and landings added.
+        """
+        async with self._lock:
+            pireps = await bot.pireps_model.get_route_pireps_after_id(
+                self.departure, self.arrival, self.since_date,
+                self.last_pirep_id, tuple(sorted(self.pending_pirep_ids))
+            )
+
+            pilots_to_fetch = set()
+            new_pireps = 0
+            for p in pireps or []:
+                pirep_id = p['pirep_id']
+                self.last_pirep_id = max(self.last_pirep_id, pirep_id)
+                self.pending_pirep_ids.discard(pirep_id)
+
+                if p['status'] == PIREP_PENDING:
+                    self.pending_pirep_ids.add(pirep_id)
+                    continue
+                if p['status'] != PIREP_ACCEPTED or pirep_id in self.scored_pirep_ids:
+                    continue
+
+                self.scored_pirep_ids.add(pirep_id)
+                new_pireps += 1
+                pilot = self.pilots.setdefault(p['pilotid'], {
+                    "name": p['pilot_name'],
+                    "callsign": p['callsign'],
+                    "ifuserid": p['ifuserid'],
+                    "ifc": p['ifc'],
+                })
+                pilot["ifuserid"] = pilot["ifuserid"] or p['ifuserid']
+                pilots_to_fetch.add(p['pilotid'])
+
+            new_landings = 0
+            flights_since = datetime.combine(self.since_date, datetime.min.time())
+            for pilot_id in pilots_to_fetch:
+                pilot = self.pilots[pilot_id]
+                ifuserid = await self._resolve_ifuserid(bot, validation_service, pilot)
+                if not ifuserid:
+                    logger.warning(f"Could not resolve IF User ID for pilot {pilot['name']} ({pilot['callsign']})")
+                    continue
+
+                try:
+                    user_flights = await bot.flight_log_service.get_user_flights(
+                        ifuserid, since=flights_since, departure=self.departure, arrival=self.arrival
+                    )
+                except Exception as e:
+                    logger.error(f"Error getting flights for pilot {pilot['callsign']}: {e}")
+                    continue
+
+                for flight in user_flights or []:
+                    flight_id = flight.get('id')
+                    landing_stats = flight.get('landingStats')
+                    if not flight_id or flight_id in self.scored_flight_ids or not landing_stats:
+                        continue
+                    # Use the final landing (last in chronological order)
+                    self.scored_flight_ids.add(flight_id)
+                    self.landing_keys.append(pilot_id)
+                    self.landings.append(landing_stats[-1])
+                    new_landings += 1
+
+            self.last_refreshed = datetime.utcnow()
+            return {
+                "new_pireps": new_pireps,
+                "pilots_fetched": len(pilots_to_fetch),
+                "new_landings": new_landings,
+            }
+
+    @property
+    def participant_count(self) -> int:
+        return len(self.pilots)
+
+    def standings(self) -> List[dict]:
+        """Current leaderboard: score desc, then softer FPM, then lower G."""
+        if not self.landings:
+            return []
+
+        aggregates = self.engine.aggregate(self.landing_keys, self.engine.score_landing_stats(self.landings))
+        standings = [
+            {"name": self.pilots[pid]["name"], "callsign": self.pilots[pid]["callsign"], **agg}
+            for pid, agg in aggregates.items()
+        ]
+
+        missing = float('inf')
+        standings.sort(key=lambda x: (
+            -x["average_score"],
+            x["vspeed_fpm"] if x["vspeed_fpm"] is not None else missing,
+            x["g_force"] if x["g_force"] is not None else missing
+        ))
+        return standings
@@ -0,0 +1,217 @@
+"""
+Landing Score Engine
+
+Vectorized version of the touchdown scoring used by PIREP validation and the
+landing challenge leaderboard. Each metric is scored 1-5 with numpy.digitize
+against ascending "upper bound" thresholds; missing metrics are carried as NaN
+and ignored by every average.
+
+Run this module directly to benchmark it against the scalar scorer:
+    python -m services.landing_score_engine
+"""
+
+import math
+from typing import Dict, Hashable, List, Optional, Sequence
+
+import numpy as np
+
+# Metric -> upper bounds for scores 5, 4, 3, 2 (anything above the last bound scores 1).
+# A value equal to a bound gets the better score, matching the original "<=" ladders.
+DEFAULT_THRESHOLDS: Dict[str, Sequence[float]] = {
+    "g_force": (1.20, 1.35, 1.50, 1.75),
+    "centerline": (2.0, 5.0, 10.0, 20.0),
+    "dist_1k": (100.0, 200.0, 400.0, 700.0),
+    "roll": (800.0, 1200.0, 1800.0, 2500.0),
+    "vspeed_fpm": (150, 250, 400, 600),
+}
+
+# Lower bounds of the average score for 2, 3, 4 and 5 stars
+RATING_CUTS = (2.50, 3.50, 4.25, 4.75)
+RATING_LABELS = ("Needs Improvement", "Acceptable", "Good", "Excellent", "Exceptional")
+
+METRICS = ("g_force", "centerline", "dist_1k", "roll", "vspeed_fpm")
+MS_TO_FPM = 196.85
+
+
+def _to_array(values) -> np.ndarray:
+    """Convert a sequence that may contain None into a float array with NaN for missing values."""
+    return np.array([np.nan if v is None else v for v in values], dtype=float)
+
+
+def _nan_to_none(value) -> Optional[float]:
+    return None if value is None or math.isnan(value) else float(value)
+
+
+def rating_for(average: float) -> tuple:
+    """Return (stars, rating_text) for an average score."""
+    stars = int(np.digitize(average, RATING_CUTS)) + 1
+    return "⭐" * stars + "☆" * (5 - stars), RATING_LABELS[stars - 1]
+
+
+class LandingScoreEngine:
+    """
+    Scores batches of landings with numpy.
+
+    Args:
+        thresholds: Optional overrides for DEFAULT_THRESHOLDS, keyed by metric name.
+            Each value must be four ascending upper bounds.
+    """
+
+    def __init__(self, thresholds: Dict[str, Sequence[float]] = None):
+        self.thresholds = {**DEFAULT_THRESHOLDS, **(thresholds or {})}
+        self._bins = {}
+        for metric in METRICS:
+            bins = np.asarray(self.thresholds[metric], dtype=float)
+            if bins.shape != (4,) or np.any(np.diff(bins) <= 0):
+                raise ValueError(f"Thresholds for {metric} must be 4 ascending values, got {self.thresholds[metric]}")
+            self._bins[metric] = bins
+
+    def _score(self, metric: str, values: np.ndarray) -> np.ndarray:
+        """Score one metric column; NaN stays NaN."""
+        scores = 5.0 - np.digitize(values, self._bins[metric], right=True)
+        scores[np.isnan(values)] = np.nan
+        return scores
+
+    def score_landings(self, g_force, centerline, dist_1k, roll, vertical_speed) -> Dict[str, np.ndarray]:
+        """
+        Score N landings at once.
+
+        Args:
+            g_force, centerline, dist_1k, roll: Raw landingStats values (None allowed)
+            vertical_speed: Touchdown vertical speed in m/s as reported by the IF API
+
+        Returns:
+            Dict of float arrays (NaN = missing): the scored metric values
+            (absolute distances, FPM), their *_score columns and "average".
+        """
+        v_speed = _to_array(vertical_speed)
+        values = {
+            "g_force": _to_array(g_force),
+            "centerline": np.abs(_to_array(centerline)),
+            "dist_1k": np.abs(_to_array(dist_1k)),
+            "roll": np.abs(_to_array(roll)),
+            "vspeed_fpm": np.abs(np.round(v_speed * MS_TO_FPM)),
+        }
+
+        result = dict(values)
+        score_matrix = np.empty((len(v_speed), len(METRICS)))
+        for col, metric in enumerate(METRICS):
+            scores = self._score(metric, values[metric])
+            result[f"{metric}_score"] = scores
+            score_matrix[:, col] = scores
+
+        valid = ~np.isnan(score_matrix)
+        counts = valid.sum(axis=1)
+        totals = np.where(valid, score_matrix, 0.0).sum(axis=1)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            result["average"] = np.where(counts > 0, totals / counts, np.nan)
+        return result
+
+    def score_landing_stats(self, landings: List[dict]) -> Dict[str, np.ndarray]:
+        """Score a list of IF landingStats dicts."""
+        return self.score_landings(
+            [l.get("maxGForce") for l in landings],
+            [l.get("centerlineDistance") for l in landings],
+            [l.get("distanceFrom1kftMarker") for l in landings],
+            [l.get("groundRollDistance") for l in landings],
+            [l.get("verticalSpeed") for l in landings],
+        )
+
+    def aggregate(self, keys: Sequence[Hashable], scored: Dict[str, np.ndarray]) -> Dict[Hashable, dict]:
+        """
+        Average scored landings per key (e.g. pilot ID).
+
+        Every column is averaged over the landings where it is present, so a
+        missing metric never drags a pilot's average down. Landings with no
+        scorable metric at all are skipped.
+
+        Returns:
+            {key: {"landings", "average_score", "stars", "rating_text", <metric averages>}}
+            with None for metrics the key never reported.
+        """
+        index: Dict[Hashable, int] = {}
+        idx = np.fromiter((index.setdefault(k, len(index)) for k in keys), dtype=np.intp, count=len(keys))
+        n = len(index)
+
+        def grouped_mean(column: np.ndarray):
+            present = ~np.isnan(column)
+            counts = np.bincount(idx[present], minlength=n)
+            sums = np.bincount(idx[present], weights=column[present], minlength=n)
+            with np.errstate(invalid='ignore', divide='ignore'):
+                return np.where(counts > 0, sums / counts, np.nan), counts
+
+        averages, landing_counts = grouped_mean(scored["average"])
+        metric_means = {metric: grouped_mean(scored[metric])[0] for metric in METRICS}
+
+        results = {}
+        for key, i in index.items():
+            if landing_counts[i] == 0:
+                continue
+            stars, rating_text = rating_for(averages[i])
+            results[key] = {
+                "landings": int(landing_counts[i]),
+                "average_score": float(averages[i]),
+                "stars": stars,
+                "rating_text": rating_text,
+                **{metric: _nan_to_none(metric_means[metric][i]) for metric in METRICS},
+            }
+        return results
+
+
+def benchmark(n: int = 10_000, seed: int = 7) -> Dict[str, float]:
+    """
+    Score n synthetic landings with the batch engine and with the scalar
+    PirepValidationService.calculate_landing_score, checking both agree.
+
+    Returns:
+        Timings in seconds and the speedup factor.
+    """
+    import time
+    from services.pirep_validation_service import PirepValidationService
+
+    rng = np.random.default_rng(seed)
+    landings = []
+    for g, c, d, r, v in zip(
+        rng.normal(1.3, 0.2, n), rng.normal(0, 8, n), rng.normal(250, 200, n),
+        rng.normal(1300, 500, n), rng.normal(-1.5, 0.8, n)
+    ):
+        landing = {
+            "maxGForce": g, "centerlineDistance": c, "distanceFrom1kftMarker": d,
+            "groundRollDistance": r, "verticalSpeed": v,
+        }
+        # Drop ~5% of metrics to exercise the missing-value path
+        for field in list(landing):
+            if rng.random() < 0.05:
+                landing[field] = None
+        landings.append(landing)
+
+    engine = LandingScoreEngine()
+    scalar = PirepValidationService.__new__(PirepValidationService)
+
+    start = time.perf_counter()
+    scored = engine.score_landing_stats(landings)
+    engine.aggregate(rng.integers(0, 200, n).tolist(), scored)
+    batch_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    scalar_results = [scalar.calculate_landing_score(l) for l in landings]
+    scalar_seconds = time.perf_counter() - start
+
+    expected = np.array([s["average"] if s else np.nan for s in scalar_results])
+    if not np.allclose(expected, scored["average"], equal_nan=True):
+        raise AssertionError("Batch and scalar landing scores disagree")
+
+    return {
+        "landings": n,
+        "batch_seconds": batch_seconds,
+        "scalar_seconds": scalar_seconds,
+        "speedup": scalar_seconds / batch_seconds if batch_seconds else float("inf"),
+    }
+
+
+if __name__ == "__main__":
+    stats = benchmark()
+    print(
+        f"{stats['landings']} landings: batch {stats['batch_seconds'] * 1000:.1f} ms, "
+        f"scalar {stats['scalar_seconds'] * 1000:.1f} ms ({stats['speedup']:.1f}x)"
+    )
@@ -0,0 +1,230 @@
+import io
+import os
+import time
+import asyncio
+import logging
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from types import SimpleNamespace
+from typing import Dict, List, Optional, Union
+
+from models.flight_details import FlightDetails
+from services.pdf_service import PDFService
+from services.checklist_pdf_service import ChecklistPDFService
+
+
+# ==============================================================================
+# RENDER PROCESS POOL
+# ==============================================================================
+
+_worker_pdf_service = None
+_worker_checklist_service = None
+
+
+def _init_pdf_worker():
+    """Process pool initializer: load fpdf and the checklist templates once per worker."""
+    global _worker_pdf_service, _worker_checklist_service
+    _worker_pdf_service = PDFService()
+    _worker_checklist_service = ChecklistPDFService()
+
+
+def _flight_pdf_in_worker(flight_data: dict, flight_type: str, pilot_name: str, pilot_info: Optional[dict]) -> Optional[bytes]:
+    # The Discord member can't cross the process boundary; the PDF only needs its display name
+    pilot_user = SimpleNamespace(display_name=pilot_name)
+    return _worker_pdf_service.generate_flight_pdf(flight_data, flight_type, pilot_user, pilot_info)
+
+
+def _checklist_pdf_in_worker(aircraft_type: str, load: int, checklist_type: str, direction: str):
+    buffer = _worker_checklist_service.generate_checklist_pdf(aircraft_type, load, checklist_type, direction)
+    return buffer.getvalue(), getattr(buffer, 'name', None)
+
+
+class PDFBusyError(RuntimeError):
+    """Raised when too many documents are already queued."""
+
+
+class PDFRenderService:
+    """
+    Async front end for flight documents and checklists.
+
+    fpdf and PyPDF2 are pure Python and hold the GIL, so documents are built in
+    separate processes (PDF_WORKERS, default cores - 1, up to 2) and the event
+    loop keeps serving heartbeats and interactions during a burst. At most
+    PDF_WORKERS documents render at once; up to PDF_MAX_QUEUE more may wait for
+    a slot, beyond that callers get PDFBusyError. A document that takes longer
+    than PDF_TIMEOUT seconds (queueing included) is abandoned. Set
+    PDF_WORKERS=0 to render in a thread in this process instead.
+
+    Queue wait and render time are recorded per document kind and shown in /audit.
+    """
+
+    SLOW_RENDER = 5.0  # seconds; log documents that take longer than this
+
+    def __init__(self, pdf_service: PDFService = None, checklist_service: ChecklistPDFService = None):
+        self.logger = logging.getLogger('oryxie.pdf_render_service')
+        self.pdf_service = pdf_service
+        self.checklist_service = checklist_service
+
+        self.workers = int(os.getenv("PDF_WORKERS", max(1, min(2, (os.cpu_count() or 2) - 1))))
+        self.max_queue = int(os.getenv("PDF_MAX_QUEUE", max(4, max(self.workers, 1) * 4)))
+        self.timeout = float(os.getenv("PDF_TIMEOUT", 60))
+        self._executor = None
+        self._slots = asyncio.Semaphore(max(self.workers, 1))
+        self._pending = 0
+        self.stats: Dict[str, Dict] = {}
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            # spawn, not fork: the bot process has an event loop, sockets and threads
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=multiprocessing.get_context('spawn'),
+                initializer=_init_pdf_worker
+            )
+            self.logger.info(f"Started PDF render pool with {self.workers} workers")
+        return self._executor
+
+    @property
+    def pending(self) -> int:
+        """Documents rendering or waiting for a slot."""
+        return self._pending
+
+    def close(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    # =========================================================================
+    # SCHEDULING
+    # =========================================================================
+
+    async def _run(self, kind: str, worker_func, local_func, *args):
+        """Run worker_func(*args) in the pool (or local_func(*args) in a thread) within the limits."""
+        if self._pending >= self.workers + self.max_queue:
+            self._record(kind, 'rejected')
+            raise PDFBusyError(f"{self._pending} documents already queued")
+
+        self._pending += 1
+        queued_at = time.monotonic()
+        timings = {}
+        render = None
+
+        async def job():
+            nonlocal render
+            await self._slots.acquire()
+            timings['started'] = time.monotonic()
+            executor = None
+            try:
+                if self.workers <= 0:
+                    render = asyncio.ensure_future(asyncio.to_thread(local_func, *args))
+                else:
+                    executor = self._get_executor()
+                    render = asyncio.get_running_loop().run_in_executor(executor, worker_func, *args)
+            except BaseException:
+                self._slots.release()
+                raise
+            # A timed-out document keeps its worker until it finishes, so it keeps its slot until then
+            render.add_done_callback(lambda done: self._render_finished(done, executor))
+            return await asyncio.shield(render)
+
+        try:
+            result = await asyncio.wait_for(job(), timeout=self.timeout)
+        except asyncio.TimeoutError:
+            self._record(kind, 'timeouts', queued_at, timings.get('started'))
+            self.logger.error(f"{kind} PDF timed out after {self.timeout:.0f}s")
+            raise
+        except Exception:
+            self._record(kind, 'failures', queued_at, timings.get('started'))
+            raise
+        finally:
+            if render is None:
+                self._pending -= 1  # Never reached a worker; nothing will release it later
+
+        self._record(kind, 'rendered', queued_at, timings.get('started'))
+        return result
+
+    def _render_finished(self, render: asyncio.Future, executor):
+        self._slots.release()
+        self._pending -= 1
+        if render.cancelled():
+            return
+        # Checked here rather than in _run so a pool that dies after the caller timed out is still replaced
+        if isinstance(render.exception(), BrokenProcessPool) and executor is self._executor:
+            self.logger.error("PDF render pool died; it will be restarted on the next document")
+            self._executor = None
+
+    # =========================================================================
+    # DOCUMENTS
+    # =========================================================================
+
+    async def generate_flight_pdf(self, flight_data: Union[FlightDetails, dict], flight_type: str,
+                                  pilot_user, pilot_info: dict = None) -> Optional[bytes]:
+        """Same contract as PDFService.generate_flight_pdf: the PDF bytes, or None on any failure."""
+        if isinstance(flight_data, FlightDetails):
+            flight_data = flight_data.to_dict()
+        try:
+            return await self._run(
+                'flight', _flight_pdf_in_worker, self._local_flight_pdf,
+                flight_data, flight_type, pilot_user.display_name, pilot_info
+            )
+        except Exception as e:
+            self.logger.error(f"Flight PDF generation failed: {e!r}")
+            return None
+
+    async def generate_checklist_pdf(self, aircraft_type: str, load: int, checklist_type: str, direction: str) -> io.BytesIO:
+        """
+        Same contract as ChecklistPDFService.generate_checklist_pdf. Raises
+        ValueError for unknown aircraft, PDFBusyError or asyncio.TimeoutError.
+        """
+        data, name = await self._run(
+            'checklist', _checklist_pdf_in_worker, self._local_checklist_pdf,
+            aircraft_type, load, checklist_type, direction
+        )
+        buffer = io.BytesIO(data)
+        buffer.name = name or f"checklist_{aircraft_type}_{checklist_type}.pdf"  # Filename for discord.File
+        return buffer
+
+    def _local_flight_pdf(self, flight_data, flight_type, pilot_name, pilot_info):
+        service = self.pdf_service or PDFService()
+        return service.generate_flight_pdf(flight_data, flight_type, SimpleNamespace(display_name=pilot_name), pilot_info)
+
+    def _local_checklist_pdf(self, aircraft_type, load, checklist_type, direction):
+        if self.checklist_service is None:
+            self.checklist_service = ChecklistPDFService()
+        buffer = self.checklist_service.generate_checklist_pdf(aircraft_type, load, checklist_type, direction)
+        return buffer.getvalue(), getattr(buffer, 'name', None)
+
+    # =========================================================================
+    # METRICS
+    # =========================================================================
+
+    def _record(self, kind: str, outcome: str, queued_at: float = None, started_at: float = None):
+        stats = self.stats.setdefault(kind, {
+            'rendered': 0, 'failures': 0, 'timeouts': 0, 'rejected': 0,
+            'total_wait': 0.0, 'total_render': 0.0, 'max_total': 0.0,
+        })
+        stats[outcome] += 1
+        if queued_at is None:
+            return
+
+        now = time.monotonic()
+        wait = (started_at or now) - queued_at
+        render = now - started_at if started_at else 0.0
+        stats['total_wait'] += wait
+        stats['total_render'] += render
+        stats['max_total'] = max(stats['max_total'], wait + render)
+        if wait + render > self.SLOW_RENDER:
+            self.logger.info(f"{kind} PDF took {wait + render:.2f}s ({wait:.2f}s queued)")
+
+    def report(self) -> List[Dict]:
+        """Per-kind stats with average queue wait and render time."""
+        rows = []
+        for kind, stats in self.stats.items():
+            finished = stats['rendered'] + stats['failures'] + stats['timeouts']
+            rows.append({
+                'kind': kind, **stats,
+                'avg_wait': stats['total_wait'] / finished if finished else 0.0,
+                'avg_render': stats['total_render'] / finished if finished else 0.0,
+            })
+        return sorted(rows, key=lambda r: r['max_total'], reverse=True)
@@ -0,0 +1,152 @@
+import asyncio
+import logging
+import time
+from typing import Callable, Dict, List, Optional
+
+
+class _PilotEntry:
+    def __init__(self, discord_user):
+        self.discord_user = discord_user
+        self.created_at = time.monotonic()
+        self.tasks: Dict[str, asyncio.Future] = {}
+
+
+class PilotContextPrefetcher:
+    """
+    Warms a pilot's context as soon as they open a dispatch or ACARS flow.
+
+    prefetch() starts the identification, pilot row, rank, multiplier menu and
+    (optionally) recent IF flights lookups in the background and returns
+    immediately. Later steps call the accessor for what they need and await the
+    task that is already running (or finished) instead of starting a cold
+    lookup while the user waits on the next dropdown.
+
+    Entries live for TTL seconds and are dropped when the pilot files a PIREP;
+    failed lookups are retried on next access.
+    """
+
+    TTL = 300  # seconds
+
+    def __init__(self, bot):
+        self.bot = bot
+        self.logger = logging.getLogger('oryxie.pilot_prefetcher')
+        self._entries: Dict[int, _PilotEntry] = {}
+
+    # =========================================================================
+    # PREFETCH
+    # =========================================================================
+
+    def prefetch(self, discord_user, include_flights: bool = False, refresh: bool = False) -> None:
+        """
+        Start resolving a pilot's context in the background.
+
+        Args:
+            discord_user: The discord.User / Member opening the flow
+            include_flights: Also fetch recent IF flights (ACARS flow)
+            refresh: Drop anything cached for this pilot first
+        """
+        self._prune()
+        if refresh:
+            self._entries.pop(discord_user.id, None)
+
+        entry = self._entry(discord_user.id, discord_user)
+        entry.discord_user = discord_user
+        for name in ('identify', 'pilot', 'rank', 'multipliers') + (('if_flights',) if include_flights else ()):
+            self._task(entry, name)
+
+    def invalidate(self, discord_id: int) -> None:
+        """Forget a pilot's context, e.g. after filing a PIREP changes their hours."""
+        self._entries.pop(discord_id, None)
+
+    def invalidate_pilot(self, pilot_id: int) -> None:
+        """invalidate() by Crew Center pilot ID, for callers that only know the pilot row."""
+        for discord_id, entry in list(self._entries.items()):
+            task = entry.tasks.get('pilot')
+            if task is None or not task.done() or task.cancelled() or task.exception() is not None:
+                continue
+            if (task.result() or {}).get('id') == pilot_id:
+                self.invalidate(discord_id)
+
+    def is_warm(self, discord_id: int) -> bool:
+        """Whether a flow has prefetched this pilot and the entry hasn't expired."""
+        entry = self._entries.get(discord_id)
+        return entry is not None and time.monotonic() - entry.created_at <= self.TTL
+
+    def _prune(self):
+        now = time.monotonic()
+        for discord_id in [d for d, e in self._entries.items() if now - e.created_at > self.TTL]:
+            del self._entries[discord_id]
+
+    def _entry(self, discord_id: int, discord_user=None) -> _PilotEntry:
+        entry = self._entries.get(discord_id)
+        if entry is None or time.monotonic() - entry.created_at > self.TTL:
+            self._prune()
+            entry = _PilotEntry(discord_user)
+            self._entries[discord_id] = entry
+        return entry
+
+    def _factories(self, entry: _PilotEntry, discord_id: int) -> Dict[str, Callable]:
+        return {
+            'identify': lambda: self.bot.pilots_model.identify_pilot(entry.discord_user),
+            'pilot': lambda: self.bot.pilots_model.get_pilot_by_discord_id(str(discord_id)),
+            'rank': lambda: self._load_rank(discord_id),
+            'multipliers': lambda: self._load_multipliers(discord_id),
+            'if_flights': lambda: self.bot.pirep_filing_service.fetch_if_flights(discord_id),
+        }
+
+    def _task(self, entry: _PilotEntry, name: str, discord_id: Optional[int] = None) -> asyncio.Future:
+        task = entry.tasks.get(name)
+        if task is not None and not (task.done() and (task.cancelled() or task.exception() is not None)):
+            return task
+
+        discord_id = discord_id if discord_id is not None else entry.discord_user.id
+        task = asyncio.ensure_future(self._factories(entry, discord_id)[name]())
+        task.add_done_callback(lambda t, n=name: self._log_failure(discord_id, n, t))
+        entry.tasks[name] = task
+        return task
+
+    def _log_failure(self, discord_id: int, name: str, task: asyncio.Future):
+        if not task.cancelled() and task.exception() is not None:
+            self.logger.warning(f"Prefetch of {name} for {discord_id} failed: {task.exception()}")
+
+    async def _get(self, discord_id: int, name: str, discord_user=None):
+        entry = self._entry(discord_id, discord_user)
+        if name == 'identify' and entry.discord_user is None:
+            raise ValueError("identify needs the Discord user")
+        return await asyncio.shield(self._task(entry, name, discord_id))
+
+    async def _load_rank(self, discord_id: int) -> Optional[Dict]:
+        pilot = await self.pilot(discord_id)
+        if not pilot:
+            return None
+        return await self.bot.rank_model.get_pilot_rank(pilot['id'])
+
+    async def _load_multipliers(self, discord_id: int) -> List[Dict]:
+        pilot, rank = await asyncio.gather(self.pilot(discord_id), self.pilot_rank(discord_id))
+        if not pilot:
+            return []
+        return await self.bot.pirep_filing_service.get_pilot_multipliers(pilot['id'], rank_data=rank)
+
+    # =========================================================================
+    # ACCESSORS
+    # =========================================================================
+
+    async def identify(self, discord_user) -> Dict:
+        """Same result as PilotsModel.identify_pilot(discord_user)."""
+        return await self._get(discord_user.id, 'identify', discord_user)
+
+    async def pilot(self, discord_id: int) -> Optional[Dict]:
+        """Same result as PilotsModel.get_pilot_by_discord_id."""
+        return await self._get(discord_id, 'pilot')
+
+    async def pilot_rank(self, discord_id: int) -> Optional[Dict]:
+        """Rank of the pilot linked to this Discord ID."""
+        return await self._get(discord_id, 'rank')
+
+    async def multipliers(self, discord_id: int) -> List[Dict]:
+        """Multiplier menu for the pilot's rank."""
+        return await self._get(discord_id, 'multipliers')
+
+    async def if_flights(self, discord_id: int) -> Dict:
+        """Same result as PirepFilingService.fetch_if_flights."""
+        return await self._get(discord_id, 'if_flights')
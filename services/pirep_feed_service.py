@@ -0,0 +1,219 @@
+import asyncio
+import logging
+from typing import Dict, Iterable, List, Optional, Set
+
+PIREP_PENDING = 0
+PIREP_ACCEPTED = 1
+
+
+class _Subscriber:
+    def __init__(self, name: str, statuses: Iterable[int], start_id: int):
+        self.name = name
+        self.statuses = set(statuses)
+        self.start_id = start_id
+        self.queue: asyncio.Queue = asyncio.Queue()
+        self.cursor: Optional[int] = None
+        self.unacked: Set[int] = set()
+        self.attempts: Dict[int, int] = {}  # Failed deliveries per PIREP
+        self.needs_replay = True
+
+
+class PirepFeedService:
+    """
+    Single poller for new and changed PIREPs, fanned out to subscribers.
+
+    The feed remembers the highest pireps.id it has seen plus the IDs of PIREPs
+    that are still pending, so each poll reads only new rows and status changes.
+    Rows are put on each subscriber's asyncio.Queue; the subscriber calls
+    ack() once a row is processed. Each subscriber's cursor is persisted only
+    past rows that are acknowledged and no longer pending, so after a restart
+    anything unacknowledged is delivered again (at-least-once). Consumers must
+    therefore be idempotent.
+
+    A subscriber that fails to process a row calls nack() instead; the row
+    stays unacknowledged (so the cursor holds) and is put back on the queue
+    after a backoff. After MAX_ATTEMPTS failures it is logged as dead-lettered,
+    kept in dead_letters for inspection, and acknowledged so the cursor can
+    move on.
+
+    Usage:
+        queue = await bot.pirep_feed_service.subscribe("hajj_operations")
+        pirep = await queue.get()
+        try:
+            ...
+        except Exception:
+            await bot.pirep_feed_service.nack("hajj_operations", pirep)
+        else:
+            await bot.pirep_feed_service.ack("hajj_operations", pirep['pirep_id'])
+    """
+
+    POLL_INTERVAL = 60  # seconds
+    MAX_ATTEMPTS = 5
+    RETRY_DELAY = 60  # seconds, multiplied by the attempt number
+
+    def __init__(self, bot):
+        self.bot = bot
+        self.logger = logging.getLogger('oryxie.pirep_feed_service')
+        self._subscribers: Dict[str, _Subscriber] = {}
+        self._high_water: Optional[int] = None
+        self._pending: Set[int] = set()
+        self._lock = asyncio.Lock()
+        self._task: Optional[asyncio.Task] = None
+        self.dead_letters: Dict[str, List[dict]] = {}
+
+    # =========================================================================
+    # SUBSCRIPTIONS
+    # =========================================================================
+
+    async def subscribe(self, name: str, statuses: Iterable[int] = (PIREP_ACCEPTED,), start_id: int = 0) -> asyncio.Queue:
+        """
+        Register a subscriber and return its queue.
+
+        Args:
+            name: Stable subscriber name; its cursor is persisted under this key.
+            statuses: PIREP statuses to deliver (default: accepted only).
+            start_id: Cursor to start from if the subscriber has no stored cursor.
+        """
+        async with self._lock:
+            subscriber = _Subscriber(name, statuses, start_id)
+            self._subscribers[name] = subscriber
+            try:
+                await self._poll_locked()
+            except Exception as e:
+                self.logger.error(f"Initial PIREP feed poll for {name} failed: {e}")
+
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+        return subscriber.queue
+
+    def unsubscribe(self, name: str) -> None:
+        """Stop delivering to a subscriber. Its persisted cursor is kept."""
+        self._subscribers.pop(name, None)
+        if not self._subscribers and self._task and not self._task.done():
+            self._task.cancel()
+            self._task = None
+
+    async def ack(self, name: str, pirep_id: int) -> None:
+        """Mark a delivered PIREP as processed by a subscriber."""
+        async with self._lock:
+            subscriber = self._subscribers.get(name)
+            if not subscriber:
+                return
+            subscriber.unacked.discard(pirep_id)
+            subscriber.attempts.pop(pirep_id, None)
+            await self._advance_cursor(subscriber)
+
+    async def nack(self, name: str, pirep: dict, error: str = None) -> None:
+        """Report a delivered PIREP as failed; it is redelivered later, up to MAX_ATTEMPTS times."""
+        subscriber = self._subscribers.get(name)
+        if not subscriber:
+            return
+        pirep_id = pirep['pirep_id']
+        attempts = subscriber.attempts.get(pirep_id, 0) + 1
+        subscriber.attempts[pirep_id] = attempts
+
+        if attempts >= self.MAX_ATTEMPTS:
+            self.logger.error(f"Dead-lettering PIREP {pirep_id} for {name} after {attempts} failed attempts: {error}")
+            self.dead_letters.setdefault(name, []).append({**pirep, 'error': error, 'attempts': attempts})
+            await self.ack(name, pirep_id)
+            return
+
+        delay = self.RETRY_DELAY * attempts
+        self.logger.warning(f"{name} failed PIREP {pirep_id} (attempt {attempts}): {error}; redelivering in {delay}s")
+        asyncio.get_running_loop().call_later(delay, self._redeliver, name, subscriber, dict(pirep))
+
+    def _redeliver(self, name: str, subscriber: _Subscriber, pirep: dict) -> None:
+        # Skip if the subscriber was replaced/removed or the row was acked meanwhile
+        if self._subscribers.get(name) is subscriber and pirep['pirep_id'] in subscriber.unacked:
+            subscriber.queue.put_nowait(pirep)
+
+    # =========================================================================
+    # POLLING
+    # =========================================================================
+
+    async def _run(self):
+        await self.bot.wait_until_ready()
+        while self._subscribers:
+            try:
+                await self.poll()
+            except Exception as e:
+                self.logger.error(f"Error polling PIREP feed: {e}")
+            await asyncio.sleep(self.POLL_INTERVAL)
+
+    async def poll(self) -> int:
+        """Fetch new and changed PIREPs and deliver them. Returns the number of rows delivered."""
+        async with self._lock:
+            return await self._poll_locked()
+
+    def _deliver(self, subscriber: _Subscriber, pirep: dict) -> bool:
+        if pirep['status'] not in subscriber.statuses:
+            return False
+        subscriber.unacked.add(pirep['pirep_id'])
+        subscriber.queue.put_nowait(dict(pirep))
+        return True
+
+    async def _replay(self, subscriber: _Subscriber) -> int:
+        """Deliver everything between the subscriber's cursor and the current high-water mark."""
+        if subscriber.cursor is None:
+            stored = await self.bot.pirep_feed_model.get_cursor(subscriber.name)
+            subscriber.cursor = stored if stored is not None else subscriber.start_id
+
+        rows = await self.bot.pireps_model.get_feed_pireps(
+            subscriber.cursor, up_to_id=self._high_water, statuses=tuple(subscriber.statuses)
+        )
+        pending = await self.bot.pireps_model.get_pending_pirep_ids(subscriber.cursor, self._high_water)
+        self._pending.update(pending)
+
+        delivered = sum(self._deliver(subscriber, row) for row in rows or [])
+        subscriber.needs_replay = False
+        if delivered:
+            self.logger.info(f"Replayed {delivered} PIREPs to {subscriber.name} from cursor {subscriber.cursor}")
+        return delivered
+
+    async def _poll_locked(self) -> int:
+        if not self._subscribers:
+            return 0
+
+        if self._high_water is None:
+            self._high_water = await self.bot.pireps_model.get_max_pirep_id()
+            if self._high_water is None:
+                return 0
+
+        delivered = 0
+        for subscriber in list(self._subscribers.values()):
+            if subscriber.needs_replay:
+                delivered += await self._replay(subscriber)
+
+        rows = await self.bot.pireps_model.get_feed_pireps(self._high_water, ids=tuple(sorted(self._pending)))
+        for row in rows or []:
+            pirep_id = row['pirep_id']
+            is_new = pirep_id > self._high_water
+            was_pending = pirep_id in self._pending
+
+            if row['status'] == PIREP_PENDING:
+                self._pending.add(pirep_id)
+            else:
+                self._pending.discard(pirep_id)
+
+            if is_new or (was_pending and row['status'] != PIREP_PENDING):
+                for subscriber in self._subscribers.values():
+                    delivered += self._deliver(subscriber, row)
+
+        if rows:
+            self._high_water = max(self._high_water, max(row['pirep_id'] for row in rows))
+
+        # Rows a subscriber doesn't care about still move its cursor forward
+        for subscriber in self._subscribers.values():
+            await self._advance_cursor(subscriber)
+
+        return delivered
+
+    async def _advance_cursor(self, subscriber: _Subscriber) -> None:
+        """Persist the highest ID below every unacknowledged or still-pending PIREP."""
+        if subscriber.cursor is None or self._high_water is None:
+            return
+        blockers = subscriber.unacked | {p for p in self._pending if p > subscriber.cursor}
+        new_cursor = min(blockers, default=self._high_water + 1) - 1
+        if new_cursor > subscriber.cursor:
+            if await self.bot.pirep_feed_model.set_cursor(subscriber.name, new_cursor):
+                subscriber.cursor = new_cursor
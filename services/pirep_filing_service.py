@@ -1,12 +1,120 @@
+import asyncio
 import logging
 from datetime import datetime
-from typing import List, Dict
+from typing import List, Dict, Optional
+
+OWD_AIRCRAFT_ID = 78
+DEFAULT_AIRCRAFT_ID = 11
+
+
+class FilingContext:
+    """
+    Request-scoped memo for one Ascaris filing flow.
+
+    Every lookup (pilot rank, aircraft, routes) is started at most once per
+    request and kept as a task, so concurrent callers share the same query and
+    independent lookups can be gathered up front. Create one per interaction;
+    nothing here outlives the request.
+    """
+
+    def __init__(self, bot, pilot_id: int, discord_id: Optional[int] = None):
+        self.bot = bot
+        self.pilot_id = pilot_id
+        # Lets the rank come from the pilot prefetcher when the flow was warmed
+        self.discord_id = discord_id
+        self._tasks: Dict[tuple, asyncio.Future] = {}
+
+    def _memo(self, key: tuple, factory) -> asyncio.Future:
+        task = self._tasks.get(key)
+        if task is None:
+            task = asyncio.ensure_future(factory())
+            self._tasks[key] = task
+        return task
+
+    def pilot_rank(self) -> asyncio.Future:
+        return self._memo(('pilot_rank',), self._load_pilot_rank)
+
+    async def _load_pilot_rank(self) -> Optional[Dict]:
+        prefetcher = getattr(self.bot, 'pilot_prefetcher', None)
+        if prefetcher and self.discord_id:
+            pilot = await prefetcher.pilot(self.discord_id)
+            if pilot and pilot['id'] == self.pilot_id:
+                return await prefetcher.pilot_rank(self.discord_id)
+        return await self.bot.rank_model.get_pilot_rank(self.pilot_id)
+
+    def rank_by_id(self, rank_id: int) -> asyncio.Future:
+        return self._memo(('rank', rank_id), lambda: self.bot.rank_model.get_rank_by_id(rank_id))
+
+    def aircraft_by_id(self, aircraft_id: int) -> asyncio.Future:
+        return self._memo(('aircraft', aircraft_id), lambda: self.bot.aircraft_model.get_aircraft_by_id(aircraft_id))
+
+    def aircraft_by_if_ids(self, if_aircraft_id: str, if_livery_id: str) -> asyncio.Future:
+        return self._memo(
+            ('aircraft_if', if_aircraft_id, if_livery_id),
+            lambda: self.bot.aircraft_model.get_aircraft_by_if_ids(if_aircraft_id, if_livery_id)
+        )
+
+    def cc_routes(self, dep: str, arr: str) -> asyncio.Future:
+        return self._memo(
+            ('cc_routes', dep, arr),
+            lambda: self.bot.routes_model.find_all_routes_with_exact_aircraft_by_icao(dep, arr)
+        )
+
+    def owd_route(self, dep: str, arr: str) -> asyncio.Future:
+        async def lookup():
+            if not hasattr(self.bot, 'owd_route_model'):
+                return None
+            return await self.bot.owd_route_model.find_route_by_icao(dep, arr)
+        return self._memo(('owd_route', dep, arr), lookup)
+
+    async def can_fly(self, aircraft: Dict) -> Dict:
+        """Rank check for an aircraft row, using the memoized pilot rank."""
+        rank_req = aircraft.get('rankreq')
+        if rank_req:
+            pilot_rank, required_rank = await asyncio.gather(self.pilot_rank(), self.rank_by_id(rank_req))
+        else:
+            pilot_rank, required_rank = await self.pilot_rank(), None
+        return self.bot.rank_model.compare_ranks(pilot_rank, required_rank)
+
+    def warm(self, flight_data: Dict) -> List[asyncio.Future]:
+        """Start every lookup the waterfall can need for this flight without waiting for them."""
+        dep = flight_data.get('departure', '')
+        arr = flight_data.get('arrival', '')
+        return [
+            self.cc_routes(dep, arr),
+            self.owd_route(dep, arr),
+            self.pilot_rank(),
+            self.aircraft_by_if_ids(flight_data.get('aircraft_id', ''), flight_data.get('livery_id', '')),
+            self.aircraft_by_id(DEFAULT_AIRCRAFT_ID),
+            self.aircraft_by_id(OWD_AIRCRAFT_ID),
+        ]
+
+    async def prefetch(self, flight_data: Dict) -> None:
+        """Run every lookup the waterfall can need for this flight in one round trip."""
+        await asyncio.gather(*self.warm(flight_data), return_exceptions=True)
+
+    def close(self) -> None:
+        """Cancel lookups nobody awaited (e.g. the OWD route for a normal flight)."""
+        for task in self._tasks.values():
+            if not task.done():
+                task.cancel()
+            elif not task.cancelled():
+                task.exception()  # Mark as retrieved; errors surface where the result is awaited
+        self._tasks.clear()
+
 
 class PirepFilingService:
     def __init__(self, bot):
         self.bot = bot
         self.logger = logging.getLogger('oryxie.pirep_filing_service')
 
+    async def _get_pilot(self, discord_id: int) -> Optional[Dict]:
+        """Pilot row by Discord ID, served from the prefetcher when the flow was warmed."""
+        prefetcher = getattr(self.bot, 'pilot_prefetcher', None)
+        if prefetcher and prefetcher.is_warm(discord_id):
+            return await prefetcher.pilot(discord_id)
+        return await self.bot.pilots_model.get_pilot_by_discord_id(str(discord_id))
+
     async def get_pilot_and_aircraft(self, discord_id: int, aircraft_icao: str = None, cc_aircraft_id: int = None, aircraft_name: str = None, aircraft_livery: str = None):
         """
         Retrieves pilot DB ID and Aircraft DB ID.
@@ -19,7 +127,7 @@ class PirepFilingService:
         - aircraft_livery: Livery name from aircraft_data.json (e.g., 'Qatar Airways')
         """
         # 1. Get Pilot Data
-        pilot_data = await self.bot.pilots_model.get_pilot_by_discord_id(str(discord_id))
+        pilot_data = await self._get_pilot(discord_id)
         if not pilot_data:
             return None, None, "Pilot not found in database. Please link your account."
         
@@ -56,12 +164,7 @@ class PirepFilingService:
             if not aircraft_data:
                 # Fallback: Try to find by name if ICAO lookup fails
                 # This helps if aircraft_icao is actually a name like "Boeing 777-300ER"
-                all_aircraft = await self.bot.aircraft_model.get_all_aircraft()
-                for ac in all_aircraft:
-                    # Check if name matches or if ICAO is contained in the input string
-                    if ac['name'].lower() == aircraft_icao.lower() or ac['icao'] == aircraft_icao:
-                        aircraft_data = ac
-                        break
+                aircraft_data = await self.bot.aircraft_model.get_aircraft_by_name(aircraft_icao)
         
         if not aircraft_data:
              return pilot_data, None, f"Aircraft not found in VA database."
@@ -70,46 +173,26 @@ class PirepFilingService:
 
     async def detect_flight_duration(self, if_user_id: str, dep_icao: str, arr_icao: str):
         """
-        Attempts to find a matching flight in IF API and return duration string (HH:MM).
+        Attempts to find a matching flight in the stored IF flight logs and return duration string (HH:MM).
         """
         if not if_user_id:
             return None
 
         try:
-            # Fetch recent flights from Infinite Flight API
-            response = await self.bot.if_api_manager.get_user_flights(if_user_id)
-            
-            flights = []
-            if isinstance(response, dict) and response.get("result"):
-                 flights = response.get("result", {}).get("data", [])
-            
-            for flight in flights:
-                # Check route match
-                f_dep = flight.get('departure', {}).get('code', '').upper()
-                f_arr = flight.get('arrival', {}).get('code', '').upper()
-                
-                if f_dep == dep_icao and f_arr == arr_icao:
-                    start_time_str = flight.get('startTime')
-                    end_time_str = flight.get('endTime')
-                    
-                    if start_time_str and end_time_str:
-                        try:
-                            # Parse ISO format (handle Z for UTC)
-                            start_dt = datetime.fromisoformat(start_time_str.replace('Z', '+00:00'))
-                            end_dt = datetime.fromisoformat(end_time_str.replace('Z', '+00:00'))
-                            duration_seconds = (end_dt - start_dt).total_seconds()
-                            
-                            hours = int(duration_seconds // 3600)
-                            minutes = int((duration_seconds % 3600) // 60)
-                            return f"{hours:02d}:{minutes:02d}"
-                        except Exception as e:
-                            self.logger.error(f"Error parsing dates for PIREP detection: {e}")
-                            continue
-            
+            flights = await self.bot.flight_log_service.get_user_flights(
+                if_user_id, departure=dep_icao, arrival=arr_icao, limit=5
+            )
+
+            for flight in flights or []:
+                total_minutes = flight.get('totalTime')
+                if total_minutes:
+                    hours, minutes = divmod(int(total_minutes), 60)
+                    return f"{hours:02d}:{minutes:02d}"
+
             return None
 
         except Exception as e:
-            self.logger.error(f"Error fetching flights from IF API: {e}")
+            self.logger.error(f"Error fetching flights for PIREP detection: {e}")
             return None
 
     async def submit_pirep(self, pilot_id, flight_num, dep, arr, aircraft_id, duration_str, multiplier_id=None):
@@ -123,21 +206,15 @@ class PirepFilingService:
         multiplier_name = None
         if multiplier_id and hasattr(self.bot, 'multiplier_model'):
             try:
-                mult_data = await self.bot.multiplier_model.get_multiplier_by_id(multiplier_id)
-                if mult_data:
-                    # API expects the 'code' field value (e.g., 120000), NOT name or multiplier
-                    code_val = mult_data.get('code')
-                    if code_val:
-                        multiplier_name = str(code_val)
-                    else:
-                        multiplier_name = mult_data.get('name')
-                else:
+                # API expects the 'code' field value (e.g., 120000), NOT name or multiplier
+                multiplier_name = await self.bot.multiplier_model.get_multiplier_code(multiplier_id)
+                if not multiplier_name:
                     self.logger.warning(f"Multiplier ID {multiplier_id} not found in database.")
             except Exception as e:
                 self.logger.error(f"Error fetching multiplier name: {e}")
                 pass
         
-        response = await self.bot.cc_api_manager.submit_pirep(
+        response = await self.bot.pirep_submission_queue.submit(
             pilot_id=pilot_id,
             flight_num=flight_num,
             departure=dep,
@@ -150,16 +227,18 @@ class PirepFilingService:
         )
         return response
     
-    async def get_pilot_multipliers(self, pilot_id: int) -> List[Dict]:
+    async def get_pilot_multipliers(self, pilot_id: int, rank_data: Optional[Dict] = None) -> List[Dict]:
         """
         Get available multipliers for a pilot based on their rank.
+        Pass rank_data if the caller already has it; the menu itself comes from memory.
         """
         if not hasattr(self.bot, 'multiplier_model'):
             return []
         
         try:
             # Get pilot's actual rank object from DB
-            rank_data = await self.bot.rank_model.get_pilot_rank(pilot_id)
+            if rank_data is None:
+                rank_data = await self.bot.rank_model.get_pilot_rank(pilot_id)
             if not rank_data:
                 return await self.bot.multiplier_model.get_all_multipliers()
 
@@ -309,78 +388,59 @@ class PirepFilingService:
         # Use hardcoded aircraft_id = 11 for all fleet PIREPs
         # Use hardcoded multiplier = 150000 for all fleet PIREPs
         
-        # Get Pilot 1 data
-        pilot1_data = await self.bot.pilots_model.get_pilot_by_discord_id(str(pilot1_discord_id))
+        # Look up both pilots at once
+        pilot1_data, pilot2_data = await asyncio.gather(
+            self.bot.pilots_model.get_pilot_by_discord_id(str(pilot1_discord_id)),
+            self.bot.pilots_model.get_pilot_by_discord_id(str(pilot2_discord_id)) if pilot2_discord_id else asyncio.sleep(0)
+        )
         if not pilot1_data:
             result['error'] = "Pilot 1 not found in database. Please link their account."
             return result
         
-        # Submit PIREP for Pilot 1
-        pilot1_duration = f"{pilot1_hours:02d}:{pilot1_minutes:02d}"
-        try:
-            pilot1_response = await self.bot.cc_api_manager.submit_pirep(
-                pilot_id=pilot1_data['id'],
-                flight_num=frame_name or 'FLEET',
-                departure=dep_icao,
-                arrival=arr_icao,
-                flight_time=pilot1_duration,
-                date=datetime.now().strftime("%Y-%m-%d"),
-                aircraft_id=aircraft_id,  # Always 11
-                fuel_used=0,
-                multiplier=multiplier  # Always 150000
-            )
-            result['pilot1_result'] = {
-                'success': pilot1_response and pilot1_response.get('status') == 0,
-                'pilot_name': pilot1_name,  # Always use Discord name
-                'duration': pilot1_duration,
-                'response': pilot1_response
-            }
-        except Exception as e:
-            self.logger.error(f"Error submitting PIREP for Pilot 1: {e}")
-            result['pilot1_result'] = {
+        async def submit_leg(label: str, pilot_data: dict, pilot_name: str, duration: str) -> Dict:
+            try:
+                response = await self.bot.pirep_submission_queue.submit(
+                    pilot_id=pilot_data['id'],
+                    flight_num=frame_name or 'FLEET',
+                    departure=dep_icao,
+                    arrival=arr_icao,
+                    flight_time=duration,
+                    date=datetime.now().strftime("%Y-%m-%d"),
+                    aircraft_id=aircraft_id,  # Always 11
+                    fuel_used=0,
+                    multiplier=multiplier  # Always 150000
+                )
+                return {
+                    'success': bool(response and (response.get('status') == 0 or response.get('queued'))),
+                    'queued': bool(response and response.get('queued')),
+                    'pilot_name': pilot_name,  # Always use Discord name
+                    'duration': duration,
+                    'response': response
+                }
+            except Exception as e:
+                self.logger.error(f"Error submitting PIREP for {label}: {e}")
+                return {
+                    'success': False,
+                    'pilot_name': pilot_name or "Unknown",
+                    'duration': duration,
+                    'error': str(e)
+                }
+        
+        # The two legs are independent, so submit them concurrently
+        legs = [submit_leg("Pilot 1", pilot1_data, pilot1_name, f"{pilot1_hours:02d}:{pilot1_minutes:02d}")]
+        if pilot2_discord_id and pilot2_data:
+            legs.append(submit_leg("Pilot 2", pilot2_data, pilot2_name, f"{pilot2_hours:02d}:{pilot2_minutes:02d}"))
+        elif pilot2_discord_id:
+            result['pilot2_result'] = {
                 'success': False,
-                'pilot_name': pilot1_name or "Unknown",
-                'duration': pilot1_duration,
-                'error': str(e)
+                'pilot_name': pilot2_name or "Unknown",
+                'error': "Pilot 2 not found in database"
             }
         
-        # Submit PIREP for Pilot 2 if provided
-        if pilot2_discord_id:
-            pilot2_data = await self.bot.pilots_model.get_pilot_by_discord_id(str(pilot2_discord_id))
-            if not pilot2_data:
-                result['pilot2_result'] = {
-                    'success': False,
-                    'pilot_name': pilot2_name or "Unknown",
-                    'error': "Pilot 2 not found in database"
-                }
-            else:
-                pilot2_duration = f"{pilot2_hours:02d}:{pilot2_minutes:02d}"
-                try:
-                    pilot2_response = await self.bot.cc_api_manager.submit_pirep(
-                        pilot_id=pilot2_data['id'],
-                        flight_num=frame_name or 'FLEET',
-                        departure=dep_icao,
-                        arrival=arr_icao,
-                        flight_time=pilot2_duration,
-                        date=datetime.now().strftime("%Y-%m-%d"),
-                        aircraft_id=aircraft_id,  # Always 11
-                        fuel_used=0,
-                        multiplier=multiplier  # Always 150000
-                    )
-                    result['pilot2_result'] = {
-                        'success': pilot2_response and pilot2_response.get('status') == 0,
-                        'pilot_name': pilot2_name,  # Always use Discord name
-                        'duration': pilot2_duration,
-                        'response': pilot2_response
-                    }
-                except Exception as e:
-                    self.logger.error(f"Error submitting PIREP for Pilot 2: {e}")
-                    result['pilot2_result'] = {
-                        'success': False,
-                        'pilot_name': pilot2_name or "Unknown",
-                        'duration': pilot2_duration,
-                        'error': str(e)
-                    }
+        leg_results = await asyncio.gather(*legs)
+        result['pilot1_result'] = leg_results[0]
+        if len(leg_results) > 1:
+            result['pilot2_result'] = leg_results[1]
         
         # Determine overall success
         result['success'] = result['pilot1_result'] and result['pilot1_result'].get('success', False)
@@ -418,7 +478,7 @@ class PirepFilingService:
         
         # 1. Get pilot by Discord ID
         self.logger.info(f"[ASCARIS] Looking up pilot by discord_id={discord_id}")
-        pilot_data = await self.bot.pilots_model.get_pilot_by_discord_id(str(discord_id))
+        pilot_data = await self._get_pilot(discord_id)
         
         if not pilot_data:
             self.logger.warning(f"[ASCARIS] Pilot not found for discord_id={discord_id}")
@@ -592,43 +652,51 @@ class PirepFilingService:
         result['success'] = True
         return result
 
-    async def auto_process_flight(self, pilot_id: int, flight_data: Dict) -> Dict:
+    async def auto_process_flight(self, pilot_id: int, flight_data: Dict, context: Optional[FilingContext] = None) -> Dict:
         """
         Automatically determines the flight type and processes the flight
         using a waterfall logic: CC Route -> OWD Route -> Event/Manual.
+
+        All lookups the waterfall may need are started concurrently up front
+        and shared with process_flight_by_type through the request context.
         """
         dep = flight_data.get('departure', '')
         arr = flight_data.get('arrival', '')
         self.logger.info(f"[ASCARIS-AUTO] Starting auto-detection for {dep} -> {arr}")
 
-        # 1. Check for Normal CC Route
-        self.logger.info("[ASCARIS-AUTO] -> Checking for CC Route...")
-        # Find any route for the airport pair first. Aircraft validity is handled inside process_flight_by_type.
-        all_cc_routes = await self.bot.routes_model.find_all_routes_with_exact_aircraft_by_icao(dep, arr)
-        if all_cc_routes:
-            self.logger.info(f"[ASCARIS-AUTO] -> CC Route found. Processing as 'normal'.")
-            return await self.process_flight_by_type(pilot_id, flight_data, 'normal')
-
-        # 2. Check for One World Route
-        self.logger.info("[ASCARIS-AUTO] -> CC Route check failed. Checking for OWD Route...")
-        pilot_rank = await self.bot.rank_model.get_pilot_rank(pilot_id)
-        if self._has_owd_rank(pilot_rank):
-            self.logger.info("[ASCARIS-AUTO] -> Pilot has OWD rank. Searching OWD routes.")
-            if hasattr(self.bot, 'owd_route_model'):
-                owd_route = await self.bot.owd_route_model.find_route_by_icao(dep, arr)
-                if owd_route:
-                    self.logger.info("[ASCARIS-AUTO] -> OWD Route found. Processing as 'oneworld'.")
-                    return await self.process_flight_by_type(pilot_id, flight_data, 'oneworld')
-        else:
-            self.logger.info("[ASCARIS-AUTO] -> Pilot does not have OWD rank. Skipping OWD check.")
+        owns_context = context is None
+        context = context or FilingContext(self.bot, pilot_id)
+        try:
+            await context.prefetch(flight_data)
 
+            # 1. Check for Normal CC Route
+            self.logger.info("[ASCARIS-AUTO] -> Checking for CC Route...")
+            # Find any route for the airport pair first. Aircraft validity is handled inside process_flight_by_type.
+            all_cc_routes = await context.cc_routes(dep, arr)
+            if all_cc_routes:
+                self.logger.info(f"[ASCARIS-AUTO] -> CC Route found. Processing as 'normal'.")
+                return await self.process_flight_by_type(pilot_id, flight_data, 'normal', context=context)
 
-        # 3. Fallback to Event/Manual
-        self.logger.info("[ASCARIS-AUTO] -> All checks failed. Falling back to 'event' type.")
-        return await self.process_flight_by_type(pilot_id, flight_data, 'event')
+            # 2. Check for One World Route
+            self.logger.info("[ASCARIS-AUTO] -> CC Route check failed. Checking for OWD Route...")
+            pilot_rank = await context.pilot_rank()
+            if self._has_owd_rank(pilot_rank):
+                self.logger.info("[ASCARIS-AUTO] -> Pilot has OWD rank. Searching OWD routes.")
+                owd_route = await context.owd_route(dep, arr)
+                if owd_route:
+                    self.logger.info("[ASCARIS-AUTO] -> OWD Route found. Processing as 'oneworld'.")
+                    return await self.process_flight_by_type(pilot_id, flight_data, 'oneworld', context=context)
+            else:
+                self.logger.info("[ASCARIS-AUTO] -> Pilot does not have OWD rank. Skipping OWD check.")
 
+            # 3. Fallback to Event/Manual
+            self.logger.info("[ASCARIS-AUTO] -> All checks failed. Falling back to 'event' type.")
+            return await self.process_flight_by_type(pilot_id, flight_data, 'event', context=context)
+        finally:
+            if owns_context:
+                context.close()
 
-    async def _has_owd_rank(self, pilot_rank: dict) -> bool:
+    def _has_owd_rank(self, pilot_rank: dict) -> bool:
         """
         Check if pilot has OneWorld rank or higher.
         
@@ -655,7 +723,8 @@ class PirepFilingService:
         pilot_id: int, 
         flight_data: Dict,
         flight_type: str,
-        selected_aircraft_id: int = None
+        selected_aircraft_id: int = None,
+        context: Optional[FilingContext] = None
     ) -> Dict:
         """
         Process a single flight based on flight type (normal, oneworld, event).
@@ -665,6 +734,7 @@ class PirepFilingService:
             flight_data: Flight data from IF API
             flight_type: 'normal' | 'oneworld' | 'event'
             selected_aircraft_id: Aircraft ID selected from dropdown (optional)
+            context: Request context to share lookups with the caller (optional)
             
         Returns:
             {
@@ -688,6 +758,22 @@ class PirepFilingService:
             'error': None
         }
         
+        owns_context = context is None
+        context = context or FilingContext(self.bot, pilot_id)
+        try:
+            return await self._process_flight_by_type(context, result, flight_data, flight_type, selected_aircraft_id)
+        finally:
+            if owns_context:
+                context.close()
+
+    async def _process_flight_by_type(
+        self,
+        context: FilingContext,
+        result: Dict,
+        flight_data: Dict,
+        flight_type: str,
+        selected_aircraft_id: int = None
+    ) -> Dict:
         dep = flight_data.get('departure', '')
         arr = flight_data.get('arrival', '')
         
@@ -695,16 +781,20 @@ class PirepFilingService:
             # ONE WORLD: Check rank first, then search OWD routes only
             self.logger.info(f"[ASCARIS] Processing as One World flight")
             
+            # Rank, fixed aircraft and OWD route are independent lookups
+            pilot_rank, aircraft, route_data = await asyncio.gather(
+                context.pilot_rank(),
+                context.aircraft_by_id(OWD_AIRCRAFT_ID),
+                context.owd_route(dep, arr)
+            )
+            
             # 1. Check pilot rank for OWD access
-            pilot_rank = await self.bot.rank_model.get_pilot_rank(pilot_id)
             if not self._has_owd_rank(pilot_rank):
                 self.logger.warning(f"[ASCARIS] Pilot does not have OneWorld rank")
                 result['error'] = "You need OneWorld rank or higher to file OWD flights."
                 return result
             
-            # 2. Get aircraft data for ID 78 (fixed for OWD)
-            self.logger.info(f"[ASCARIS] Getting aircraft ID 78 for OWD")
-            aircraft = await self.bot.aircraft_model.get_aircraft_by_id(78)
+            # 2. Aircraft data for ID 78 (fixed for OWD)
             if not aircraft:
                 self.logger.error(f"[ASCARIS] One World aircraft (ID: 78) not found in database")
                 result['error'] = "One World aircraft (ID: 78) not found in database."
@@ -712,13 +802,9 @@ class PirepFilingService:
             
             result['aircraft_data'] = aircraft
             
-            # 3. Search OWD routes ONLY
-            self.logger.info(f"[ASCARIS] Searching OWD route for {dep} → {arr}")
-            if hasattr(self.bot, 'owd_route_model'):
-                route_data = await self.bot.owd_route_model.find_route_by_icao(dep, arr)
-            else:
+            # 3. OWD routes ONLY
+            if not hasattr(self.bot, 'owd_route_model'):
                 self.logger.error(f"[ASCARIS] owd_route_model not available")
-                route_data = None
             
             if not route_data:
                 self.logger.warning(f"[ASCARIS] OWD route NOT found for {dep} → {arr}")
@@ -755,7 +841,7 @@ class PirepFilingService:
             self.logger.info(f"[ASCARIS] Processing as Event flight")
             
             # 1. Get aircraft data for ID 11 (fixed for events)
-            aircraft = await self.bot.aircraft_model.get_aircraft_by_id(11)
+            aircraft = await context.aircraft_by_id(DEFAULT_AIRCRAFT_ID)
             if not aircraft:
                 self.logger.error(f"[ASCARIS] Event aircraft (ID: 11) not found in database")
                 result['error'] = "Event aircraft (ID: 11) not found in database."
@@ -794,9 +880,13 @@ class PirepFilingService:
             if_aircraft_id = flight_data.get('aircraft_id', '')
             if_livery_id = flight_data.get('livery_id', '')
             
-            # 1. Check if aircraft is valid by attempting exact match
-            exact_aircraft = await self.bot.aircraft_model.get_aircraft_by_if_ids(if_aircraft_id, if_livery_id)
+            # 1. Check if aircraft is valid by attempting exact match (routes load alongside)
+            exact_aircraft, routes_list = await asyncio.gather(
+                context.aircraft_by_if_ids(if_aircraft_id, if_livery_id),
+                context.cc_routes(dep, arr)
+            )
             is_invalid_aircraft = (exact_aircraft is None)
+            result['is_invalid_aircraft'] = is_invalid_aircraft
             
             # 2. Assign aircraft
             aircraft = None
@@ -808,10 +898,10 @@ class PirepFilingService:
             # 3. If no aircraft matched or invalid, try to use aircraft from selected dropdown or default to 11
             if not aircraft:
                 if selected_aircraft_id:
-                    aircraft = await self.bot.aircraft_model.get_aircraft_by_id(selected_aircraft_id)
+                    aircraft = await context.aircraft_by_id(selected_aircraft_id)
                 else:
                     # Try to get aircraft ID 11 as fallback
-                    aircraft = await self.bot.aircraft_model.get_aircraft_by_id(11)
+                    aircraft = await context.aircraft_by_id(DEFAULT_AIRCRAFT_ID)
                     if aircraft:
                         rank_warning = "⚠️ Aircraft not recognized, used default"
             
@@ -825,12 +915,12 @@ class PirepFilingService:
             
             # 4. Check rank requirement
             self.logger.info(f"[ASCARIS] Checking rank requirement for aircraft_id={aircraft.get('id')}")
-            rank_check = await self.bot.rank_model.can_pilot_fly_aircraft(pilot_id, aircraft['id'])
+            rank_check = await context.can_fly(aircraft)
             
             # If rank check fails, use aircraft_id=11
             if not rank_check.get('can_fly'):
                 self.logger.warning(f"[ASCARIS] Rank check failed, using aircraft_id=11")
-                aircraft = await self.bot.aircraft_model.get_aircraft_by_id(11)
+                aircraft = await context.aircraft_by_id(DEFAULT_AIRCRAFT_ID)
                 if aircraft:
                     rank_check = {'can_fly': True, 'message': 'Used default aircraft due to rank'}
                     rank_warning = "⚠️ Aircraft not in rank, used default aircraft"
@@ -840,9 +930,6 @@ class PirepFilingService:
             
             # 5. Search CC routes ONLY (no OWD fallback)
             self.logger.info(f"[ASCARIS-ROUTE-DEBUG] Starting extensive route search for DEP={dep} ARR={arr}")
-            self.logger.info(f"[ASCARIS-ROUTE-DEBUG] Calling: self.bot.routes_model.find_all_routes_with_exact_aircraft_by_icao('{dep}', '{arr}')")
-            
-            routes_list = await self.bot.routes_model.find_all_routes_with_exact_aircraft_by_icao(dep, arr)
             
             self.logger.info(f"[ASCARIS-ROUTE-DEBUG] Database returned {len(routes_list)} route row(s).")
             
@@ -933,7 +1020,7 @@ class PirepFilingService:
         
         try:
             self.logger.info(f"[ASCARIS] Submitting PIREP to Crew Center API...")
-            response = await self.bot.cc_api_manager.submit_pirep(
+            response = await self.bot.pirep_submission_queue.submit(
                 pilot_id=pilot_id,
                 flight_num=flight_num,
                 departure=departure,
@@ -947,15 +1034,19 @@ class PirepFilingService:
             
             self.logger.info(f"[ASCARIS] Crew Center API response: {response}")
             
-            success = response and response.get('status') == 0
+            queued = bool(response and response.get('queued'))
+            success = bool(response and (response.get('status') == 0 or queued))
             
-            if success:
+            if queued:
+                self.logger.info(f"[ASCARIS] Crew Center unreachable, PIREP queued for retry")
+            elif success:
                 self.logger.info(f"[ASCARIS] PIREP submitted successfully!")
             else:
                 self.logger.warning(f"[ASCARIS] PIREP submission failed: status={response.get('status') if response else 'None'}, message={response.get('message') if response else 'None'}")
             
             return {
                 'success': success,
+                'queued': queued,
                 'response': response,
                 'error': None if success else (response.get('message', 'API error') if response else 'Crew Center returned empty response (400 Bad Request)')
             }
@@ -964,6 +1055,7 @@ class PirepFilingService:
             self.logger.error(f"[ASCARIS] Error submitting Ascaris PIREP: {e}", exc_info=True)
             return {
                 'success': False,
+                'queued': False,
                 'response': None,
                 'error': str(e)
             }
\ No newline at end of file
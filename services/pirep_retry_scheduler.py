@@ -0,0 +1,125 @@
+import asyncio
+import heapq
+import itertools
+import logging
+from typing import Awaitable, Callable, Dict, Hashable, List, Optional, Set, Tuple
+
+
+class RetryJob:
+    """A pending automatic re-validation, identified by its key (the thread ID)."""
+
+    def __init__(self, key: Hashable, payload: dict):
+        self.key = key
+        self.payload = payload
+        self.attempt = 0
+        self.cancelled = False
+
+
+class PirepRetryScheduler:
+    """
+    Re-runs PIREP lookup/validation on a backoff schedule using one timer heap.
+
+    A single runner task sleeps until the earliest due job, so a burst of
+    unmatched PIREPs costs one task rather than one sleeping task each.
+
+    The handler is called as ``await handler(job, final)`` and returns True once
+    the job is finished (result posted). If it returns False the job is
+    rescheduled with the next backoff delay; on the final attempt ``final`` is
+    True and the handler is expected to post the give-up message.
+    """
+
+    DEFAULT_BACKOFF = (60, 120, 300, 900)  # 1, 2, 5 and 15 minutes
+
+    def __init__(self, handler: Callable[[RetryJob, bool], Awaitable[bool]], backoff: Tuple[int, ...] = DEFAULT_BACKOFF):
+        self.handler = handler
+        self.backoff = tuple(backoff)
+        self.logger = logging.getLogger('oryxie.pirep_retry_scheduler')
+        self._heap: List[Tuple[float, int, RetryJob]] = []
+        self._jobs: Dict[Hashable, RetryJob] = {}
+        self._counter = itertools.count()
+        self._wakeup = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+        self._attempts: Set[asyncio.Task] = set()
+
+    def schedule(self, key: Hashable, **payload) -> bool:
+        """Start the backoff schedule for key. Returns False if it is already scheduled."""
+        if key in self._jobs:
+            return False
+        job = RetryJob(key, payload)
+        self._jobs[key] = job
+        self._push(job)
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+        return True
+
+    def cancel(self, key: Hashable) -> None:
+        """Drop a scheduled job (e.g. after a successful manual retry)."""
+        job = self._jobs.pop(key, None)
+        if job:
+            job.cancelled = True
+
+    def is_scheduled(self, key: Hashable) -> bool:
+        return key in self._jobs
+
+    def close(self) -> None:
+        if self._task and not self._task.done():
+            self._task.cancel()
+        self._task = None
+        for task in self._attempts:
+            task.cancel()
+        self._attempts.clear()
+        self._heap.clear()
+        self._jobs.clear()
+
+    @property
+    def pending_count(self) -> int:
+        return len(self._jobs)
+
+    def _push(self, job: RetryJob) -> None:
+        due = asyncio.get_running_loop().time() + self.backoff[job.attempt]
+        heapq.heappush(self._heap, (due, next(self._counter), job))
+        self._wakeup.set()
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        while self._jobs:
+            # Cancelled jobs are dropped lazily when they reach the top of the heap
+            while self._heap and self._heap[0][2].cancelled:
+                heapq.heappop(self._heap)
+            if not self._heap:
+                break
+
+            due, _, job = self._heap[0]
+            delay = due - loop.time()
+            if delay > 0:
+                self._wakeup.clear()
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=delay)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+
+            heapq.heappop(self._heap)
+            # Keep a reference so the attempt isn't garbage collected mid-flight
+            task = asyncio.create_task(self._attempt(job))
+            self._attempts.add(task)
+            task.add_done_callback(self._attempts.discard)
+
+    async def _attempt(self, job: RetryJob):
+        final = job.attempt >= len(self.backoff) - 1
+        try:
+            done = await self.handler(job, final)
+        except Exception as e:
+            self.logger.error(f"Retry handler failed for {job.key} (attempt {job.attempt + 1}): {e}")
+            done = final
+
+        if job.cancelled:
+            return
+        if done or final:
+            self._jobs.pop(job.key, None)
+            return
+
+        job.attempt += 1
+        self._push(job)
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
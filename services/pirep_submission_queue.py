@@ -0,0 +1,203 @@
+import asyncio
+import hashlib
+import logging
+from datetime import datetime, timedelta
+from typing import Dict, Optional, Tuple
+
+from database.pirep_submission_model import STATUS_PENDING, STATUS_SENT
+
+
+class PirepSubmissionQueue:
+    """
+    Durable, idempotent front end for CrewCenterAPIManager.submit_pirep.
+
+    Every submission is keyed by (pilot, flight number, route, date, duration)
+    and written to pirep_submissions before it is sent, so:
+      - a double click (or a retry of an already filed PIREP) returns the first
+        result instead of filing twice;
+      - a network error or an HTTP 5xx/408/429 leaves the PIREP in the
+        backlog, which a background task retries with backoff, including
+        after a restart.
+
+    The first attempt is made inline so the user normally gets the Crew Center
+    answer immediately. If it cannot be delivered yet, submit() returns a
+    response with status 'queued' and the queue takes over. A response with a
+    non-zero status from Crew Center, including an HTTP 4xx, is a rejection:
+    it is returned to the caller straight away and never retried.
+
+    Usage:
+        response = await bot.pirep_submission_queue.submit(pilot_id=..., flight_num=..., ...)
+        if response.get('status') == 0 or response.get('queued'): ...
+    """
+
+    BACKOFF = (30, 120, 600, 1800, 7200)  # seconds between retries
+    RETRYABLE_HTTP = (408, 429)  # plus every 5xx
+    POLL_INTERVAL = 30  # seconds
+    QUEUED_MESSAGE = "Crew Center is unreachable right now. Your PIREP is saved and will be filed automatically."
+
+    def __init__(self, bot):
+        self.bot = bot
+        self.logger = logging.getLogger('oryxie.pirep_submission_queue')
+        self._inflight: Dict[str, asyncio.Future] = {}
+        # Keys sent in this process, in case the 'sent' row could not be written
+        self._sent_keys = set()
+        self._task: Optional[asyncio.Task] = None
+
+    @staticmethod
+    def make_key(pilot_id, flight_num, departure, arrival, date, flight_time) -> str:
+        raw = "|".join(str(v or '').strip().upper() for v in (pilot_id, flight_num, departure, arrival, date, flight_time))
+        return hashlib.sha1(raw.encode('utf-8')).hexdigest()
+
+    def start(self) -> None:
+        """Start the background retry loop (also resumes the backlog after a restart)."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    def close(self) -> None:
+        if self._task and not self._task.done():
+            self._task.cancel()
+        self._task = None
+
+    # =========================================================================
+    # SUBMISSION
+    # =========================================================================
+
+    async def submit(
+        self,
+        pilot_id: int,
+        flight_num: str,
+        departure: str,
+        arrival: str,
+        flight_time: str,
+        date: str,
+        aircraft_id: int,
+        fuel_used: float = 0,
+        multiplier: Optional[str] = None
+    ) -> Dict:
+        """
+        Submit a PIREP. Same arguments and response shape as CrewCenterAPIManager.submit_pirep,
+        plus 'queued': True when it was saved for retry and 'duplicate': True when it had
+        already been filed.
+        """
+        payload = {
+            'pilot_id': pilot_id,
+            'flight_num': flight_num,
+            'departure': departure,
+            'arrival': arrival,
+            'flight_time': flight_time,
+            'date': date,
+            'aircraft_id': aircraft_id,
+            'fuel_used': fuel_used,
+            'multiplier': multiplier,
+        }
+        key = self.make_key(pilot_id, flight_num, departure, arrival, date, flight_time)
+
+        # Concurrent submits of the same PIREP share one attempt
+        future = self._inflight.get(key)
+        if future is None:
+            future = self._track(key, self._submit_once(key, payload))
+        return await asyncio.shield(future)
+
+    def _track(self, key: str, coro) -> asyncio.Future:
+        future = asyncio.ensure_future(coro)
+        self._inflight[key] = future
+        future.add_done_callback(lambda _: self._inflight.pop(key, None))
+        return future
+
+    def _queued_response(self, key: str) -> Dict:
+        return {'status': 'queued', 'queued': True, 'result': None, 'message': self.QUEUED_MESSAGE, 'idempotency_key': key}
+
+    async def _submit_once(self, key: str, payload: Dict) -> Dict:
+        model = self.bot.pirep_submission_model
+        existing = await model.get_submission(key)
+
+        if key in self._sent_keys or (existing and existing['status'] == STATUS_SENT):
+            self.logger.info(f"Duplicate PIREP submission {key} for pilot {payload['pilot_id']} ignored")
+            response = (existing or {}).get('response') or {'status': 0, 'result': None}
+            return {**response, 'duplicate': True}
+
+        if existing and existing['status'] == STATUS_PENDING:
+            # Already in the backlog; the retry loop owns it
+            return self._queued_response(key)
+
+        if not await model.create_submission(key, payload['pilot_id'], payload):
+            self.logger.warning(f"PIREP submission {key} is not persisted; sending without a durable backlog entry")
+
+        self.start()
+        return await self._attempt(key, payload, attempts=0)
+
+    async def _send(self, payload: Dict) -> Tuple[Optional[Dict], Optional[str]]:
+        """Returns (response, transient_error). response is None when the attempt should be retried."""
+        if not self.bot.cc_api_manager:
+            return None, "Crew Center API unavailable"
+        try:
+            response = await self.bot.cc_api_manager.submit_pirep(**payload)
+        except Exception as e:
+            return None, str(e)
+        if not isinstance(response, dict):
+            return None, "No response from Crew Center (connection error)"
+        http_status = response.get('http_status')
+        if http_status and (http_status >= 500 or http_status in self.RETRYABLE_HTTP):
+            return None, response.get('message') or f"HTTP {http_status}"
+        return response, None
+
+    async def _attempt(self, key: str, payload: Dict, attempts: int) -> Dict:
+        model = self.bot.pirep_submission_model
+        attempts += 1
+        response, error = await self._send(payload)
+
+        if response is not None and response.get('status') == 0:
+            self._sent_keys.add(key)
+            if not await model.mark_sent(key, attempts, response):
+                self.logger.error(f"PIREP {key} was filed but could not be marked as sent")
+            # The pilot's hours (and so rank and multipliers) just changed
+            prefetcher = getattr(self.bot, 'pilot_prefetcher', None)
+            if prefetcher:
+                prefetcher.invalidate_pilot(payload['pilot_id'])
+            if attempts > 1:
+                self.logger.info(f"PIREP {key} for pilot {payload['pilot_id']} filed on attempt {attempts}")
+            return response
+
+        if response is not None:
+            # Crew Center answered and rejected it; retrying would not help
+            message = str(response.get('message') or response.get('result') or 'Rejected by Crew Center')
+            await model.mark_failed(key, attempts, message, response)
+            return response
+
+        if attempts > len(self.BACKOFF):
+            self.logger.error(
+                f"Giving up on PIREP {key} for pilot {payload['pilot_id']} "
+                f"({payload['flight_num']} {payload['departure']}-{payload['arrival']}) after {attempts} attempts: {error}"
+            )
+            await model.mark_failed(key, attempts, error or 'Unknown error')
+            return {'status': 'failed', 'result': None, 'message': f"Crew Center unreachable after {attempts} attempts"}
+
+        delay = self.BACKOFF[attempts - 1]
+        self.logger.warning(f"PIREP {key} attempt {attempts} failed ({error}); retrying in {delay}s")
+        await model.mark_retry(key, attempts, datetime.utcnow() + timedelta(seconds=delay), error or 'Unknown error')
+        return self._queued_response(key)
+
+    # =========================================================================
+    # BACKLOG
+    # =========================================================================
+
+    async def _run(self):
+        await self.bot.wait_until_ready()
+        while True:
+            try:
+                await self.process_backlog()
+            except Exception as e:
+                self.logger.error(f"Error processing PIREP submission backlog: {e}")
+            await asyncio.sleep(self.POLL_INTERVAL)
+
+    async def process_backlog(self) -> int:
+        """Retry every due submission concurrently. Returns how many were attempted."""
+        rows = await self.bot.pirep_submission_model.get_due_submissions()
+        futures = [
+            self._track(row['idempotency_key'], self._attempt(row['idempotency_key'], row['payload'], row['attempts']))
+            for row in rows
+            if row.get('payload') and row['idempotency_key'] not in self._inflight
+        ]
+        if futures:
+            await asyncio.gather(*futures, return_exceptions=True)
+        return len(futures)
@@ -75,13 +75,20 @@ def get_multiplier_text(pirep_time, api_time, pirep_multiplier):
 import logging
 from typing import TYPE_CHECKING, Optional, Dict, List
 import asyncio
+import csv
+import io
 from datetime import datetime, timedelta
+from services.landing_score_engine import LandingScoreEngine
 
 logger = logging.getLogger(__name__)
 
 class PirepValidationService:
+    BATCH_CONCURRENCY = 5
+    BATCH_BUCKETS = ("clean", "suspicious", "failed")
+
     def __init__(self, bot: 'MyBot'):
         self.bot = bot
+        self.landing_engine = LandingScoreEngine()
 
     def calculate_landing_score(self, landing_data: dict) -> dict:
         """
@@ -312,7 +319,12 @@ class PirepValidationService:
             return None
         
         try:
-            user_data = await self.bot.if_api_manager.get_user_by_ifc_username(username_match.group(1))
+            # Through the flight log service so batch validation stays within the IF API budget
+            flight_log_service = getattr(self.bot, 'flight_log_service', None)
+            if flight_log_service:
+                user_data = await flight_log_service.lookup_ifc_user(username_match.group(1))
+            else:
+                user_data = await self.bot.if_api_manager.get_user_by_ifc_username(username_match.group(1))
             if user_data and user_data.get('result'):
                 ifuserid = user_data['result'].get('userId')
                 if ifuserid:
@@ -323,6 +335,66 @@ class PirepValidationService:
         
         return None
 
+    async def _find_matching_flight(self, pirep: Dict, ifuserid: str):
+        """
+        Find the IF flight on the PIREP's route within ±3 days of the PIREP date.
+
+        Returns:
+            (user_flights, matching_flight); user_flights is None when no flight data is available.
+        """
+        pirep_datetime = pirep['date'] if hasattr(pirep['date'], 'date') else datetime.combine(pirep['date'], datetime.min.time())
+        window = {
+            "since": pirep_datetime - timedelta(days=3),
+            "until": pirep_datetime + timedelta(days=3),
+            "departure": pirep['departure'],
+            "arrival": pirep['arrival'],
+        }
+
+        try:
+            user_flights = await self.bot.flight_log_service.get_user_flights(ifuserid, **window)
+            if user_flights == []:
+                # The flight may have landed after the last sync
+                user_flights = await self.bot.flight_log_service.get_user_flights(ifuserid, max_age=timedelta(minutes=1), **window)
+        except Exception as e:
+            logger.error(f"Error getting user flights for {ifuserid}: {e}")
+            user_flights = None
+
+        if user_flights is None:
+            return None, None
+
+        for flight in user_flights:
+            if isinstance(flight, dict) and flight.get('originAirport') == pirep['departure'] and flight.get('destinationAirport') == pirep['arrival']:
+                try:
+                    flight_date = parse_api_datetime(flight['created'])
+                    if flight_date.tzinfo:
+                        flight_date = flight_date.replace(tzinfo=None)
+                    if abs(flight_date - pirep_datetime) < timedelta(days=3):
+                        return user_flights, flight
+                except Exception as e:
+                    logger.debug(f"Error parsing flight date: {e}")
+                    continue
+
+        return user_flights, None
+
+    async def _check_routes(self, pirep: Dict):
+        """Returns (route_valid, route_exists, is_owd_route) for the PIREP's route and flight number."""
+        try:
+            route_valid = await self.check_route_database(pirep['departure'], pirep['arrival'], pirep.get('flightnum'), pirep.get('pilotid'))
+            route_exists = await self.check_route_exists(pirep['departure'], pirep['arrival'], pirep.get('pilotid'))
+            
+            # Check if it's an OWD route
+            is_owd_route = False
+            if route_valid and await self._check_pilot_rank_for_owd(pirep.get('pilotid')):
+                regular_route = await self.bot.routes_model.find_route_by_icao(pirep['departure'], pirep['arrival'])
+                if not regular_route:
+                    is_owd_route = True
+        except Exception as e:
+            logger.error(f"Error checking route database: {e}")
+            route_valid = False
+            route_exists = False
+            is_owd_route = False
+        return route_valid, route_exists, is_owd_route
+
     async def validate_pirep(self, pirep: Dict) -> discord.Embed:
         """Main validation logic - returns Discord embed with results."""
         logger.info(f"[DEBUG] Validating PIREP ID: {pirep.get('pirep_id')}")
@@ -347,62 +419,136 @@ class PirepValidationService:
                 color=discord.Color.orange()
             ).add_field(name="⚠️ VALIDATION SKIPPED", value="Could not resolve Infinite Flight User ID. Manual review required.", inline=False)
 
-        try:
-            user_flights_data = await self.bot.if_api_manager.get_user_flights(ifuserid, hours=72)
-        except Exception as e:
-            logger.error(f"API error getting user flights for {ifuserid}: {e}")
-            user_flights_data = None
+        user_flights, matching_flight = await self._find_matching_flight(pirep, ifuserid)
         
-        if not user_flights_data or not user_flights_data.get('result'):
-            logger.warning(f"[DEBUG] No flight data returned from API for user {ifuserid}")
+        if user_flights is None:
+            logger.warning(f"[DEBUG] No flight data available for user {ifuserid}")
             return discord.Embed(
                 title=f"# {pirep['departure']} - {pirep['arrival']} #",
                 description=f"**Flight Time:** {pirep['formatted_flighttime']}\\n**Pilot:** {pirep['pilot_name']}{iflytics_link}",
                 color=discord.Color.orange()
             ).add_field(name="⚠️ API LIMITATION", value="Flight validation API endpoint not available. Manual review required.", inline=False)
         
-        result_data = user_flights_data['result']
-        user_flights = result_data.get('data', []) if isinstance(result_data, dict) else result_data
-
-        pirep_datetime = pirep['date'] if hasattr(pirep['date'], 'date') else datetime.combine(pirep['date'], datetime.min.time())
-        
-        matching_flight = None
-        for flight in user_flights:
-            if isinstance(flight, dict) and flight.get('originAirport') == pirep['departure'] and flight.get('destinationAirport') == pirep['arrival']:
-                try:
-                    flight_date = parse_api_datetime(flight['created'])
-                    if flight_date.tzinfo:
-                        flight_date = flight_date.replace(tzinfo=None)
-                    if abs(flight_date - pirep_datetime) < timedelta(days=3):
-                        matching_flight = flight
-                        break
-                except Exception as e:
-                    logger.debug(f"Error parsing flight date: {e}")
-                    continue
-        
         logger.info(f"[DEBUG] Matching flight found: {matching_flight is not None}")
 
-        try:
-            route_valid = await self.check_route_database(pirep['departure'], pirep['arrival'], pirep.get('flightnum'), pirep.get('pilotid'))
-            route_exists = await self.check_route_exists(pirep['departure'], pirep['arrival'], pirep.get('pilotid'))
-            
-            # Check if it's an OWD route
-            is_owd_route = False
-            if route_valid and await self._check_pilot_rank_for_owd(pirep.get('pilotid')):
-                regular_route = await self.bot.routes_model.find_route_by_icao(pirep['departure'], pirep['arrival'])
-                if not regular_route:
-                    is_owd_route = True
-        except Exception as e:
-            logger.error(f"Error checking route database: {e}")
-            route_valid = False
-            route_exists = False
-            is_owd_route = False
+        route_valid, route_exists, is_owd_route = await self._check_routes(pirep)
 
         if not matching_flight:
             return self._create_no_match_embed(pirep, pilot_display, user_flights)
 
         return await self._create_validation_embed(pirep, pilot_display, matching_flight, route_valid, route_exists, is_owd_route)
 
+    # ------------------------------------------------------------------
+    # BATCH VALIDATION
+    # ------------------------------------------------------------------
+    async def assess_pirep(self, pirep: Dict) -> Dict:
+        """
+        Run the validation checks for one PIREP without building an embed.
+
+        Returns:
+            Dict with pirep, bucket ('clean', 'suspicious' or 'failed'), issues,
+            and the filed/IF times when a flight was matched.
+        """
+        result = {"pirep": pirep, "bucket": "failed", "issues": [], "time_pirep_sec": None, "time_api_sec": None, "multiplier": pirep.get('multi')}
+        try:
+            ifuserid = await self.resolve_ifuserid(pirep)
+            if not ifuserid:
+                result["issues"].append("Could not resolve IF User ID")
+                return result
+
+            user_flights, matching_flight = await self._find_matching_flight(pirep, ifuserid)
+            if user_flights is None:
+                result["issues"].append("No flight data available")
+                return result
+            if not matching_flight:
+                result["issues"].append("No matching IF flight within ±3 days")
+                return result
+
+            route_valid, route_exists, _ = await self._check_routes(pirep)
+            checks = self._evaluate_flight(pirep, matching_flight, route_valid, route_exists)
+            result.update({
+                "bucket": "suspicious" if checks["issues"] else "clean",
+                "issues": checks["issues"],
+                "time_pirep_sec": checks["time_pirep_sec"],
+                "time_api_sec": checks["time_api_sec"],
+            })
+        except Exception as e:
+            logger.error(f"Error assessing PIREP {pirep.get('pirep_id')}: {e}")
+            result["issues"].append(f"Validation error: {e}")
+        return result
+
+    async def validate_batch(self, pireps: List[Dict]) -> Dict[str, List[Dict]]:
+        """
+        Assess many PIREPs concurrently (at most BATCH_CONCURRENCY at once; IF API calls,
+        including IFC username lookups, are additionally spaced out by the flight log
+        service) and group them into buckets.
+        """
+        semaphore = asyncio.Semaphore(self.BATCH_CONCURRENCY)
+
+        async def run(pirep):
+            async with semaphore:
+                return await self.assess_pirep(pirep)
+
+        results = await asyncio.gather(*(run(p) for p in pireps))
+
+        buckets = {bucket: [] for bucket in self.BATCH_BUCKETS}
+        for result in results:
+            buckets[result["bucket"]].append(result)
+        return buckets
+
+    def build_batch_report(self, buckets: Dict[str, List[Dict]]):
+        """Build the summary embed and a CSV attachment for validate_batch results."""
+        total = sum(len(items) for items in buckets.values())
+        embed = discord.Embed(
+            title="📋 Pending PIREP Batch Validation",
+            description=(
+                f"✅ **Clean:** {len(buckets['clean'])}\n"
+                f"⚠️ **Suspicious:** {len(buckets['suspicious'])}\n"
+                f"❌ **Failed:** {len(buckets['failed'])}"
+            ),
+            color=discord.Color.green() if not buckets['suspicious'] and not buckets['failed'] else discord.Color.orange()
+        )
+
+        titles = {"clean": "✅ Clean", "suspicious": "⚠️ Suspicious", "failed": "❌ Failed"}
+        for bucket in self.BATCH_BUCKETS:
+            lines = []
+            for item in buckets[bucket]:
+                p = item["pirep"]
+                line = f"`{p['pirep_id']}` {p.get('callsign') or p['pilot_name']} {p['departure']}→{p['arrival']}"
+                if item["issues"]:
+                    line += f" — {', '.join(item['issues'])}"
+                lines.append(line)
+            if not lines:
+                continue
+            value = ""
+            for count, line in enumerate(lines):
+                if len(value) + len(line) + 1 > 1000:
+                    value += f"\n…and {len(lines) - count} more (see CSV)"
+                    break
+                value += line + "\n"
+            embed.add_field(name=f"{titles[bucket]} ({len(lines)})", value=value, inline=False)
+
+        embed.set_footer(text=f"{total} PIREPs checked")
+        embed.timestamp = discord.utils.utcnow()
+
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerow(["bucket", "pirep_id", "callsign", "pilot", "flightnum", "departure", "arrival", "date",
+                         "filed_time", "if_time", "multiplier", "issues"])
+        for bucket in self.BATCH_BUCKETS:
+            for item in buckets[bucket]:
+                p = item["pirep"]
+                writer.writerow([
+                    bucket, p['pirep_id'], p.get('callsign', ''), p['pilot_name'], p.get('flightnum', ''),
+                    p['departure'], p['arrival'], p['date'],
+                    format_flight_time(item["time_pirep_sec"]) if item["time_pirep_sec"] is not None else '',
+                    format_flight_time(item["time_api_sec"]) if item["time_api_sec"] is not None else '',
+                    item["multiplier"] or '', "; ".join(item["issues"])
+                ])
+        csv_file = discord.File(io.BytesIO(buffer.getvalue().encode('utf-8')), filename="pirep_batch_validation.csv")
+
+        return embed, csv_file
+
     def _create_no_match_embed(self, pirep, pilot_display, user_flights):
         """Create embed for when no matching flight is found."""
         ifc_username = self.extract_ifc_username(pirep.get('ifc'))
@@ -435,13 +581,11 @@ class PirepValidationService:
         embed.add_field(name="❌ MATCH NOT FOUND - DETAILED ANALYSIS", value="\n".join(analysis_details), inline=False)
         return embed
 
-    async def _create_validation_embed(self, pirep, pilot_display, matching_flight, route_valid, route_exists, is_owd_route=False):
-        """Create detailed validation embed with all checks."""
-        landings = matching_flight.get('landingCount') if matching_flight.get('landingCount') is not None else 'N/A'
+    def _evaluate_flight(self, pirep, matching_flight, route_valid, route_exists) -> Dict:
+        """Run the route, aircraft, time and multiplier checks for a matched flight."""
         route_match = f"{pirep['departure']} → {pirep['arrival']}" == f"{matching_flight['originAirport']} → {matching_flight['destinationAirport']}"
-        aircraft_pirep = pirep['aircraft_name']
         aircraft_api_name = self.bot.aircraft_name_map.get(matching_flight.get('aircraftId'), "Unknown Aircraft")
-        aircraft_match = aircraft_pirep == aircraft_api_name
+        aircraft_match = pirep['aircraft_name'] == aircraft_api_name
         
         time_pirep_sec = 0
         time_api_sec = 0
@@ -469,16 +613,6 @@ class PirepValidationService:
             pirep_multiplier = 1.0
         multiplier_text = get_multiplier_text(time_pirep_sec, time_api_sec, pirep_multiplier)
         
-        livery_name = await self.resolve_livery_name(matching_flight.get('aircraftId'), matching_flight.get('liveryId'))
-        
-        try:
-            flight_date = parse_api_datetime(matching_flight['created'])
-            if flight_date.tzinfo is not None:
-                flight_date = flight_date.replace(tzinfo=None)
-            date_str = flight_date.strftime('%d %b %Y %H:%M Z')
-        except Exception as e:
-            date_str = "Unknown"
-        
         issues = []
         if not route_match:
             issues.append("Route mismatch")
@@ -506,6 +640,44 @@ class PirepValidationService:
             issues.append("Multiplier higher than 3x")
         if significant_time_error:
             issues.append("Significant time discrepancy")
+
+        return {
+            "route_match": route_match,
+            "aircraft_api_name": aircraft_api_name,
+            "aircraft_match": aircraft_match,
+            "time_pirep_sec": time_pirep_sec,
+            "time_api_sec": time_api_sec,
+            "pirep_multiplier": pirep_multiplier,
+            "multiplier_text": multiplier_text,
+            "multiplier_used": multiplier_used,
+            "high_multiplier": high_multiplier,
+            "significant_time_error": significant_time_error,
+            "issues": issues,
+        }
+
+    async def _create_validation_embed(self, pirep, pilot_display, matching_flight, route_valid, route_exists, is_owd_route=False):
+        """Create detailed validation embed with all checks."""
+        landings = matching_flight.get('landingCount') if matching_flight.get('landingCount') is not None else 'N/A'
+        aircraft_pirep = pirep['aircraft_name']
+        checks = self._evaluate_flight(pirep, matching_flight, route_valid, route_exists)
+        aircraft_api_name = checks['aircraft_api_name']
+        aircraft_match = checks['aircraft_match']
+        time_api_sec = checks['time_api_sec']
+        multiplier_text = checks['multiplier_text']
+        issues = checks['issues']
+        multiplier_used = checks['multiplier_used']
+        high_multiplier = checks['high_multiplier']
+        significant_time_error = checks['significant_time_error']
+        
+        livery_name = await self.resolve_livery_name(matching_flight.get('aircraftId'), matching_flight.get('liveryId'))
+        
+        try:
+            flight_date = parse_api_datetime(matching_flight['created'])
+            if flight_date.tzinfo is not None:
+                flight_date = flight_date.replace(tzinfo=None)
+            date_str = flight_date.strftime('%d %b %Y %H:%M Z')
+        except Exception as e:
+            date_str = "Unknown"
         
         icon_aircraft = "✅" if aircraft_match else "❌"
         icon_time = "❌" if ("INVALID" in multiplier_text or "❌" in multiplier_text or high_multiplier or significant_time_error) else "✅"
@@ -618,16 +790,13 @@ class PirepValidationService:
             return ["No IF User ID found"]
         
         try:
-            user_flights_data = await self.bot.if_api_manager.get_user_flights(ifuserid, hours=72)
+            user_flights = await self.bot.flight_log_service.get_user_flights(ifuserid, limit=10)
         except Exception as e:
             return [f"API Error: {e}"]
         
-        if not user_flights_data or not user_flights_data.get('result'):
+        if user_flights is None:
             return ["No flight data from API"]
         
-        result_data = user_flights_data['result']
-        user_flights = result_data.get('data', []) if isinstance(result_data, dict) else result_data
-        
         pirep_datetime = pirep['date'] if hasattr(pirep['date'], 'date') else datetime.combine(pirep['date'], datetime.min.time())
         
         debug_info = []
@@ -689,28 +858,25 @@ class PirepValidationService:
                 color=discord.Color.red()
             )]
         
+        pirep_date = pirep['date'] if hasattr(pirep['date'], 'date') else datetime.combine(pirep['date'], datetime.min.time())
+
         try:
-            user_flights_data = await self.bot.if_api_manager.get_user_flights(ifuserid, hours=72)
+            user_flights = await self.bot.flight_log_service.get_user_flights(
+                ifuserid, since=pirep_date - timedelta(days=7), until=pirep_date + timedelta(days=7)
+            )
         except Exception as e:
-            logger.error(f"[DEBUG] API Error getting flight history: {e}")
-            return [discord.Embed(
-                title="⚠️ Flight History Unavailable",
-                description="Could not fetch flight data from API.",
-                color=discord.Color.orange()
-            )]
+            logger.error(f"[DEBUG] Error getting flight history: {e}")
+            user_flights = None
         
-        if not user_flights_data or not user_flights_data.get('result'):
-            logger.warning("[DEBUG] No result in user_flights_data")
+        if user_flights is None:
+            logger.warning("[DEBUG] No flight data available for history")
             return [discord.Embed(
                 title="⚠️ Flight History Unavailable",
                 description="Could not fetch flight data from API.",
                 color=discord.Color.orange()
             )]
         
-        result_data = user_flights_data['result']
-        user_flights = result_data.get('data', []) if isinstance(result_data, dict) else result_data
-        
-        logger.info(f"[DEBUG] Processing {len(user_flights)} flights from API")
+        logger.info(f"[DEBUG] Processing {len(user_flights)} stored flights")
         
         expert_flights = []
         for f in user_flights:
@@ -724,8 +890,6 @@ class PirepValidationService:
             except Exception as e:
                 logger.error(f"[DEBUG] Error processing flight record: {f} - Error: {e}")
         
-        pirep_date = pirep['date'] if hasattr(pirep['date'], 'date') else datetime.combine(pirep['date'], datetime.min.time())
-        
         past_flights = []
         future_flights = []
         
@@ -0,0 +1,166 @@
+import io
+import math
+import os
+import logging
+from collections import OrderedDict
+
+import numpy as np
+import matplotlib.image as mpimg
+import cartopy.crs as ccrs
+import cartopy.feature as cfeature
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+from services.route_map_cache import RouteMapCache
+
+TILE_SIZE = 512  # pixels
+MAX_ZOOM = 8  # 512 * 2**8 = 131072 px around the world, enough for short Gulf hops
+MAX_LAT = 85.05112878  # Web Mercator cut-off
+MERCATOR_HALF_WORLD = 20037508.342789244  # EPSG:3857 metres from 0 to 180°
+OCEAN_COLOR = '#2f3136'
+
+
+def lonlat_to_pixels(lons, lats, zoom: int):
+    """
+    Web Mercator world-pixel coordinates at a zoom level (y grows southwards).
+    Longitudes are not wrapped, so an unwrapped route stays continuous.
+    """
+    world = TILE_SIZE * (2 ** zoom)
+    lons = np.asarray(lons, dtype=float)
+    lats = np.radians(np.clip(np.asarray(lats, dtype=float), -MAX_LAT, MAX_LAT))
+    x = (lons + 180.0) / 360.0 * world
+    y = (1.0 - np.log(np.tan(np.pi / 4 + lats / 2)) / np.pi) / 2.0 * world
+    return x, y
+
+
+def zoom_for_span(lon_span: float, out_width: int) -> int:
+    """Smallest zoom at which lon_span degrees covers at least out_width pixels."""
+    if lon_span <= 0:
+        return MAX_ZOOM
+    pixels_at_zero = lon_span / 360.0 * TILE_SIZE
+    return int(min(MAX_ZOOM, max(0, math.ceil(math.log2(out_width / pixels_at_zero)))))
+
+
+class BasemapTiles:
+    """
+    Dark-theme Natural Earth basemap as cached Web Mercator raster tiles.
+
+    Each tile is drawn through cartopy once, then kept decoded in a small
+    in-process LRU and as a PNG in a shared disk directory
+    (ROUTE_MAP_TILE_DIR, default cache/basemap_tiles), so render processes and
+    restarts reuse each other's work. crop() stitches the tiles covering a
+    world-pixel box; the route is drawn on top by RouteMapRenderer.
+    """
+
+    # Bump whenever the basemap styling changes
+    STYLE_VERSION = 1
+    MEMORY_TILES = 64  # Decoded tiles kept per process (~0.75 MB each)
+
+    def __init__(self):
+        self.logger = logging.getLogger('oryxie.route_basemap')
+        # --- MAX PERFORMANCE CONFIGURATION ---
+        # '110m' resolution (Lowest detail, fastest render)
+        self.land_low = cfeature.NaturalEarthFeature(
+            'physical', 'land', '110m', facecolor='#202225')
+
+        self.borders_low = cfeature.NaturalEarthFeature(
+            'cultural', 'admin_0_boundary_lines_land', '110m',
+            edgecolor='gray', linewidth=0.5, alpha=0.5, facecolor='none')
+
+        self.coast_low = cfeature.NaturalEarthFeature(
+            'physical', 'coastline', '110m',
+            edgecolor='#dcdcdc', linewidth=0.9, facecolor='none')
+
+        self.store = RouteMapCache(
+            directory=os.getenv("ROUTE_MAP_TILE_DIR", os.path.join("cache", "basemap_tiles")),
+            memory_items=0,
+            disk_max_mb=int(os.getenv("ROUTE_MAP_TILE_CACHE_MB", 500))
+        )
+        self._tiles: "OrderedDict[tuple, np.ndarray]" = OrderedDict()
+        self._background = np.array([int(OCEAN_COLOR[i:i + 2], 16) for i in (1, 3, 5)], dtype=np.uint8)
+
+    def preload(self):
+        """Read the Natural Earth shapefiles now rather than on the first cold tile."""
+        for feature in (self.land_low, self.borders_low, self.coast_low):
+            list(feature.geometries())
+
+    # =========================================================================
+    # TILES
+    # =========================================================================
+
+    def _key(self, zoom: int, x: int, y: int) -> str:
+        return f"tile_v{self.STYLE_VERSION}_z{zoom}_{x}_{y}"
+
+    def _draw_tile(self, zoom: int, x: int, y: int) -> np.ndarray:
+        size = MERCATOR_HALF_WORLD * 2 / (2 ** zoom)
+        left = -MERCATOR_HALF_WORLD + x * size
+        top = MERCATOR_HALF_WORLD - y * size
+
+        dpi = 100
+        fig = Figure(figsize=(TILE_SIZE / dpi, TILE_SIZE / dpi), dpi=dpi, facecolor=OCEAN_COLOR)
+        canvas = FigureCanvasAgg(fig)
+        ax = fig.add_axes([0, 0, 1, 1], projection=ccrs.Mercator.GOOGLE)
+        ax.set_xlim(left, left + size)
+        ax.set_ylim(top - size, top)
+        ax.axis('off')
+        ax.add_feature(self.land_low)
+        ax.add_feature(self.borders_low)
+        ax.add_feature(self.coast_low)
+        canvas.draw()
+        return np.asarray(canvas.buffer_rgba())[:, :, :3].copy()
+
+    def tile(self, zoom: int, x: int, y: int) -> np.ndarray:
+        """RGB uint8 array (TILE_SIZE x TILE_SIZE x 3) for one tile; x wraps around the world."""
+        x %= 2 ** zoom
+        key = (zoom, x, y)
+        cached = self._tiles.get(key)
+        if cached is not None:
+            self._tiles.move_to_end(key)
+            return cached
+
+        disk_key = self._key(zoom, x, y)
+        data = self.store.get(disk_key)
+        if data is not None:
+            image = (mpimg.imread(io.BytesIO(data), format='png')[:, :, :3] * 255).round().astype(np.uint8)
+        else:
+            image = self._draw_tile(zoom, x, y)
+            buf = io.BytesIO()
+            mpimg.imsave(buf, image, format='png')
+            self.store.put(disk_key, buf.getvalue())
+
+        self._tiles[key] = image
+        while len(self._tiles) > self.MEMORY_TILES:
+            self._tiles.popitem(last=False)
+        return image
+
+    def prerender(self, max_zoom: int = 3, min_zoom: int = 0):
+        """Draw every tile from min_zoom to max_zoom (85 tiles for 0-3) so world-scale maps never hit cartopy."""
+        for zoom in range(min_zoom, max_zoom + 1):
+            for x in range(2 ** zoom):
+                for y in range(2 ** zoom):
+                    self.tile(zoom, x, y)
+
+    # =========================================================================
+    # CROPPING
+    # =========================================================================
+
+    def crop(self, zoom: int, x0: float, y0: float, x1: float, y1: float) -> np.ndarray:
+        """
+        Basemap for the world-pixel box [x0, x1) x [y0, y1) at zoom. Areas
+        beyond the poles are filled with the ocean colour.
+        """
+        x0, y0, x1, y1 = int(math.floor(x0)), int(math.floor(y0)), int(math.ceil(x1)), int(math.ceil(y1))
+        tx0, tx1 = x0 // TILE_SIZE, (x1 - 1) // TILE_SIZE
+        ty0, ty1 = y0 // TILE_SIZE, (y1 - 1) // TILE_SIZE
+        tiles_per_side = 2 ** zoom
+
+        mosaic = np.empty(((ty1 - ty0 + 1) * TILE_SIZE, (tx1 - tx0 + 1) * TILE_SIZE, 3), dtype=np.uint8)
+        mosaic[:] = self._background
+        for ty in range(max(ty0, 0), min(ty1, tiles_per_side - 1) + 1):
+            row = (ty - ty0) * TILE_SIZE
+            for tx in range(tx0, tx1 + 1):
+                col = (tx - tx0) * TILE_SIZE
+                mosaic[row:row + TILE_SIZE, col:col + TILE_SIZE] = self.tile(zoom, tx, ty)
+
+        off_x, off_y = x0 - tx0 * TILE_SIZE, y0 - ty0 * TILE_SIZE
+        return mosaic[off_y:off_y + (y1 - y0), off_x:off_x + (x1 - x0)]
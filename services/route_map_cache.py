@@ -0,0 +1,163 @@
+import hashlib
+import logging
+import os
+import threading
+from collections import OrderedDict
+from typing import Optional
+
+
+class RouteMapCache:
+    """
+    Two-tier cache of rendered route map PNGs.
+
+    Keys are content addresses built from (departure, arrival, style version),
+    or from the whole route set for overview maps, so bumping the style version
+    in RouteMapService makes every old image a miss without clearing anything.
+
+      - Memory: LRU of PNG bytes, bounded by entry count (0 for disk only).
+      - Disk: one <key>.png per map in a directory bounded by total size. The
+        least recently used files (by mtime, touched on every hit) are evicted.
+        Survives restarts.
+
+    Methods are synchronous and thread-safe, and several processes may share
+    one directory. Disk access should be done off the event loop.
+    """
+
+    def __init__(self, directory: str = None, memory_items: int = None, disk_max_mb: int = None):
+        self.logger = logging.getLogger('oryxie.route_map_cache')
+        self.directory = directory or os.getenv("ROUTE_MAP_CACHE_DIR", os.path.join("cache", "route_maps"))
+        self.memory_items = memory_items if memory_items is not None else int(os.getenv("ROUTE_MAP_CACHE_ITEMS", 64))
+        self.disk_max_bytes = (disk_max_mb or int(os.getenv("ROUTE_MAP_CACHE_MB", 200))) * 1024 * 1024
+        self._memory: "OrderedDict[str, bytes]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._disk_bytes: Optional[int] = None  # Computed lazily on first disk write
+        self.hits = {'memory': 0, 'disk': 0, 'miss': 0}
+
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+        except OSError as e:
+            self.logger.warning(f"Route map disk cache disabled ({self.directory}): {e}")
+            self.directory = None
+
+    @staticmethod
+    def make_key(dep: str, arr: str, style_version: int) -> str:
+        return hashlib.sha1(f"{dep.upper()}|{arr.upper()}|v{style_version}".encode('utf-8')).hexdigest()
+
+    @staticmethod
+    def make_set_key(routes, style_version: int) -> str:
+        """Key for an overview map of several routes, independent of their order."""
+        legs = ";".join(sorted({f"{dep.upper()}-{arr.upper()}" for dep, arr in routes}))
+        return hashlib.sha1(f"set|{legs}|v{style_version}".encode('utf-8')).hexdigest()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.png")
+
+    # =========================================================================
+    # MEMORY TIER
+    # =========================================================================
+
+    def get_memory(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            data = self._memory.get(key)
+            if data is not None:
+                self._memory.move_to_end(key)
+                self.hits['memory'] += 1
+            return data
+
+    def _remember(self, key: str, data: bytes):
+        with self._lock:
+            self._memory[key] = data
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.memory_items:
+                self._memory.popitem(last=False)
+
+    # =========================================================================
+    # BOTH TIERS
+    # =========================================================================
+
+    def get(self, key: str) -> Optional[bytes]:
+        """Memory first, then disk (promoting the image into memory)."""
+        data = self.get_memory(key)
+        if data is not None:
+            return data
+        if not self.directory:
+            self.hits['miss'] += 1
+            return None
+
+        path = self._path(key)
+        try:
+            with open(path, 'rb') as f:
+                data = f.read()
+            os.utime(path)  # Mark as recently used for eviction
+        except FileNotFoundError:
+            self.hits['miss'] += 1
+            return None
+        except OSError as e:
+            self.logger.warning(f"Could not read cached route map {path}: {e}")
+            self.hits['miss'] += 1
+            return None
+
+        self.hits['disk'] += 1
+        self._remember(key, data)
+        return data
+
+    def contains(self, key: str) -> bool:
+        with self._lock:
+            if key in self._memory:
+                return True
+        return bool(self.directory) and os.path.exists(self._path(key))
+
+    def put(self, key: str, data: bytes, remember: bool = True):
+        """Store an image; remember=False writes to disk only (background warm-up)."""
+        if remember:
+            self._remember(key, data)
+        if not self.directory:
+            return
+
+        path = self._path(key)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            with open(tmp_path, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_path, path)  # Atomic, so readers never see a partial PNG
+        except OSError as e:
+            self.logger.warning(f"Could not write cached route map {path}: {e}")
+            return
+
+        with self._lock:
+            if self._disk_bytes is None:
+                self._disk_bytes = self._scan_size()
+            else:
+                self._disk_bytes += len(data)
+            if self._disk_bytes > self.disk_max_bytes:
+                self._evict()
+
+    def _scan_size(self) -> int:
+        total = 0
+        for entry in os.scandir(self.directory):
+            if entry.name.endswith('.png'):
+                total += entry.stat().st_size
+        return total
+
+    def _evict(self):
+        """Delete least recently used files until the directory is back under 90% of the limit."""
+        entries = sorted(
+            (e for e in os.scandir(self.directory) if e.name.endswith('.png')),
+            key=lambda e: e.stat().st_mtime
+        )
+        total = sum(e.stat().st_size for e in entries)
+        target = self.disk_max_bytes * 0.9
+        removed = 0
+        for entry in entries:
+            if total <= target:
+                break
+            try:
+                size = entry.stat().st_size
+                os.remove(entry.path)
+                total -= size
+                removed += 1
+            except OSError:
+                continue
+        self._disk_bytes = total
+        if removed:
+            self.logger.info(f"Evicted {removed} route maps from disk cache ({total / 1024 / 1024:.1f} MB left)")
@@ -1,39 +1,47 @@
 import io
+import os
 import asyncio
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 import airportsdata
-import matplotlib.pyplot as plt
-import cartopy.crs as ccrs
-import cartopy.feature as cfeature
 from matplotlib.figure import Figure
 from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.markers import MarkerStyle
 import pyproj
 import numpy as np
 import logging
+from services.route_map_cache import RouteMapCache
+from services.route_basemap import BasemapTiles, MAX_LAT, OCEAN_COLOR, lonlat_to_pixels, zoom_for_span
+
+
+class RouteMapRenderer:
+    """
+    Draws route maps over the pre-rendered basemap tiles: one route per map, or
+    an overview of many legs (render_overview). Only the route lines, arrows,
+    dots and labels are drawn per request; cartopy is used only to draw
+    a basemap tile that is not cached yet. One instance per render process (or
+    in-process when the pool is disabled).
+    """
+
+    OUT_WIDTH, OUT_HEIGHT, DPI = 900, 450, 90
 
-class RouteMapService:
     def __init__(self):
         self.airports = airportsdata.load('ICAO')
         self.geod = pyproj.Geod(ellps='WGS84')
-        
-        # --- MAX PERFORMANCE CONFIGURATION ---
-        # 1. Loading '110m' resolution (Lowest detail, fastest render)
-        # 2. Pre-loading features in __init__ to save CPU per request
-        self.land_low = cfeature.NaturalEarthFeature(
-            'physical', 'land', '110m', facecolor='#202225')
-            
-        self.borders_low = cfeature.NaturalEarthFeature(
-            'cultural', 'admin_0_boundary_lines_land', '110m',
-            edgecolor='gray', linewidth=0.5, alpha=0.5, facecolor='none')
-            
-        self.coast_low = cfeature.NaturalEarthFeature(
-            'physical', 'coastline', '110m',
-            edgecolor='#dcdcdc', linewidth=0.9, facecolor='none')
+        self.basemap = BasemapTiles()
 
-    def _generate_image_sync(self, dep_icao: str, arr_icao: str, duration: int = 0):
-        # 1. Setup
-        dep_icao = dep_icao.upper()
-        arr_icao = arr_icao.upper()
-        
+    def preload(self):
+        self.basemap.preload()
+
+    def prerender_basemap(self, zoom: int) -> None:
+        self.basemap.prerender(zoom, min_zoom=zoom)
+
+    def render(self, dep_icao: str, arr_icao: str) -> bytes:
+        return self._generate_image_sync(dep_icao, arr_icao).getvalue()
+
+    def route_points(self, dep_icao: str, arr_icao: str):
+        """Great-circle points between two airports, longitudes unwrapped across the dateline."""
         if dep_icao not in self.airports or arr_icao not in self.airports:
             raise ValueError(f"Invalid Airport Code: {dep_icao} or {arr_icao}")
 
@@ -62,128 +70,368 @@ class RouteMapService:
         # Combine points & Unwrap (Dateline Fix)
         lons = np.array([dep_data['lon']] + list(route_lons) + [arr_data['lon']])
         lats = np.array([dep_data['lat']] + list(route_lats) + [arr_data['lat']])
+        return np.degrees(np.unwrap(np.radians(lons))), lats
 
-        lons_rad = np.radians(lons)
-        lons_unwrapped = np.degrees(np.unwrap(lons_rad))
-
-        # Calculate Bounding Box
-        min_lon, max_lon = np.min(lons_unwrapped), np.max(lons_unwrapped)
+    def _frame(self, lons, lats):
+        """Zoom level and 2:1 world-pixel box around the route, padded like the old cartopy extent."""
+        min_lon, max_lon = np.min(lons), np.max(lons)
         min_lat, max_lat = np.min(lats), np.max(lats)
+        pad_x = np.clip((max_lon - min_lon) * 0.15, 0.5, 15.0)
+        pad_y = np.clip((max_lat - min_lat) * 0.15, 0.5, 15.0)
+        min_lon, max_lon = min_lon - pad_x, max_lon + pad_x
+        min_lat, max_lat = max(min_lat - pad_y, -MAX_LAT), min(max_lat + pad_y, MAX_LAT)
 
-        # Padding & Aspect Ratio
-        width = max_lon - min_lon
-        height = max_lat - min_lat
-        
-        pad_x = np.clip(width * 0.15, 0.5, 15.0)
-        pad_y = np.clip(height * 0.15, 0.5, 15.0)
-
-        min_lon -= pad_x
-        max_lon += pad_x
-        min_lat -= pad_y
-        max_lat += pad_y
-
-        # Recalculate dimensions for Ratio enforcement
-        width = max_lon - min_lon
-        height = max_lat - min_lat
-        target_aspect = 2.0
-        current_aspect = width / height
-
-        if current_aspect > target_aspect:
-            # Too Wide -> Increase Height
-            target_height = width / target_aspect
-            diff = target_height - height
-            min_lat -= diff / 2
-            max_lat += diff / 2
+        zoom = zoom_for_span(max(max_lon - min_lon, (max_lat - min_lat) * 2), self.OUT_WIDTH)
+        (x0, x1), (y1, y0) = lonlat_to_pixels([min_lon, max_lon], [min_lat, max_lat], zoom)
+
+        # Widen the short side so the box matches the 2:1 output
+        width, height = x1 - x0, y1 - y0
+        target_aspect = self.OUT_WIDTH / self.OUT_HEIGHT
+        if width / height > target_aspect:
+            grow = (width / target_aspect - height) / 2
+            y0, y1 = y0 - grow, y1 + grow
         else:
-            # Too Tall -> Increase Width
-            target_width = height * target_aspect
-            diff = target_width - width
-            min_lon -= diff / 2
-            max_lon += diff / 2
-
-        # --- OPTIMIZATION: Low DPI ---
-        # dpi=90 for better quality while maintaining performance
-        fig = Figure(figsize=(10, 5), dpi=90, facecolor='#2f3136')
-        canvas = FigureCanvasAgg(fig)
+            grow = (height * target_aspect - width) / 2
+            x0, x1 = x0 - grow, x1 + grow
+        return zoom, x0, y0, x1, y1
 
-        # Map Projection
-        mid_lon_raw = (min_lon + max_lon) / 2
-        mid_lon_clamped = (mid_lon_raw + 180) % 360 - 180
-        projection = ccrs.Mercator(central_longitude=mid_lon_clamped)
-        
-        ax = fig.add_subplot(1, 1, 1, projection=projection)
-        ax.set_extent([min_lon, max_lon, min_lat, max_lat], crs=ccrs.PlateCarree())
+    def _generate_image_sync(self, dep_icao: str, arr_icao: str, duration: int = 0):
+        dep_icao = dep_icao.upper()
+        arr_icao = arr_icao.upper()
+        lons, lats = self.route_points(dep_icao, arr_icao)
+        zoom, x0, y0, x1, y1 = self._frame(lons, lats)
+        xs, ys = lonlat_to_pixels(lons, lats, zoom)
+        background = self.basemap.crop(zoom, x0, y0, x1, y1)
 
-        # Drawing
-        ax.set_facecolor='#2f3136' # Ocean Hack (No polygon drawing)
-        ax.add_feature(self.land_low)
-        ax.add_feature(self.borders_low)
-        ax.add_feature(self.coast_low)
+        fig = Figure(figsize=(self.OUT_WIDTH / self.DPI, self.OUT_HEIGHT / self.DPI), dpi=self.DPI, facecolor=OCEAN_COLOR)
+        canvas = FigureCanvasAgg(fig)
+        ax = fig.add_axes([0, 0, 1, 1])
+        # World-pixel coordinates, y growing downwards like the tiles
+        ax.imshow(background, extent=(np.floor(x0), np.ceil(x1), np.ceil(y1), np.floor(y0)), interpolation='antialiased')
+        ax.set_xlim(x0, x1)
+        ax.set_ylim(y1, y0)
+        ax.set_aspect('auto')
+        ax.axis('off')
 
         # Plot Route
-        ax.plot(lons_unwrapped, lats, color='#800020', linewidth=2.5, transform=ccrs.PlateCarree())
+        ax.plot(xs, ys, color='#800020', linewidth=2.5)
 
         # --- ARROW LOGIC (Fixed Size Icon) ---
-        from matplotlib.markers import MarkerStyle
-
-        # 1. Find the middle of the route
-        mid_idx = len(lons_unwrapped) // 2
-        mid_lon = lons_unwrapped[mid_idx]
-        mid_lat = lats[mid_idx]
-
-        # 2. Calculate the Angle (Direction)
-        # We look at the next point in the list to see where the plane is going
-        d_lon = lons_unwrapped[mid_idx + 1] - lons_unwrapped[mid_idx]
-        d_lat = lats[mid_idx + 1] - lats[mid_idx]
-        
-        # Math to find the angle (in degrees)
-        angle = np.degrees(np.arctan2(d_lat, d_lon))
-
-        # 3. Create a Rotated Marker
-        # We use the '>' shape (which points East by default)
-        # and rotate it by our calculated flight angle.
+        # Arrow at the middle of the route, rotated to the direction of travel.
+        # Screen y points up while pixel y points down, hence the minus.
+        mid_idx = len(xs) // 2
+        angle = np.degrees(np.arctan2(-(ys[mid_idx + 1] - ys[mid_idx]), xs[mid_idx + 1] - xs[mid_idx]))
         marker_style = MarkerStyle(marker='>', fillstyle='full')
         marker_style._transform = marker_style.get_transform().rotate_deg(angle)
-
-        # 4. Plot the Arrow
-        # markersize=14 : Fixes the size (it won't get huge on long flights)
-        # color='#E0E0E0' : Qatar Airways Silver
-        # zorder=10 : Ensures it sits ON TOP of the red line
-        ax.plot(mid_lon, mid_lat, 
-                marker=marker_style, 
-                color='#E0E0E0',           # Silver fill
+        ax.plot(xs[mid_idx], ys[mid_idx],
+                marker=marker_style,
+                color='#E0E0E0',           # Qatar Airways Silver
                 markeredgecolor='black',   # Thin black outline for contrast
                 markeredgewidth=1,
                 markersize=20,             # Fixed size (pixels)
-                transform=ccrs.PlateCarree(), 
                 zorder=10)
 
         # Dots
-        ax.plot(lons_unwrapped[0], lats[0], color='white', marker='o', markersize=6, transform=ccrs.PlateCarree())
-        ax.plot(lons_unwrapped[-1], lats[-1], color='white', marker='o', markersize=6, transform=ccrs.PlateCarree())
+        ax.plot(xs[0], ys[0], color='white', marker='o', markersize=6)
+        ax.plot(xs[-1], ys[-1], color='white', marker='o', markersize=6)
 
         # Labels
-        lat_span = max_lat - min_lat
-        label_offset = lat_span * 0.04 if lat_span > 2 else lat_span * 0.08
-        
-        ax.text(lons_unwrapped[0], lats[0] - label_offset, dep_icao, color='white', 
-                ha='center', va='top', transform=ccrs.PlateCarree(), fontweight='bold', fontsize=11)
-        ax.text(lons_unwrapped[-1], lats[-1] - label_offset, arr_icao, color='white', 
-                ha='center', va='top', transform=ccrs.PlateCarree(), fontweight='bold', fontsize=11)
-
-        ax.axis('off')
-        fig.subplots_adjust(left=0, right=1, top=1, bottom=0)
+        label_offset = (y1 - y0) * 0.03
+        ax.text(xs[0], ys[0] + label_offset, dep_icao, color='white',
+                ha='center', va='top', fontweight='bold', fontsize=11)
+        ax.text(xs[-1], ys[-1] + label_offset, arr_icao, color='white',
+                ha='center', va='top', fontweight='bold', fontsize=11)
 
         buf = io.BytesIO()
         canvas.print_png(buf)
         buf.seek(0)
-        plt.close(fig) # Clear memory immediately
-        
         return buf
 
+    # =========================================================================
+    # OVERVIEW MAPS
+    # =========================================================================
+
+    OVERVIEW_POINTS = 60
+    OVERVIEW_MAX_ARROWS = 12  # Above this many legs the arrows just add clutter
+    OVERVIEW_MAX_LABELS = 40
+
+    def overview_points(self, routes):
+        """
+        Great-circle points for many routes at once. All azimuths and distances
+        come from one Geod.inv call and every intermediate point from one
+        Geod.fwd call. Routes with unknown airports are skipped.
+
+        Returns (kept routes, lons, lats) with lons/lats shaped (legs, points).
+        """
+        kept = [(dep, arr) for dep, arr in routes
+                if dep != arr and dep in self.airports and arr in self.airports]
+        if not kept:
+            raise ValueError("No valid routes to draw")
+
+        lon1 = np.array([self.airports[dep]['lon'] for dep, _ in kept], dtype=float)
+        lat1 = np.array([self.airports[dep]['lat'] for dep, _ in kept], dtype=float)
+        lon2 = np.array([self.airports[arr]['lon'] for _, arr in kept], dtype=float)
+        lat2 = np.array([self.airports[arr]['lat'] for _, arr in kept], dtype=float)
+        azimuths, _, distances = self.geod.inv(lon1, lat1, lon2, lat2)
+
+        legs, points = len(kept), self.OVERVIEW_POINTS
+        fractions = np.linspace(0.0, 1.0, points)
+        lons, lats, _ = self.geod.fwd(
+            np.repeat(lon1, points), np.repeat(lat1, points), np.repeat(np.asarray(azimuths), points),
+            (np.asarray(distances)[:, None] * fractions).ravel()
+        )
+        lons = np.degrees(np.unwrap(np.radians(np.asarray(lons).reshape(legs, points)), axis=1))
+        lats = np.asarray(lats).reshape(legs, points)
+        lats[:, -1] = lat2  # Snap the ends onto the airports
+
+        # Put every leg in the same 360° window, cut at the widest empty gap
+        # between legs so a set crossing the dateline stays in one piece.
+        mids = np.sort(np.mod(lons.mean(axis=1), 360.0))
+        gaps = np.diff(np.append(mids, mids[0] + 360.0))
+        start = mids[(np.argmax(gaps) + 1) % legs]
+        lons -= 360.0 * np.floor((lons.mean(axis=1) - start) / 360.0)[:, None]
+        return kept, lons, lats
+
+    def render_overview(self, routes) -> bytes:
+        """One map with every (departure, arrival) leg, framed to fit them all."""
+        routes = [(dep.upper(), arr.upper()) for dep, arr in routes]
+        kept, lons, lats = self.overview_points(routes)
+        zoom, x0, y0, x1, y1 = self._frame(lons.ravel(), lats.ravel())
+        xs, ys = lonlat_to_pixels(lons, lats, zoom)
+        background = self.basemap.crop(zoom, x0, y0, x1, y1)
+
+        fig = Figure(figsize=(self.OUT_WIDTH / self.DPI, self.OUT_HEIGHT / self.DPI), dpi=self.DPI, facecolor=OCEAN_COLOR)
+        canvas = FigureCanvasAgg(fig)
+        ax = fig.add_axes([0, 0, 1, 1])
+        ax.imshow(background, extent=(np.floor(x0), np.ceil(x1), np.ceil(y1), np.floor(y0)), interpolation='antialiased')
+        ax.set_xlim(x0, x1)
+        ax.set_ylim(y1, y0)
+        ax.set_aspect('auto')
+        ax.axis('off')
+
+        # All legs in one call: columns of the transposed arrays are the lines
+        ax.plot(xs.T, ys.T, color='#800020', linewidth=2.0 if len(kept) <= self.OVERVIEW_MAX_ARROWS else 1.5)
+
+        if len(kept) <= self.OVERVIEW_MAX_ARROWS:
+            mid_idx = xs.shape[1] // 2
+            angles = np.degrees(np.arctan2(-(ys[:, mid_idx + 1] - ys[:, mid_idx]), xs[:, mid_idx + 1] - xs[:, mid_idx]))
+            for x, y, angle in zip(xs[:, mid_idx], ys[:, mid_idx], angles):
+                marker_style = MarkerStyle(marker='>', fillstyle='full')
+                marker_style._transform = marker_style.get_transform().rotate_deg(angle)
+                ax.plot(x, y, marker=marker_style, color='#E0E0E0', markeredgecolor='black',
+                        markeredgewidth=1, markersize=14, zorder=10)
+
+        # One dot and label per airport, however many legs touch it
+        airports = {}
+        for i, (dep, arr) in enumerate(kept):
+            airports.setdefault(dep, (xs[i, 0], ys[i, 0]))
+            airports.setdefault(arr, (xs[i, -1], ys[i, -1]))
+        points = np.array(list(airports.values()))
+        ax.plot(points[:, 0], points[:, 1], linestyle='none', color='white', marker='o', markersize=5, zorder=11)
+
+        if len(airports) <= self.OVERVIEW_MAX_LABELS:
+            label_offset = (y1 - y0) * 0.025
+            for icao, (x, y) in airports.items():
+                ax.text(x, y + label_offset, icao, color='white',
+                        ha='center', va='top', fontweight='bold', fontsize=9, zorder=12)
+
+        buf = io.BytesIO()
+        canvas.print_png(buf)
+        return buf.getvalue()
+
+
+# ==============================================================================
+# RENDER PROCESS POOL
+# ==============================================================================
+
+_worker_renderer = None
+
+
+def _init_render_worker():
+    """Process pool initializer: load airports and basemap features once per worker."""
+    global _worker_renderer
+    _worker_renderer = RouteMapRenderer()
+    _worker_renderer.preload()
+
+
+def _render_in_worker(dep_icao: str, arr_icao: str) -> bytes:
+    return _worker_renderer.render(dep_icao, arr_icao)
+
+
+def _render_overview_in_worker(routes) -> bytes:
+    return _worker_renderer.render_overview(routes)
+
+
+def _prerender_basemap_in_worker(zoom: int) -> None:
+    _worker_renderer.prerender_basemap(zoom)
+
+
+class RouteMapBusyError(RuntimeError):
+    """Raised when too many renders are already queued."""
+
+
+class RouteMapService:
+    """
+    Async front end for route maps: cache lookup, then a render in a process pool.
+
+    matplotlib/cartopy rendering holds the GIL, so it runs in separate processes
+    (ROUTE_MAP_WORKERS, default cores - 1, up to 4) rather than threads. Each
+    worker loads the airport database and map features once in its initializer.
+    At most ROUTE_MAP_MAX_QUEUE renders may be pending; beyond that, and after
+    ROUTE_MAP_TIMEOUT seconds, callers get an error instead of waiting. Set
+    ROUTE_MAP_WORKERS=0 to render in a thread in this process instead.
+    """
+
+    # Bump whenever the drawing changes so cached maps are re-rendered
+    STYLE_VERSION = 2
+
+    def __init__(self):
+        self.logger = logging.getLogger('oryxie.route_map_service')
+        self.map_cache = RouteMapCache()
+        self._inflight = {}
+
+        self.workers = int(os.getenv("ROUTE_MAP_WORKERS", max(1, min(4, (os.cpu_count() or 2) - 1))))
+        self.max_queue = int(os.getenv("ROUTE_MAP_MAX_QUEUE", max(4, self.workers * 4)))
+        self.timeout = float(os.getenv("ROUTE_MAP_TIMEOUT", 30))
+        self._executor = None
+        self._local_renderer = None
+        self._pending = 0
+        self.interactive_pending = 0  # create_route_map calls waiting on a render
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            # spawn, not fork: the bot process has an event loop, sockets and threads
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=multiprocessing.get_context('spawn'),
+                initializer=_init_render_worker
+            )
+            self.logger.info(f"Started route map render pool with {self.workers} workers")
+        return self._executor
+
+    def close(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    async def _render(self, worker_func, method: str, *args) -> bytes:
+        """Run worker_func(*args) in the pool, or RouteMapRenderer.<method>(*args) in a thread."""
+        if self._pending >= self.max_queue:
+            raise RouteMapBusyError(f"{self._pending} route maps already queued")
+
+        self._pending += 1
+        executor = None
+        try:
+            if self.workers <= 0:
+                if self._local_renderer is None:
+                    self._local_renderer = await asyncio.to_thread(RouteMapRenderer)
+                job = asyncio.ensure_future(asyncio.to_thread(getattr(self._local_renderer, method), *args))
+            else:
+                loop = asyncio.get_running_loop()
+                executor = self._get_executor()
+                job = loop.run_in_executor(executor, worker_func, *args)
+        except BaseException:
+            self._pending -= 1
+            raise
+
+        # A timed-out render keeps its worker until it finishes, so it stays pending until then
+        job.add_done_callback(lambda done: self._render_finished(done, executor))
+        return await asyncio.wait_for(asyncio.shield(job), timeout=self.timeout)
+
+    def _render_finished(self, job: asyncio.Future, executor):
+        self._pending -= 1
+        if job.cancelled():
+            return
+        # Checked here rather than in _render so a pool that dies after the caller timed out is still replaced
+        if isinstance(job.exception(), BrokenProcessPool) and executor is self._executor:
+            self.logger.error("Route map render pool died; it will be restarted on the next render")
+            self._executor = None
+
+    async def _load_or_render(self, key: str, render, remember: bool = True) -> bytes:
+        data = await asyncio.to_thread(self.map_cache.get, key)
+        if data is None:
+            data = await render()
+            await asyncio.to_thread(self.map_cache.put, key, data, remember)
+        return data
+
+    def _route_job(self, dep: str, arr: str):
+        return lambda: self._render(_render_in_worker, 'render', dep, arr)
+
+    def _shared_render(self, key: str, render, remember: bool = True) -> asyncio.Future:
+        """
+        Callers asking for the same map at the same time share one render.
+        render is a no-argument coroutine function that produces the PNG bytes.
+        """
+        future = self._inflight.get(key)
+        if future is None:
+            future = asyncio.ensure_future(self._load_or_render(key, render, remember))
+            self._inflight[key] = future
+            future.add_done_callback(lambda _: self._inflight.pop(key, None))
+        return future
+
+    def is_cached(self, dep: str, arr: str) -> bool:
+        return self.map_cache.contains(RouteMapCache.make_key(dep, arr, self.STYLE_VERSION))
+
+    async def prerender(self, dep: str, arr: str) -> bool:
+        """
+        Render a map into the disk cache ahead of time (see RouteMapWarmer).
+        Returns False if it was already cached. Errors are raised.
+        """
+        dep, arr = dep.upper(), arr.upper()
+        key = RouteMapCache.make_key(dep, arr, self.STYLE_VERSION)
+        if await asyncio.to_thread(self.map_cache.contains, key):
+            return False
+        await asyncio.shield(self._shared_render(key, self._route_job(dep, arr), remember=False))
+        return True
+
+    async def prerender_basemap(self, max_zoom: int = 3):
+        """
+        Draw the world-scale basemap tiles into the shared tile cache (see
+        RouteMapWarmer), one zoom level per job so no single job runs into
+        ROUTE_MAP_TIMEOUT. Tiles already on disk are only read back.
+        """
+        for zoom in range(max_zoom + 1):
+            await self._render(_prerender_basemap_in_worker, 'prerender_basemap', zoom)
+
+    async def _interactive(self, key: str, render) -> bytes:
+        data = self.map_cache.get_memory(key)
+        if data is None:
+            self.interactive_pending += 1
+            try:
+                data = await asyncio.shield(self._shared_render(key, render))
+            finally:
+                self.interactive_pending -= 1
+        return data
+
     async def create_route_map(self, dep: str, arr: str, duration: int = 0):
+        dep, arr = dep.upper(), arr.upper()
+        key = RouteMapCache.make_key(dep, arr, self.STYLE_VERSION)
         try:
-            return await asyncio.to_thread(self._generate_image_sync, dep, arr, duration)
+            return io.BytesIO(await self._interactive(key, self._route_job(dep, arr)))
+        except asyncio.TimeoutError:
+            logging.error(f"Map generation timed out for {dep}-{arr} after {self.timeout}s")
+            return "Map Generation Error"
         except Exception as e:
             logging.error(f"Map generation failed for {dep}-{arr}: {e}")
-            return "Map Generation Error"
\ No newline at end of file
+            return "Map Generation Error"
+
+    async def create_overview_map(self, routes):
+        """
+        One map showing many (departure, arrival) legs, e.g. a whole World Tour
+        set. Cached by the set of routes, so order and duplicates don't matter.
+        Returns a BytesIO, or "Map Generation Error" like create_route_map.
+        """
+        route_set = sorted({(str(dep).strip().upper(), str(arr).strip().upper()) for dep, arr in routes if dep and arr})
+        if not route_set:
+            return "Map Generation Error"
+
+        key = RouteMapCache.make_set_key(route_set, self.STYLE_VERSION)
+        try:
+            data = await self._interactive(key, lambda: self._render(_render_overview_in_worker, 'render_overview', route_set))
+            return io.BytesIO(data)
+        except asyncio.TimeoutError:
+            logging.error(f"Overview map for {len(route_set)} routes timed out after {self.timeout}s")
+            return "Map Generation Error"
+        except Exception as e:
+            logging.error(f"Overview map for {len(route_set)} routes failed: {e}")
+            return "Map Generation Error"
@@ -0,0 +1,187 @@
+import asyncio
+import json
+import logging
+import os
+import time
+from collections import OrderedDict
+from typing import Iterable, List, Optional, Tuple
+
+
+class RouteMapWarmer:
+    """
+    Low-priority background job that renders the maps people are about to ask
+    for, so posting a World Tour leg never waits on a cold render.
+
+    Sources, in priority order:
+      - every leg in assets/mission_dispatcher.json (re-read when the file changes)
+      - routes of the most recent flight board posts (from route_map_urls)
+      - poll candidates, queued ahead of the backlog by /create_flight_poll
+      - the most flown routes from approved PIREPs
+
+    On startup the low-zoom basemap tiles are drawn first, so long-haul maps
+    never wait on cartopy. Maps go straight to the disk cache. The job waits
+    while any interactive render is queued and sleeps between renders so it
+    uses at most ROUTE_MAP_WARM_BUDGET (default 0.25) of one render worker's time.
+    """
+
+    MISSIONS_PATH = os.path.join('assets', 'mission_dispatcher.json')
+    CHECK_INTERVAL = 300  # seconds between mission file checks
+    REFRESH_INTERVAL = 6 * 3600  # seconds between full re-collections
+    RECENT_BOARD_FLIGHTS = 20
+    POPULAR_DAYS = 30
+    POPULAR_LIMIT = 50
+
+    def __init__(self, bot):
+        self.bot = bot
+        self.logger = logging.getLogger('oryxie.route_map_warmer')
+        self.budget = min(1.0, max(0.01, float(os.getenv("ROUTE_MAP_WARM_BUDGET", 0.25))))
+        self._queue: "OrderedDict[Tuple[str, str], None]" = OrderedDict()
+        self._wakeup = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+        self._missions_mtime: Optional[float] = None
+        self._last_refresh: Optional[float] = None
+        self.stats = {'rendered': 0, 'cached': 0, 'failed': 0}
+
+    def start(self) -> None:
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    def close(self) -> None:
+        if self._task and not self._task.done():
+            self._task.cancel()
+        self._task = None
+
+    def enqueue(self, routes: Iterable[Tuple[str, str]], front: bool = False) -> None:
+        """Queue (departure, arrival) pairs for warm-up; front=True puts them ahead of the backlog."""
+        keys = [(str(dep).strip().upper(), str(arr).strip().upper()) for dep, arr in routes if dep and arr]
+        for key in (reversed(keys) if front else keys):
+            if key not in self._queue:
+                self._queue[key] = None
+            if front:
+                self._queue.move_to_end(key, last=False)
+        if keys:
+            self._wakeup.set()
+
+    # =========================================================================
+    # LOOP
+    # =========================================================================
+
+    async def _run(self):
+        await self.bot.wait_until_ready()
+        await self._warm_basemap()
+        while True:
+            try:
+                refresh_due = self._last_refresh is None or time.monotonic() - self._last_refresh > self.REFRESH_INTERVAL
+                if self._missions_changed() or refresh_due:
+                    self.enqueue(await self.collect_routes(include_others=refresh_due))
+                    if refresh_due:
+                        self._last_refresh = time.monotonic()
+
+                while self._queue:
+                    (dep, arr), _ = self._queue.popitem(last=False)
+                    await self._warm(dep, arr)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.logger.error(f"Route map warm-up failed: {e}")
+
+            self._wakeup.clear()
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self.CHECK_INTERVAL)
+            except asyncio.TimeoutError:
+                pass
+
+    async def _warm_basemap(self):
+        """Fill the low-zoom basemap tiles once at startup; route maps of any length then start from cached tiles."""
+        service = self.bot.route_map_service
+        while service.interactive_pending:
+            await asyncio.sleep(1)
+        started = time.monotonic()
+        try:
+            await service.prerender_basemap()
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            self.logger.warning(f"Basemap tile warm-up failed: {e!r}")
+            return
+        self.logger.info(f"Basemap tiles warmed in {time.monotonic() - started:.1f}s")
+
+    async def _warm(self, dep: str, arr: str):
+        service = self.bot.route_map_service
+        # Interactive renders always go first
+        while service.interactive_pending:
+            await asyncio.sleep(1)
+
+        started = time.monotonic()
+        try:
+            rendered = await service.prerender(dep, arr)
+        except Exception as e:
+            self.stats['failed'] += 1
+            self.logger.debug(f"Could not pre-render {dep}-{arr}: {e}")
+            return
+
+        if not rendered:
+            self.stats['cached'] += 1
+            return
+        self.stats['rendered'] += 1
+        elapsed = time.monotonic() - started
+        await asyncio.sleep(elapsed * (1 - self.budget) / self.budget)
+
+    # =========================================================================
+    # SOURCES
+    # =========================================================================
+
+    def _missions_changed(self) -> bool:
+        try:
+            mtime = os.path.getmtime(self.MISSIONS_PATH)
+        except OSError:
+            return False
+        changed = mtime != self._missions_mtime
+        self._missions_mtime = mtime
+        return changed
+
+    async def _route_for_flight(self, flight_num: str) -> Optional[Tuple[str, str]]:
+        route = await self.bot.routes_model.find_route_by_fltnum(flight_num)
+        if route and route.get('dep') and route.get('arr'):
+            return route['dep'], route['arr']
+        return None
+
+    async def _mission_routes(self) -> List[Tuple[str, str]]:
+        try:
+            with open(self.MISSIONS_PATH, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            self.logger.warning(f"Could not read mission routes: {e}")
+            return []
+
+        routes, lookups = [], []
+        for set_name, missions in data.items():
+            if set_name.startswith('_') or not isinstance(missions, dict):
+                continue
+            for mission in missions.values():
+                if mission.get('departure') and mission.get('arrival'):
+                    routes.append((mission['departure'], mission['arrival']))
+                elif mission.get('flight_number'):
+                    lookups.append(self._route_for_flight(mission['flight_number']))
+        routes.extend(r for r in await asyncio.gather(*lookups, return_exceptions=True) if isinstance(r, tuple))
+        return routes
+
+    async def _board_routes(self) -> List[Tuple[str, str]]:
+        # Board posts aren't stored in flight_board; route_map_urls gets a row for every map uploaded with one
+        rows = await self.bot.flight_board_model.get_recent_map_routes(self.RECENT_BOARD_FLIGHTS)
+        return [(r['departure'], r['arrival']) for r in rows or []]
+
+    async def _popular_routes(self) -> List[Tuple[str, str]]:
+        rows = await self.bot.pireps_model.get_popular_routes(self.POPULAR_DAYS, self.POPULAR_LIMIT)
+        return [(r['departure'], r['arrival']) for r in rows or []]
+
+    async def collect_routes(self, include_others: bool = True) -> List[Tuple[str, str]]:
+        """Routes to warm, highest priority first. include_others=False returns missions only."""
+        routes = await self._mission_routes()
+        if include_others:
+            for source in (self._board_routes, self._popular_routes):
+                try:
+                    routes.extend(await source())
+                except Exception as e:
+                    self.logger.warning(f"Route map warm-up source {source.__name__} failed: {e}")
+        return routes